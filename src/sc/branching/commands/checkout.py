@@ -23,6 +23,7 @@ from .command import Command
 from . import common
 from git_flow_library import GitFlowLibrary
 from repo_library import RepoLibrary
+from sc.sparse_checkout import SparseProfiles
 from sc_manifest_parser import ScManifest
 
 logger = logging.getLogger(__name__)
@@ -65,8 +66,9 @@ class Checkout(Command):
             no_prune=True,
             no_manifest_update=True
         )
+        SparseProfiles.load(self.top_dir).apply(self.top_dir)
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
-        for project in manifest.projects:
+        for project in common.checked_out_projects(self.top_dir, manifest):
             logger.info(f"Operating on {self.top_dir/project.path}")
             if project.lock_status is not None:
                 continue
@@ -15,6 +15,7 @@
 import subprocess
 
 from .command import Command
+from . import common
 from sc_manifest_parser import ScManifest
 
 class Clean(Command):
@@ -32,7 +33,7 @@ class Clean(Command):
     def run_repo_command(self):
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
         manifest_dir = self.top_dir / '.repo' / 'manifests'
-        for project in manifest.projects:
+        for project in common.checked_out_projects(self.top_dir, manifest):
             if project.lock_status is not None:
                 continue
             self._clean_repo(self.top_dir)
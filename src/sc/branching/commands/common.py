@@ -11,7 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import logging
 from pathlib import Path
+import subprocess
 
 import git
 from git import Repo
@@ -19,6 +21,8 @@ from sc_manifest_parser import ProjectElementInterface, ScManifest
 
 from ..branch import Branch, BranchType
 
+logger = logging.getLogger(__name__)
+
 def get_alt_branch_name(branch: Branch, project: ProjectElementInterface) -> str | None:
     match branch.type:
         case BranchType.MASTER:
@@ -31,10 +35,38 @@ def get_alt_branch_name(branch: Branch, project: ProjectElementInterface) -> str
 def resolve_project_branch_name(branch: Branch, project: ProjectElementInterface) -> str:
     return get_alt_branch_name(branch, project) or branch.name
 
+def checked_out_projects(
+        top_dir: Path,
+        manifest: ScManifest
+    ) -> list[ProjectElementInterface]:
+    """The projects of a manifest that are checked out in the workspace.
+
+    Workspaces cloned with groups only have some of their manifest's projects.
+    They're the projects in the workspace's group selection, whether or not their
+    directories exist, so a project that should be there but is missing is still
+    reported by the commands that use it.
+    """
+    try:
+        result = subprocess.run(
+            # --all includes selected projects that are missing from disk.
+            ["repo", "list", "--all", "--path-only"],
+            cwd=top_dir,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        logger.warning(f"Couldn't list the workspace's projects, using all of them: {e}")
+        return list(manifest.projects)
+
+    selected = {Path(line.strip()) for line in result.stdout.splitlines() if line.strip()}
+    return [proj for proj in manifest.projects if Path(proj.path) in selected]
+
 def validate_project_repos(top_dir: Path, manifest: ScManifest):
-    """Raise runtime error if any project repos in a manifest are invalid."""
+    """Raise runtime error if any checked out project repos in a manifest are invalid."""
     errors = []
-    for proj in manifest.projects:
+    for proj in checked_out_projects(top_dir, manifest):
         proj_path = top_dir / proj.path
         try:
             Repo(proj_path)
@@ -49,7 +81,7 @@ def validate_project_repos(top_dir: Path, manifest: ScManifest):
 def require_clean_working_tree(top_dir: Path, manifest: ScManifest):
     """Error if a project or the manifest has a dirty working tree."""
     validate_project_repos(top_dir, manifest)
-    paths = [top_dir / p.path for p in manifest.projects]
+    paths = [top_dir / p.path for p in checked_out_projects(top_dir, manifest)]
     paths.append(top_dir / '.repo' / 'manifests')
 
     errors = []
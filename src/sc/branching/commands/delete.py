@@ -21,6 +21,7 @@ from sc_manifest_parser import ScManifest
 
 from ..branch import Branch
 from .command import Command
+from . import common
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +41,7 @@ class Delete(Command):
             logger.info(f"Removing Local Branch {self.branch.name}")
         
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             if proj.lock_status is None:
                 self._delete_branch(self.top_dir / proj.path, proj.remote)
         
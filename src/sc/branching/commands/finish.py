@@ -173,7 +173,7 @@ class Finish(Command):
             base (str | None): Sets the base for each project if provided.
         """
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             proj_dir = self.top_dir / proj.path
             logger.info(f"Operating on {proj_dir}")
             proj_repo = Repo(proj_dir)
@@ -269,7 +269,7 @@ class Finish(Command):
     def _rebase_develop(self):
         Repo(self.top_dir / '.repo' / 'manifests').git.switch('develop')
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             if proj.lock_status is None:
                 develop = GitFlowLibrary.get_develop_branch(self.top_dir / proj.path)
                 self._rebase_proj(self.top_dir / proj.path, develop)
@@ -280,7 +280,7 @@ class Finish(Command):
     def _rebase_master(self):
         Repo(self.top_dir / '.repo' / 'manifests').git.switch('master')
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             if proj.lock_status is None:
                 master = GitFlowLibrary.get_master_branch(self.top_dir / proj.path)
                 self._rebase_proj(self.top_dir / proj.path, master)
@@ -291,7 +291,7 @@ class Finish(Command):
     def _rebase_base(self, base: str | None):
         Repo(self.top_dir / '.repo' / 'manifests').git.switch(base)
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             if proj.lock_status is None:
                 self._rebase_proj(self.top_dir / proj.path, base)
 
@@ -311,7 +311,7 @@ class Finish(Command):
             sys.exit(1)
 
     def _update_manifest(self, manifest: ScManifest):
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             if proj.lock_status is None:
                 proj_repo = Repo(self.top_dir / proj.path)
                 proj.revision = proj_repo.head.commit.hexsha
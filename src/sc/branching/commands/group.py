@@ -23,6 +23,7 @@ from git import Repo
 from sc_manifest_parser import ProjectElementInterface, ScManifest
 
 from .command import Command
+from . import common
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +44,7 @@ class GroupShow(Command):
     def _show_group_info(self):
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
         group_shown = False
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             if _project_in_group(proj, self.group):
                 group_shown = True
                 self._show_project(proj)
@@ -114,7 +115,7 @@ class GroupTag(Command):
         failures = []
         group_found = False
 
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             if not _project_in_group(proj, self.group):
                 continue
 
@@ -161,7 +162,7 @@ class GroupCheckout(Command):
         group_found = False
 
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             if not _project_in_group(proj, self.group):
                 continue
 
@@ -191,7 +192,7 @@ class GroupCmd(Command):
         group_found = False
 
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             if not _project_in_group(proj, self.group):
                 continue
 
@@ -217,7 +218,7 @@ class GroupPull(Command):
         group_found = False
 
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             if not _project_in_group(proj, self.group):
                 continue
 
@@ -245,7 +246,7 @@ class GroupFetch(Command):
         group_found = False
 
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             if not _project_in_group(proj, self.group):
                 continue
 
@@ -273,7 +274,7 @@ class GroupPush(Command):
         group_found = False
 
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             if not _project_in_group(proj, self.group):
                 continue
 
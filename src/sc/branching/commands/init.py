@@ -23,6 +23,7 @@ from repo_library import RepoLibrary
 from sc_manifest_parser import ProjectElementInterface, ScManifest
 
 from .command import Command
+from . import common
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +37,7 @@ class Init(Command):
         self._init_gitflow_for_manifest()
 
         manifest = ScManifest.from_repo_root(self.top_dir / ".repo")
-        for project in manifest.projects:
+        for project in common.checked_out_projects(self.top_dir, manifest):
             if project.lock_status is None:
                 self._init_gitflow_for_project(project)
 
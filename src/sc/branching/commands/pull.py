@@ -22,6 +22,7 @@ from ..branch import Branch
 from .command import Command
 from . import common
 from repo_library import RepoLibrary
+from sc.sparse_checkout import SparseProfiles
 from sc_manifest_parser import ScManifest
 
 logger = logging.getLogger(__name__)
@@ -52,9 +53,10 @@ class Pull(Command):
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
 
         RepoLibrary.sync(self.top_dir, detach=True)
+        SparseProfiles.load(self.top_dir).apply(self.top_dir)
 
         errors = []
-        for project in manifest.projects:
+        for project in common.checked_out_projects(self.top_dir, manifest):
             if project.lock_status is not None:
                 continue
 
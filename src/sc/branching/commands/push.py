@@ -55,7 +55,7 @@ class Push(Command):
                 logger.error(e)
                 sys.exit(1)
 
-            self._push_projects(manifest.projects)
+            self._push_projects(common.checked_out_projects(self.top_dir, manifest))
             self._update_manifest_revisions(manifest)
             self._push_manifest()
         finally:
@@ -147,7 +147,7 @@ class Push(Command):
                    for line in output.splitlines())
 
     def _update_manifest_revisions(self, manifest: ScManifest):
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             proj_repo = Repo(self.top_dir / proj.path)
             proj.revision = proj_repo.head.commit.hexsha
         manifest.write()
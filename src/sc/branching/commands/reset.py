@@ -16,6 +16,7 @@ from pathlib import Path
 import subprocess
 import logging
 from .command import Command
+from . import common
 from sc_manifest_parser import ScManifest
 
 logger = logging.getLogger(__name__)
@@ -34,7 +35,7 @@ class Reset(Command):
 
     def run_repo_command(self):
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
-        for project in manifest.projects:
+        for project in common.checked_out_projects(self.top_dir, manifest):
             if project.lock_status is not None:
                 continue
 
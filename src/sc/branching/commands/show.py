@@ -20,9 +20,11 @@ import subprocess
 
 import git
 from git import Repo
+from sc.sparse_checkout import sparse_checkout_dirs
 from sc_manifest_parser import ProjectElementInterface, ScManifest
 
 from .command import Command
+from . import common
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +36,7 @@ class ShowBranch(Command):
 
     def run_repo_command(self):
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             self._show_project(proj)
             print()
             logger.info("-" * 100)
@@ -82,6 +84,10 @@ class ShowBranch(Command):
 
         logger.info(f"Remote Status: {remote_status}")
 
+        sparse_dirs = sparse_checkout_dirs(repo_dir)
+        if sparse_dirs is not None:
+            logger.info(f"Sparse Checkout: {' '.join(sparse_dirs) or 'top level only'}")
+
         subprocess.run(
             ["git", "branch", "-vv", "--color=always"],
             cwd=repo_dir,
@@ -96,7 +102,7 @@ class ShowRepoFlowConfig(Command):
 
     def run_repo_command(self):
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             proj_dir = self.top_dir / proj.path
             logger.info(f"Repo Flow Config: {proj_dir}")
             result = subprocess.run(
@@ -122,7 +128,7 @@ class ShowLog(Command):
 
     def run_repo_command(self):
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             logger.info(f"Project: {self.top_dir / proj.path}")
             self._show_log(self.top_dir / proj.path)
             logger.info("-" * 100)
@@ -52,7 +52,7 @@ class Start(Command):
 
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
 
-        for project in manifest.projects:
+        for project in common.checked_out_projects(self.top_dir, manifest):
             if project.lock_status is not None:
                 continue
 
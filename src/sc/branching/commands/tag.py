@@ -39,7 +39,7 @@ class TagShow(Command):
 
     def run_repo_command(self):
         manifest = ScManifest.from_repo_root(self.top_dir / ".repo")
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             logger.info(f"Operating in: {self.top_dir / proj.path}")
             if proj.lock_status:
                 logger.info(f"GIT_LOCK_STATUS: {proj.lock_status}")
@@ -103,7 +103,7 @@ class TagCreate(Command):
             logger.error(e)
             sys.exit(1)
 
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             logger.info(f"Operating on: {self.top_dir / proj.path}")
             if proj.lock_status == "READ_ONLY":
                 logger.info("READ_ONLY, skipping creating tag.")
@@ -118,7 +118,8 @@ class TagCreate(Command):
 
     def _error_if_tag_already_exists(self, manifest: ScManifest):
         existing = [
-            self.top_dir / proj.path for proj in manifest.projects
+            self.top_dir / proj.path
+            for proj in common.checked_out_projects(self.top_dir, manifest)
             if proj.lock_status != "READ_ONLY" # We aren't tagging READ_ONLY anyway
             and self._tag_exists(self.top_dir / proj.path)
         ]
@@ -147,7 +148,7 @@ class TagRm(Command):
 
     def run_repo_command(self):
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             logger.info(f"Operating on: {self.top_dir / proj.path}")
             if proj.lock_status == "READ_ONLY":
                 logger.info("READ_ONLY, skipping removing tag")
@@ -178,7 +179,7 @@ class TagPush(Command):
 
     def run_repo_command(self):
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             logger.info(f"Operating on: {self.top_dir / proj.path}")
             if proj.lock_status == "READ_ONLY":
                 logger.info("READ_ONLY, skipping pushing tags")
@@ -208,7 +209,7 @@ class TagCheck(Command):
 
     def run_repo_command(self):
         manifest = ScManifest.from_repo_root(self.top_dir / '.repo')
-        for proj in manifest.projects:
+        for proj in common.checked_out_projects(self.top_dir, manifest):
             logger.info(f"Operating on: {self.top_dir / proj.path}")
             if proj.lock_status == "READ_ONLY":
                 logger.info("READ_ONLY, skipping checking tags.")
@@ -0,0 +1,40 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+
+import click
+
+from sc.clone.bundle import SCBundle
+
+@click.group()
+def cli():
+    pass
+
+@cli.group()
+def bundle():
+    """Create git bundle sets to seed clones."""
+    pass
+
+@bundle.command()
+@click.argument('output', type=click.Path(path_type=Path))
+@click.option('-w', '--workspace', type=click.Path(exists=True, file_okay=False, path_type=Path),
+              default='.', help='Workspace to bundle. Defaults to the current directory.')
+@click.option('-j', '--jobs', type=int, help='Number of projects to bundle at once.')
+def create(output: Path, workspace: Path, jobs: int | None):
+    """Bundle a workspace's projects and manifest to OUTPUT, a directory or tarball."""
+    SCBundle().create(output, workspace, jobs=jobs)
+
+if __name__ == '__main__':
+    cli()
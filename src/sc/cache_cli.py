@@ -0,0 +1,70 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+
+import click
+
+from sc.clone.cache import SCCache
+from sc.clone.cache.peers import DEFAULT_LISTEN, DEFAULT_PORT
+from sc.clone.cache_warmer import CacheWarmer
+
+@click.group()
+def cli():
+    pass
+
+@cli.group()
+def cache():
+    """Inspect and maintain the clone caches."""
+    pass
+
+@cache.command()
+def status():
+    """Show the size and last use of each cache and mirror."""
+    SCCache().status()
+
+@cache.command()
+@click.option('-s', '--max-size', help='Disk budget e.g. 200G. Defaults to cache.max_size in config.')
+@click.option('-n', '--dry-run', is_flag=True, help='Show what would be evicted.')
+def prune(max_size: str | None, dry_run: bool):
+    """Evict least recently used mirrors to fit the disk budget."""
+    SCCache().prune(max_size=max_size, dry_run=dry_run)
+
+@cache.command()
+@click.option('--host', help='Only maintain the cache for this host.')
+@click.option('-j', '--jobs', type=int, help='Number of mirrors to repack at once.')
+@click.option('--prune', 'prune_first', is_flag=True, help='Prune to the disk budget first.')
+def gc(host: str | None, jobs: int | None, prune_first: bool):
+    """Repack mirrors and write commit graphs."""
+    SCCache().gc(host=host, jobs=jobs, prune=prune_first)
+
+@cache.command()
+@click.argument('projects', nargs=-1)
+@click.option('-j', '--jobs', type=click.IntRange(min=1), help='Total fetch jobs shared by the refreshes. Defaults to the CPU count.')
+@click.option('--max-load', type=float, help="Don't run if the load average is above this. Defaults to the CPU count.")
+@click.option('--log', 'log_path', type=click.Path(dir_okay=False, path_type=Path), help='JSON lines log. Defaults to ~/.caches/.sc_warm.log.')
+def warm(projects: tuple[str, ...], jobs: int | None, max_load: float | None, log_path: Path | None):
+    """Refresh the caches of all configured projects, or of PROJECTS."""
+    CacheWarmer(jobs=jobs, max_load=max_load, log_path=log_path).warm(list(projects) or None)
+
+@cache.command()
+@click.option('-p', '--port', type=click.IntRange(1, 65535), default=DEFAULT_PORT, show_default=True, help='Port to listen on.')
+@click.option('--listen', default=DEFAULT_LISTEN, show_default=True, help='Address to listen on.')
+@click.option('--all-addresses', is_flag=True, help='Listen on every address, exposing the caches to the network without authentication.')
+def serve(port: int, listen: str, all_addresses: bool):
+    """Serve the caches read-only to other machines over git daemon."""
+    SCCache().serve(port=port, listen=None if all_addresses else listen)
+
+if __name__ == '__main__':
+    cli()
@@ -20,7 +20,7 @@ from pathlib import Path
 
 import click
 
-from . import branching_cli, clone_cli, docker_cli, review_cli, project_cli, sc_logging
+from . import branching_cli, bundle_cli, cache_cli, clone_cli, docker_cli, review_cli, project_cli, sc_logging
 from .help import GroupedHelp
 
 CONFIG_DIR = Path(Path.home(), '.sc_config')
@@ -46,6 +46,8 @@ def entry_point():
     add_commands_under_cli(branching_cli.cli, "Branching", 0)
     add_commands_under_cli(project_cli.cli, "Project", 1)
     add_commands_under_cli(clone_cli.cli, "Clone", 2)
+    add_commands_under_cli(cache_cli.cli, "Clone", 2)
+    add_commands_under_cli(bundle_cli.cli, "Clone", 2)
     add_commands_under_cli(docker_cli.cli, "Docker", 3)
     add_commands_under_cli(review_cli.cli, "Review", 4)
 
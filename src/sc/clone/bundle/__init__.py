@@ -0,0 +1,3 @@
+from .bundle import MANIFEST_BUNDLE, SCBundle, bundle_name
+from .exceptions import ScBundleException
+from .seed import SeedReference
@@ -0,0 +1,135 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+import click
+
+logger = logging.getLogger(__name__)
+
+# Projects are bundled as <name>.bundle, no project name can start with .repo
+MANIFEST_BUNDLE = Path(".repo", "manifests.bundle")
+TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz")
+
+def bundle_name(uri: str) -> str:
+    """The name a git project's bundle is stored under, its path on the server.
+
+    Example:
+        bundle_name("git@github.com:rdkcentral/sc.git") -> "rdkcentral/sc"
+    """
+    path = uri.split("://", 1)[-1]
+    if "://" in uri:
+        path = path.split("/", 1)[-1]
+    else:
+        path = path.split(":", 1)[-1]
+    return path.strip("/").removesuffix(".git")
+
+class SCBundle:
+    """An SC module to create git bundle sets that seed clones of a workspace."""
+    def create(self, output: Path, workspace: Path, jobs: int | None = None):
+        """Bundle every project of a workspace and its manifest, in parallel.
+
+        Args:
+            output (Path): Directory to write the bundles to, or a .tar, .tar.gz or
+                .tgz file to write them into.
+            workspace (Path): A repo or git workspace.
+            jobs (int | None): Number of projects to bundle at once. Defaults to the
+                number of CPUs.
+        """
+        workspace = Path(workspace).resolve()
+        bundles = self._get_bundle_sources(workspace)
+
+        if str(output).endswith(TAR_SUFFIXES):
+            with tempfile.TemporaryDirectory(dir=Path(output).resolve().parent) as tmp_dir:
+                created = self._create_bundles(bundles, Path(tmp_dir), jobs)
+                self._write_tar(Path(tmp_dir), Path(output))
+        else:
+            created = self._create_bundles(bundles, Path(output), jobs)
+
+        click.secho(f"Created {created} bundles in {output}", fg="green")
+
+    def _get_bundle_sources(self, workspace: Path) -> dict[Path, Path]:
+        """Map each bundle to create to the git repository it's created from."""
+        if (workspace / ".repo").is_dir():
+            result = subprocess.run(
+                ["repo", "list"],
+                cwd=workspace,
+                capture_output=True,
+                text=True,
+                check=False
+            )
+            if result.returncode != 0:
+                logger.error(f"repo list failed in {workspace}: {result.stderr.strip()}")
+                sys.exit(1)
+
+            manifests_git = workspace / ".repo" / "manifests.git"
+            if not manifests_git.is_dir():
+                manifests_git = workspace / ".repo" / "manifests"
+            bundles = {MANIFEST_BUNDLE: manifests_git}
+            for line in result.stdout.splitlines():
+                path, _, name = line.partition(" : ")
+                if name:
+                    bundles[Path(f"{name.strip()}.bundle")] = workspace / path.strip()
+            return bundles
+
+        if (workspace / ".git").exists():
+            result = subprocess.run(
+                ["git", "-C", str(workspace), "remote", "get-url", "origin"],
+                capture_output=True,
+                text=True,
+                check=False
+            )
+            if result.returncode != 0:
+                logger.error(f"{workspace} has no origin remote to name its bundle by.")
+                sys.exit(1)
+            return {Path(f"{bundle_name(result.stdout.strip())}.bundle"): workspace}
+
+        logger.error(f"{workspace} is not a repo or git workspace.")
+        sys.exit(1)
+
+    def _create_bundles(self, bundles: dict[Path, Path], output: Path, jobs: int | None) -> int:
+        with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+            results = pool.map(
+                lambda item: self._create_bundle(output / item[0], item[1]),
+                bundles.items()
+            )
+            return sum(results)
+
+    def _create_bundle(self, bundle_path: Path, source: Path) -> bool:
+        bundle_path.parent.mkdir(parents=True, exist_ok=True)
+        logger.info(f"Bundling {source}")
+        result = subprocess.run(
+            ["git", "-C", str(source), "bundle", "create", "-q", str(bundle_path), "--all"],
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        if result.returncode != 0:
+            logger.warning(f"Failed to bundle {source}: {result.stderr.strip()}")
+            return False
+        return True
+
+    def _write_tar(self, bundle_dir: Path, tar_path: Path):
+        mode = "w" if tar_path.name.endswith(".tar") else "w:gz"
+        logger.info(f"Writing {tar_path}")
+        with tarfile.open(tar_path, mode) as tar:
+            for path in sorted(bundle_dir.rglob("*.bundle")):
+                tar.add(path, arcname=str(path.relative_to(bundle_dir)))
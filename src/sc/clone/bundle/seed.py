@@ -0,0 +1,118 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+from pathlib import Path
+import shutil
+import subprocess
+import tarfile
+import tempfile
+
+from .bundle import MANIFEST_BUNDLE, TAR_SUFFIXES
+from .exceptions import ScBundleException
+
+logger = logging.getLogger(__name__)
+
+class SeedReference:
+    """Turns a bundle set into a temporary reference directory for a clone.
+
+    Each <name>.bundle is cloned to <name>.git, the mirror layout `repo init
+    --reference` and `git clone --reference` expect, and the manifest bundle to
+    manifests.git. It's deleted on exit, so clones that borrow from it must adopt
+    its objects first (see alternates.adopt_objects), which hard links its packs
+    rather than copying them again.
+
+    Usage:
+        with SeedReference(seed, work_dir) as reference:
+            ...
+    """
+    def __init__(self, seed: Path, work_dir: Path, jobs: int | None = None):
+        """
+        Args:
+            seed (Path): Directory of bundles, or a tarball of them.
+            work_dir (Path): Where to build the reference. Should be on the same
+                filesystem as the clone as it's the size of the bundles.
+            jobs (int | None): Number of bundles to unpack at once.
+        """
+        self.seed = Path(seed).resolve()
+        self.work_dir = Path(work_dir)
+        self.jobs = jobs or os.cpu_count()
+        self._tmp_dir = None
+
+    def __enter__(self) -> Path:
+        if not self.seed.exists():
+            raise ScBundleException(f"Seed {self.seed} does not exist")
+
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        self._tmp_dir = Path(tempfile.mkdtemp(prefix=".sc-seed-", dir=self.work_dir))
+        try:
+            bundle_dir = self.seed
+            if self.seed.is_file() and self.seed.name.endswith(TAR_SUFFIXES):
+                bundle_dir = self._tmp_dir / "bundles"
+                self._extract(bundle_dir)
+            reference = self._tmp_dir / "reference"
+            self._build_reference(bundle_dir, reference)
+        except BaseException:
+            self._cleanup()
+            raise
+        return reference
+
+    def __exit__(self, *exc):
+        self._cleanup()
+
+    def _extract(self, bundle_dir: Path):
+        logger.info(f"Extracting {self.seed}")
+        try:
+            with tarfile.open(self.seed) as tar:
+                if hasattr(tarfile, "data_filter"):
+                    tar.extractall(bundle_dir, filter="data")
+                else:
+                    tar.extractall(bundle_dir)
+        except (tarfile.TarError, OSError) as e:
+            raise ScBundleException(f"Failed to extract {self.seed}: {e}") from e
+
+    def _build_reference(self, bundle_dir: Path, reference: Path):
+        bundles = sorted(bundle_dir.rglob("*.bundle"))
+        if not bundles:
+            raise ScBundleException(f"No bundles found in {self.seed}")
+
+        def unpack(bundle: Path) -> bool:
+            relative = bundle.relative_to(bundle_dir)
+            if relative == MANIFEST_BUNDLE:
+                target = reference / "manifests.git"
+            else:
+                target = reference / relative.with_suffix(".git")
+            target.parent.mkdir(parents=True, exist_ok=True)
+            result = subprocess.run(
+                ["git", "clone", "-q", "--mirror", str(bundle), str(target)],
+                capture_output=True,
+                text=True,
+                check=False
+            )
+            if result.returncode != 0:
+                logger.warning(f"Ignoring bad bundle {relative}: {result.stderr.strip()}")
+                return False
+            return True
+
+        logger.info(f"Seeding from {len(bundles)} bundles in {self.seed}")
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            unpacked = sum(pool.map(unpack, bundles))
+        logger.info(f"Unpacked {unpacked} of {len(bundles)} bundles")
+
+    def _cleanup(self):
+        if self._tmp_dir:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+            self._tmp_dir = None
@@ -0,0 +1,7 @@
+from .cache_config import CacheConfig, GIT_MIRROR_DIR, REPO_CACHE_DIR
+from .cache_index import CacheIndex
+from .cache_lock import CacheLock
+from .exceptions import CacheLockTimeout, ScCacheException
+from .cache import SCCache
+from .peers import PeerCache
+from .shared_mirrors import shared_git_mirror, shared_repo_mirror, split_remote_uri
\ No newline at end of file
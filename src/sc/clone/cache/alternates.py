@@ -0,0 +1,145 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Helpers for git directories that borrow objects from a cache via alternates."""
+
+import logging
+import os
+from pathlib import Path
+import shutil
+import subprocess
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+def iter_alternates(root: Path) -> Iterator[tuple[Path, list[Path]]]:
+    """Find every git directory under root that has an alternates file.
+
+    Yields:
+        tuple[Path, list[Path]]: The git directory and the object directories it
+            borrows from.
+    """
+    for dirpath, dirnames, _ in os.walk(root):
+        if "objects" in dirnames:
+            objects_dir = Path(dirpath) / "objects"
+            dirnames.remove("objects")
+            alternates_file = objects_dir / "info" / "alternates"
+            if not objects_dir.is_symlink() and alternates_file.is_file():
+                yield Path(dirpath), _read_alternates(alternates_file)
+
+def borrows_from(alternates: list[Path], mirror: Path) -> bool:
+    """Whether any alternate points inside the mirror directory."""
+    mirror = mirror.resolve()
+    return any(alt == mirror or mirror in alt.parents for alt in alternates)
+
+def dissociate(git_dir: Path, mirror: Path, root: Path | None = None):
+    """Copy the objects a git directory borrows from mirror into it and stop borrowing.
+
+    This is what `git clone --dissociate` does: repack everything reachable,
+    including borrowed objects, then drop the alternate. Repo keeps a project's
+    objects in .repo/project-objects, which has no refs, and links them into the
+    git directories under .repo/projects. Only those refs make the objects
+    reachable, so every git directory under root sharing them is repacked instead,
+    keeping the packs the others wrote.
+
+    Args:
+        git_dir (Path): The git directory with the alternates.
+        mirror (Path): The mirror to stop borrowing from.
+        root (Path | None): Where to look for git directories sharing git_dir's
+            objects. Defaults to only git_dir itself.
+    """
+    logger.info(f"Dissociating {git_dir} from {mirror}")
+    sharers = sharing_git_dirs(root, git_dir) if root else [git_dir]
+    if sharers in ([], [git_dir]):
+        subprocess.run(
+            ["git", "--git-dir", str(git_dir), "repack", "-a", "-d", "-q"],
+            check=True
+        )
+    else:
+        for sharer in sharers:
+            subprocess.run(
+                ["git", "--git-dir", str(sharer), "repack", "-a", "-q"],
+                check=True
+            )
+    stop_borrowing(git_dir, mirror)
+
+def sharing_git_dirs(root: Path, git_dir: Path) -> list[Path]:
+    """Git directories under root whose objects directory is git_dir's, directly
+    or through a symlink."""
+    objects_dir = (git_dir / "objects").resolve()
+    sharers = []
+    for dirpath, dirnames, _ in os.walk(root):
+        if "objects" in dirnames:
+            dirnames.remove("objects")
+            if (Path(dirpath) / "objects").resolve() == objects_dir:
+                sharers.append(Path(dirpath))
+    return sharers
+
+def adopt_objects(git_dir: Path, mirror: Path):
+    """Take over the objects a git directory borrows from mirror and stop borrowing.
+
+    Unlike dissociate nothing is repacked: the mirror's packs and loose objects are
+    hard linked in, or copied if the mirror is on another filesystem. Only suited
+    to a temporary mirror that's deleted afterwards, as all of it is taken.
+    """
+    objects_dir = git_dir / "objects"
+    alternates_file = objects_dir / "info" / "alternates"
+    if not alternates_file.is_file():
+        return
+    logger.debug(f"Adopting the objects {git_dir} borrows from {mirror}")
+    for alt in _read_alternates(alternates_file):
+        if not borrows_from([alt], mirror):
+            continue
+        for path in sorted(alt.rglob("*")):
+            relative = path.relative_to(alt)
+            # Skip alternates, commit graphs and multi-pack indexes, which describe
+            # the mirror rather than the objects.
+            if not path.is_file() or relative.parts[0] == "info" or \
+                    (relative.parts[0] == "pack" and not path.name.startswith("pack-")):
+                continue
+            target = objects_dir / relative
+            if target.exists():
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(path, target)
+            except OSError:
+                shutil.copy2(path, target)
+    stop_borrowing(git_dir, mirror)
+
+def stop_borrowing(git_dir: Path, mirror: Path):
+    """Drop a git directory's alternates that point inside mirror.
+
+    The objects it borrowed must have been copied in first.
+    """
+    alternates_file = git_dir / "objects" / "info" / "alternates"
+    mirror = mirror.resolve()
+    remaining = [
+        alt for alt in _read_alternates(alternates_file)
+        if not (alt == mirror or mirror in alt.parents)
+    ]
+    if remaining:
+        alternates_file.write_text("".join(f"{alt}\n" for alt in remaining))
+    else:
+        alternates_file.unlink()
+
+def _read_alternates(alternates_file: Path) -> list[Path]:
+    objects_dir = alternates_file.parent.parent
+    alternates = []
+    for line in alternates_file.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        # Relative alternates are relative to the objects directory.
+        alternates.append((objects_dir / line).resolve())
+    return alternates
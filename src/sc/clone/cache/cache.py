@@ -0,0 +1,374 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+import os
+from pathlib import Path
+import shutil
+import subprocess
+import sys
+import time
+
+import click
+
+from . import alternates
+from .cache_config import CacheConfig, GIT_MIRROR_DIR, REPO_CACHE_DIR, format_size, parse_size
+from .cache_index import CacheIndex
+from .cache_lock import CacheLock
+from .exceptions import CacheLockTimeout
+from .peers import DEFAULT_LISTEN, DEFAULT_PORT, serve_command
+
+logger = logging.getLogger(__name__)
+
+MAINTENANCE_LOG_NAME = ".sc_maintenance.log"
+
+@dataclass
+class MirrorInfo:
+    """A mirrored project in a host cache."""
+    host_dir: Path
+    name: str
+    path: Path
+    size: int
+    last_used: float
+    lock_dir: Path
+
+class SCCache:
+    """An SC module to report on and maintain the clone caches.
+
+    Repo host caches live directly under the cache directory and are locked as a
+    whole. Git mirrors live under its .git-mirrors directory, grouped by host, and
+    each mirror is locked on its own.
+    """
+    def __init__(self, cache_dir: Path = REPO_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.git_mirror_dir = cache_dir / GIT_MIRROR_DIR.name
+        self.config = CacheConfig.load()
+
+    def status(self):
+        """Print the size and last use of every host cache and mirrored project."""
+        host_dirs = self._get_host_dirs()
+        if not host_dirs:
+            click.echo(f"No caches in {self.cache_dir}")
+            return
+
+        total = 0
+        for host_dir in host_dirs:
+            mirrors = sorted(self._get_mirrors(host_dir), key=lambda m: m.size, reverse=True)
+            host_size = self._get_dir_size(host_dir)
+            total += host_size
+            last_used = max((m.last_used for m in mirrors), default=None)
+
+            click.secho(
+                f"{self._host_label(host_dir)}  {format_size(host_size)}  "
+                f"last used {self._format_time(last_used)}",
+                fg="green",
+                bold=True
+            )
+            manifests = CacheIndex(host_dir).manifests
+            if manifests:
+                projects = {p for names in manifests.values() for p in names}
+                click.echo(f"   {len(projects)} projects from {len(manifests)} manifests")
+            for mirror in mirrors:
+                click.echo(
+                    f"   {format_size(mirror.size):>8}  {self._format_time(mirror.last_used)}"
+                    f"  {mirror.name}"
+                )
+            click.echo()
+
+        budget = self.config.max_size_bytes
+        budget_str = format_size(budget) if budget else "unbounded"
+        click.secho(f"Total: {format_size(total)} (budget {budget_str})", bold=True)
+
+    def prune(self, max_size: str | None = None, dry_run: bool = False):
+        """Evict least recently used mirrors until the caches fit in the budget.
+
+        Workspaces registered as borrowing objects from an evicted mirror are
+        dissociated from it first, so they keep working.
+
+        Args:
+            max_size (str | None): Disk budget, overrides the configured max_size.
+            dry_run (bool): Only report what would be evicted.
+        """
+        budget = parse_size(max_size) if max_size else self.config.max_size_bytes
+        if budget is None:
+            logger.info("No cache budget configured, set cache.max_size or pass --max-size.")
+            return
+
+        host_dirs = self._get_host_dirs()
+        total = sum(self._get_dir_size(host_dir) for host_dir in host_dirs)
+        if total <= budget:
+            logger.info(f"Caches use {format_size(total)}, within budget {format_size(budget)}.")
+            return
+
+        mirrors = sorted(
+            (m for host_dir in host_dirs for m in self._get_mirrors(host_dir)),
+            key=lambda m: m.last_used
+        )
+        to_evict = []
+        for mirror in mirrors:
+            if total <= budget:
+                break
+            to_evict.append(mirror)
+            total -= mirror.size
+
+        for host_dir in dict.fromkeys(m.host_dir for m in to_evict):
+            host_mirrors = [m for m in to_evict if m.host_dir == host_dir]
+            if dry_run:
+                for mirror in host_mirrors:
+                    click.echo(f"Would evict {self._host_label(host_dir)}/{mirror.name} "
+                               f"({format_size(mirror.size)})")
+                continue
+            self._evict_mirrors(host_dir, host_mirrors)
+
+    def gc(self, host: str | None = None, jobs: int | None = None, prune: bool = False):
+        """Repack mirrors and write their commit graphs, in parallel.
+
+        Unreachable objects are kept, as workspaces may still borrow them.
+
+        Args:
+            host (str | None): Only maintain this host's cache.
+            jobs (int | None): Number of mirrors to maintain at once. Defaults to the
+                number of CPUs.
+            prune (bool): Prune the caches to the budget first.
+        """
+        if prune:
+            self.prune()
+
+        host_dirs = self._get_host_dirs()
+        if host:
+            host_dirs = [h for h in host_dirs if h.name == host]
+
+        for host_dir in host_dirs:
+            try:
+                with self._lock_host(host_dir):
+                    mirrors = self._get_mirrors(host_dir)
+                    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+                        list(pool.map(self._gc_mirror, mirrors))
+
+                    index = CacheIndex(host_dir)
+                    index.record_gc()
+                    index.save()
+            except CacheLockTimeout as e:
+                logger.warning(f"Skipping gc of {self._host_label(host_dir)}: {e}")
+
+    def serve(self, port: int = DEFAULT_PORT, listen: str | None = DEFAULT_LISTEN):
+        """Serve the caches read-only with git daemon until interrupted, so other
+        machines can list this one in their cache.peers.
+
+        git daemon has no authentication, anyone who can reach it can read every
+        cached repository, so it only listens on localhost unless told otherwise.
+
+        Args:
+            port (int): Port to listen on.
+            listen (str | None): Address to listen on, None for all addresses.
+                Defaults to localhost.
+        """
+        if not self.cache_dir.is_dir():
+            logger.error(f"No caches in {self.cache_dir} to serve.")
+            sys.exit(1)
+        if listen is None:
+            logger.warning("Serving the caches, unauthenticated, on every network "
+                           "interface. Anyone who can reach this machine can read them.")
+
+        cmd = serve_command(self.cache_dir, port, listen)
+        click.secho(" ".join(cmd), fg="green")
+        logger.info(f"Serving {self.cache_dir} at git://{listen or '<this host>'}:{port}/")
+        try:
+            result = subprocess.run(cmd, check=False)
+        except KeyboardInterrupt:
+            return
+        if result.returncode != 0:
+            logger.error(f"git daemon exited with {result.returncode}")
+            sys.exit(1)
+
+    @staticmethod
+    def schedule_maintenance(host_dir: Path):
+        """Start a detached `sc cache gc` for a host if it hasn't had one recently.
+
+        Must be called holding the host cache's exclusive lock, or for a git mirror
+        the refreshed mirror's.
+        """
+        config = CacheConfig.load()
+        index = CacheIndex(host_dir)
+        if index.last_gc and time.time() - index.last_gc < config.gc_interval:
+            return
+
+        # Record now so concurrent clones don't start their own run.
+        index.record_gc()
+        index.save()
+
+        cmd = [sys.executable, "-m", "sc", "cache", "gc", "--host", host_dir.name]
+        if config.max_size:
+            cmd.append("--prune")
+
+        logger.info(f"Starting background maintenance of cache {host_dir}")
+        with open(host_dir.parent / MAINTENANCE_LOG_NAME, "a") as log:
+            subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                start_new_session=True
+            )
+
+    def _evict_mirrors(self, host_dir: Path, mirrors: list[MirrorInfo]):
+        try:
+            with self._lock_host(host_dir, exclusive=True):
+                index = CacheIndex(host_dir)
+                borrowers = [
+                    (git_dir, alts, root)
+                    for root in map(self._git_dirs_root, index.workspaces())
+                    for git_dir, alts in alternates.iter_alternates(root)
+                ]
+                for mirror in mirrors:
+                    try:
+                        with self._lock_mirror(mirror, exclusive=True):
+                            self._evict_mirror(mirror, borrowers)
+                    except CacheLockTimeout as e:
+                        logger.warning(f"Skipping eviction of {mirror.name}: {e}")
+
+                # Manifests that included the evicted projects must refresh again.
+                index.clear_refreshes()
+                index.save()
+        except CacheLockTimeout as e:
+            logger.warning(f"Skipping eviction from {self._host_label(host_dir)}: {e}")
+
+    def _evict_mirror(
+            self,
+            mirror: MirrorInfo,
+            borrowers: list[tuple[Path, list[Path], Path]]
+        ):
+        for git_dir, alts, root in borrowers:
+            if not alternates.borrows_from(alts, mirror.path):
+                continue
+            try:
+                alternates.dissociate(git_dir, mirror.path, root)
+            except subprocess.CalledProcessError as e:
+                logger.error(
+                    f"Failed to dissociate {git_dir}, keeping {mirror.name}: {e}")
+                return
+
+        logger.info(f"Evicting {self._host_label(mirror.host_dir)}/{mirror.name} "
+                    f"({format_size(mirror.size)})")
+        shutil.rmtree(mirror.path)
+
+    @staticmethod
+    def _git_dirs_root(workspace: Path) -> Path:
+        """Where a registered workspace's git directories are: the .repo directory of
+        repo workspaces, or the workspace's git directory itself."""
+        if (workspace / ".repo").is_dir():
+            return workspace / ".repo"
+        return workspace
+
+    def _gc_mirror(self, mirror: MirrorInfo):
+        try:
+            with self._lock_mirror(mirror):
+                self._repack_mirror(mirror)
+        except CacheLockTimeout as e:
+            logger.warning(f"Skipping gc of {mirror.name}: {e}")
+
+    def _repack_mirror(self, mirror: MirrorInfo):
+        logger.info(f"Repacking {self._host_label(mirror.host_dir)}/{mirror.name}")
+        for args in (
+                ["repack", "-a", "-d", "-k", "-q"],
+                ["pack-refs", "--all"],
+                ["commit-graph", "write", "--reachable"]
+            ):
+            result = subprocess.run(
+                ["git", "--git-dir", str(mirror.path), *args],
+                capture_output=True,
+                text=True,
+                check=False
+            )
+            if result.returncode != 0:
+                logger.warning(
+                    f"git {args[0]} failed in {mirror.path}: {result.stderr.strip()}")
+                return
+
+    def _get_host_dirs(self) -> list[Path]:
+        """The repo host caches followed by the hosts of the git mirrors."""
+        host_dirs = []
+        for parent in (self.cache_dir, self.git_mirror_dir):
+            if parent.is_dir():
+                host_dirs.extend(sorted(
+                    p for p in parent.iterdir()
+                    if p.is_dir() and not p.name.startswith(".")
+                ))
+        return host_dirs
+
+    def _is_git_mirror_host(self, host_dir: Path) -> bool:
+        return host_dir.parent == self.git_mirror_dir
+
+    def _host_label(self, host_dir: Path) -> str:
+        return host_dir.relative_to(self.cache_dir).as_posix()
+
+    def _lock_host(self, host_dir: Path, exclusive: bool = False):
+        """Hold a repo host cache's lock. Git mirrors are locked one by one instead."""
+        if self._is_git_mirror_host(host_dir):
+            return nullcontext()
+        return self._lock(host_dir, exclusive)
+
+    def _lock_mirror(self, mirror: MirrorInfo, exclusive: bool = False):
+        """Hold a git mirror's own lock. Repo mirrors are covered by their host's."""
+        if mirror.lock_dir == mirror.host_dir:
+            return nullcontext()
+        return self._lock(mirror.lock_dir, exclusive)
+
+    def _lock(self, lock_dir: Path, exclusive: bool):
+        lock = CacheLock(lock_dir, self.config.lock_timeout)
+        return lock.exclusive() if exclusive else lock.shared()
+
+    def _get_mirrors(self, host_dir: Path) -> list[MirrorInfo]:
+        """Find the mirrored git directories in a host cache."""
+        mirrors = []
+        is_git_mirror_host = self._is_git_mirror_host(host_dir)
+        for dirpath, dirnames, _ in os.walk(host_dir):
+            if Path(dirpath) == host_dir and ".repo" in dirnames:
+                dirnames.remove(".repo")
+            for dirname in list(dirnames):
+                if not dirname.endswith(".git"):
+                    continue
+                dirnames.remove(dirname)
+                path = Path(dirpath) / dirname
+                mirrors.append(
+                    MirrorInfo(
+                        host_dir=host_dir,
+                        name=str(path.relative_to(host_dir).with_suffix("")),
+                        path=path,
+                        size=self._get_dir_size(path),
+                        last_used=CacheIndex.last_used(path),
+                        lock_dir=path if is_git_mirror_host else host_dir
+                    )
+                )
+        return mirrors
+
+    def _get_dir_size(self, path: Path) -> int:
+        """Disk usage of a directory in bytes."""
+        size = 0
+        for dirpath, _, filenames in os.walk(path):
+            for filename in filenames:
+                try:
+                    size += os.lstat(os.path.join(dirpath, filename)).st_blocks * 512
+                except OSError:
+                    continue
+        return size
+
+    def _format_time(self, timestamp: float | None) -> str:
+        if timestamp is None:
+            return "never"
+        return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
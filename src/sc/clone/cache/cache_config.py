@@ -0,0 +1,90 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from sc.config_manager import ConfigManager
+
+logger = logging.getLogger(__name__)
+
+REPO_CACHE_DIR = Path.home() / ".caches"
+GIT_MIRROR_DIR = REPO_CACHE_DIR / ".git-mirrors"
+
+class CacheConfig(BaseModel):
+    """Settings for the clone caches, read from the `cache` section of the sc config.
+
+    Attributes:
+        refresh_ttl (int): Seconds a mirror is considered fresh after a refresh. Clones
+            within this window reuse the mirror without updating it. Defaults to an hour.
+        lock_timeout (int | None): Seconds to wait for another process using the cache
+            before cloning without it. None waits forever. Defaults to 30 minutes.
+        max_size (str | None): Disk budget for all caches, e.g. "200G". Least recently
+            used mirrors are evicted beyond it. Defaults to None, which is unbounded.
+        gc_interval (int): Seconds between background repacks of a host's mirrors.
+            Defaults to a week.
+        project_list_ttl (int): Seconds a downloaded project list is used without
+            checking for changes. Defaults to 5 minutes.
+        shared_mirrors (dict[str, list[str]]): Read-only mirror roots shared by all
+            users, by host, usually set by an admin in /etc/sc/config.yaml. Clones
+            reference the first usable root instead of the user's own cache.
+        peers (list[str]): Caches of other machines served with `sc cache serve`,
+            e.g. git://lab-cache:9418. Mirrors are filled from the first peer that
+            has them before fetching the rest from the real remote.
+    """
+    model_config = ConfigDict(extra='ignore')
+
+    refresh_ttl: int = 3600
+    lock_timeout: int | None = 1800
+    max_size: str | None = None
+    gc_interval: int = 7 * 24 * 3600
+    project_list_ttl: int = 300
+    shared_mirrors: dict[str, list[str]] = {}
+    peers: list[str] = []
+
+    @property
+    def max_size_bytes(self) -> int | None:
+        return parse_size(self.max_size) if self.max_size else None
+
+    @classmethod
+    def load(cls) -> "CacheConfig":
+        """Load the cache config, falling back to defaults if it is invalid."""
+        raw_config = ConfigManager("cache").get_config()
+        try:
+            return cls(**raw_config)
+        except ValidationError as e:
+            logger.warning(f"Invalid cache config, using defaults: {e}")
+            return cls()
+
+def parse_size(size: str) -> int:
+    """Parse a human size such as "512M" or "200G" into bytes."""
+    units = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+    size = size.strip().upper().removesuffix("B").removesuffix("I")
+    number, unit = size, ""
+    if size and size[-1] in units:
+        number, unit = size[:-1], size[-1]
+    try:
+        return int(float(number) * units[unit])
+    except ValueError:
+        raise ValueError(f"Invalid size: {size}") from None
+
+def format_size(size: int) -> str:
+    """Format bytes as a human size."""
+    for unit in ("B", "K", "M", "G"):
+        if size < 1024:
+            return f"{size:.1f}{unit}" if unit != "B" else f"{size}B"
+        size /= 1024
+    return f"{size:.1f}T"
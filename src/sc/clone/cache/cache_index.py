@@ -0,0 +1,159 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+import os
+from pathlib import Path
+import socket
+import time
+
+logger = logging.getLogger(__name__)
+
+class CacheIndex:
+    """Book-keeping for a cache directory, stored alongside the mirror.
+
+    Records when each manifest (uri, branch and manifest file) last refreshed the
+    mirror so repeated clones can skip the refresh while the mirror is fresh, and
+    marks refreshes in progress so one interrupted part way can be detected.
+
+    A repo mirror accumulates the projects of every manifest cloned from its host,
+    so the projects of each manifest and when each project was last synced are
+    kept too. A refresh then only syncs the projects its manifest needs that no
+    other manifest has synced recently.
+
+    Usage by clones is recorded outside the json, as a stamp file per mirrored
+    project and an append-only list of workspaces, so clones holding the cache
+    shared can record it without racing each other.
+    """
+    FILE_NAME = ".sc_cache_index.json"
+    WORKSPACES_FILE_NAME = ".sc_cache_workspaces"
+    LAST_USED_FILE_NAME = "sc_last_used"
+
+    def __init__(self, cache_dir: Path):
+        self.path = Path(cache_dir) / self.FILE_NAME
+        self._data = self._load()
+
+    def last_refresh(self, key: str) -> float | None:
+        """Return the epoch time the key last refreshed the mirror, if ever."""
+        return self._data["refreshes"].get(key)
+
+    def is_fresh(self, key: str, ttl: int) -> bool:
+        """Whether the key refreshed the mirror less than ttl seconds ago."""
+        last_refresh = self.last_refresh(key)
+        return last_refresh is not None and time.time() - last_refresh < ttl
+
+    def record_refresh(self, key: str):
+        self._data["refreshes"][key] = time.time()
+
+    @property
+    def refresh_interrupted(self) -> bool:
+        """Whether a previous refresh started but never finished.
+
+        Only meaningful while holding the cache's exclusive lock.
+        """
+        return "refreshing" in self._data
+
+    def begin_refresh(self):
+        """Mark a refresh as in progress and save immediately."""
+        self._data["refreshing"] = {
+            "pid": os.getpid(),
+            "host": socket.gethostname(),
+            "started": time.time()
+        }
+        self.save()
+
+    def end_refresh(self):
+        self._data.pop("refreshing", None)
+
+    def clear_refreshes(self):
+        """Forget all refreshes so the next clone refreshes the mirror."""
+        self._data["refreshes"] = {}
+        self._data["synced"] = {}
+
+    def record_manifest(self, key: str, projects: list[str]):
+        """Record the projects a manifest needs from the mirror."""
+        self._data["manifests"][key] = sorted(projects)
+
+    @property
+    def manifests(self) -> dict[str, list[str]]:
+        """The projects of each manifest recorded against the mirror, by key."""
+        return self._data["manifests"]
+
+    def record_sync(self, projects: list[str]):
+        now = time.time()
+        for project in projects:
+            self._data["synced"][project] = now
+
+    def stale_projects(self, projects: list[str], ttl: int) -> list[str]:
+        """The projects that haven't been synced within the last ttl seconds."""
+        now = time.time()
+        return [
+            project for project in projects
+            if now - self._data["synced"].get(project, 0) >= ttl
+        ]
+
+    @property
+    def last_gc(self) -> float | None:
+        return self._data.get("last_gc")
+
+    def record_gc(self):
+        self._data["last_gc"] = time.time()
+
+    def record_use(self, mirror: Path):
+        """Stamp a mirrored project as used by a clone now."""
+        (Path(mirror) / self.LAST_USED_FILE_NAME).touch()
+
+    @classmethod
+    def last_used(cls, mirror: Path) -> float:
+        """When a mirrored project was last used, or last changed if never used."""
+        stamp = Path(mirror) / cls.LAST_USED_FILE_NAME
+        return stamp.stat().st_mtime if stamp.exists() else Path(mirror).stat().st_mtime
+
+    def register_workspace(self, workspace: Path):
+        """Remember a workspace that borrows objects from this cache."""
+        workspace = Path(workspace).resolve()
+        if workspace in self.workspaces():
+            return
+        with open(self.path.with_name(self.WORKSPACES_FILE_NAME), "a") as f:
+            f.write(f"{workspace}\n")
+
+    def workspaces(self) -> list[Path]:
+        """Workspaces that have borrowed objects from this cache and still exist."""
+        workspaces_file = self.path.with_name(self.WORKSPACES_FILE_NAME)
+        if not workspaces_file.is_file():
+            return []
+        paths = dict.fromkeys(
+            Path(line) for line in workspaces_file.read_text().splitlines() if line)
+        return [path for path in paths if path.is_dir()]
+
+    def save(self):
+        """Write the index atomically so concurrent readers never see partial json."""
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self._data, indent=2))
+        os.replace(tmp_path, self.path)
+
+    def _load(self) -> dict:
+        data = {}
+        if self.path.is_file():
+            try:
+                data = json.loads(self.path.read_text())
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"Ignoring unreadable cache index {self.path}: {e}")
+        if not isinstance(data, dict):
+            data = {}
+        data.setdefault("refreshes", {})
+        data.setdefault("manifests", {})
+        data.setdefault("synced", {})
+        return data
@@ -0,0 +1,180 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from contextlib import contextmanager
+import fcntl
+import logging
+import os
+from pathlib import Path
+import socket
+import time
+from typing import Iterator
+
+from .exceptions import CacheLockTimeout
+
+logger = logging.getLogger(__name__)
+
+class CacheLock:
+    """A reader/writer lock over a cache directory.
+
+    Refreshes take the lock exclusively, clones that use the cache as a reference
+    take it shared. The lock is a flock on a file in the cache directory, so the
+    kernel drops it when the holding process dies. Each holder also records itself
+    in an owners directory; if the lock is held but every recorded owner on this
+    host is dead (possible on network filesystems that don't release flocks) the
+    lock file is treated as stale and replaced.
+
+    Args:
+        cache_dir (Path): The cache directory to lock.
+        timeout (float | None): Seconds to wait for the lock. None waits forever.
+    """
+    LOCK_NAME = ".sc_cache.lock"
+    POLL_INTERVAL = 1.0
+    STALE_GRACE = 5.0
+
+    def __init__(self, cache_dir: Path, timeout: float | None = None):
+        self.cache_dir = Path(cache_dir)
+        self.timeout = timeout
+        self.path = self.cache_dir / self.LOCK_NAME
+        self.owners_dir = self.cache_dir / f"{self.LOCK_NAME}.owners"
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        """Hold the lock shared, alongside other readers."""
+        with self._hold(fcntl.LOCK_SH):
+            yield
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        """Hold the lock exclusively, waiting for all readers and writers to finish."""
+        with self._hold(fcntl.LOCK_EX):
+            yield
+
+    def try_exclusive(self) -> bool:
+        """Return whether an exclusive lock could be taken right now, without keeping it."""
+        try:
+            fd = self._acquire(fcntl.LOCK_EX, timeout=0)
+        except CacheLockTimeout:
+            return False
+        self._release(fd)
+        return True
+
+    @contextmanager
+    def _hold(self, operation: int) -> Iterator[None]:
+        fd = self._acquire(operation, self.timeout)
+        try:
+            yield
+        finally:
+            self._release(fd)
+
+    def _acquire(self, operation: int, timeout: float | None) -> int:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        mode = "exclusive" if operation == fcntl.LOCK_EX else "shared"
+        start = time.monotonic()
+        stale_since = None
+        logged_wait = False
+
+        while True:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, operation | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+            else:
+                # The file may have been replaced as stale while we were waiting on it.
+                if self._is_current_lock_file(fd):
+                    self._prune_dead_owners()
+                    self._record_owner(fd, mode)
+                    return fd
+                os.close(fd)
+                continue
+
+            # Only break the lock once it has looked stale for a while, so a holder
+            # that has just taken the lock has time to record itself.
+            if self._is_stale():
+                stale_since = stale_since or time.monotonic()
+                if time.monotonic() - stale_since >= self.STALE_GRACE:
+                    logger.warning(f"Removing stale cache lock {self.path}")
+                    self._remove_stale_lock()
+                    stale_since = None
+                    continue
+            else:
+                stale_since = None
+
+            waited = time.monotonic() - start
+            if timeout is not None and waited >= timeout:
+                raise CacheLockTimeout(
+                    f"Timed out waiting for {mode} lock on {self.cache_dir}, held by: "
+                    f"{', '.join(self._owners()) or 'unknown'}"
+                )
+
+            if not logged_wait:
+                logger.info(f"Waiting for {mode} lock on cache {self.cache_dir}...")
+                logged_wait = True
+            time.sleep(self.POLL_INTERVAL)
+
+    def _release(self, fd: int):
+        self._owner_path(fd).unlink(missing_ok=True)
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+    def _is_current_lock_file(self, fd: int) -> bool:
+        try:
+            return os.fstat(fd).st_ino == os.stat(self.path).st_ino
+        except FileNotFoundError:
+            return False
+
+    def _owner_path(self, fd: int) -> Path:
+        # The descriptor keeps records unique between holders in the same process.
+        return self.owners_dir / f"{os.getpid()}.{fd}@{socket.gethostname()}"
+
+    def _record_owner(self, fd: int, mode: str):
+        self.owners_dir.mkdir(exist_ok=True)
+        self._owner_path(fd).write_text(f"{mode} {time.time()}\n")
+
+    def _owners(self) -> list[str]:
+        if not self.owners_dir.is_dir():
+            return []
+        return [p.name for p in self.owners_dir.iterdir()]
+
+    def _is_stale(self) -> bool:
+        """The lock is stale if every owner that recorded itself is a dead local process."""
+        owners = self._owners()
+        if not owners:
+            return False
+        return all(self._is_dead_local_owner(owner) for owner in owners)
+
+    def _is_dead_local_owner(self, owner: str) -> bool:
+        ids, _, hostname = owner.partition("@")
+        pid = ids.split(".")[0]
+        if hostname != socket.gethostname() or not pid.isdigit():
+            # Processes on other hosts can't be checked, assume they're alive.
+            return False
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            return False
+        return False
+
+    def _prune_dead_owners(self):
+        for owner in self._owners():
+            if self._is_dead_local_owner(owner):
+                (self.owners_dir / owner).unlink(missing_ok=True)
+
+    def _remove_stale_lock(self):
+        for owner in self._owners():
+            (self.owners_dir / owner).unlink(missing_ok=True)
+        self.path.unlink(missing_ok=True)
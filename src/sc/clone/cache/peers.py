@@ -0,0 +1,140 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+from pathlib import Path
+import shutil
+import subprocess
+
+from ..cloners.sync_jobs import probe_latency
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 9418
+DEFAULT_LISTEN = "127.0.0.1"
+
+class PeerCache:
+    """Fills mirrors from the caches of peers on the local network.
+
+    Peers serve their ~/.caches read-only with `sc cache serve`, so a mirror at
+    ~/.caches/<relative path> here is at <peer url>/<relative path> there. Objects
+    are fetched from the first peer that has the mirror, then the refresh from the
+    real remote only fetches what the peer was missing. Peers that are down or
+    don't have a mirror are skipped.
+
+    Args:
+        peers (list[str]): Peer urls, e.g. git://lab-cache:9418.
+        jobs (int | None): Number of mirrors to fetch at once.
+    """
+    def __init__(self, peers: list[str], jobs: int | None = None):
+        self.peers = [peer.rstrip("/") for peer in peers]
+        self.jobs = jobs or os.cpu_count()
+        self._reachable = None
+
+    @property
+    def reachable(self) -> list[str]:
+        """The peers accepting connections, checked once."""
+        if self._reachable is None:
+            self._reachable = [peer for peer in self.peers if probe_latency(peer) is not None]
+            for peer in set(self.peers) - set(self._reachable):
+                logger.info(f"Cache peer {peer} is unreachable, skipping it.")
+        return self._reachable
+
+    def seed_git_mirror(self, mirror: Path, relative_path: str) -> bool:
+        """Fetch a bare mirror's refs and objects from a peer.
+
+        Returns:
+            bool: Whether a peer had the mirror.
+        """
+        for peer in self.reachable:
+            if self._fetch(mirror, f"{peer}/{relative_path}"):
+                logger.debug(f"Seeded {mirror} from {peer}")
+                return True
+        return False
+
+    def seed_repo_mirror(self, host_cache_dir: Path, relative_path: str, projects: list[str]):
+        """Fetch the projects of a repo mirror from peers, creating missing ones.
+
+        Args:
+            host_cache_dir (Path): The `repo init --mirror` directory.
+            relative_path (str): Its path relative to the cache root.
+            projects (list[str]): Names of the manifest's projects.
+        """
+        if not self.reachable:
+            return
+
+        def seed(name: str) -> bool:
+            git_dir = host_cache_dir / f"{name}.git"
+            created = not git_dir.exists()
+            if created:
+                subprocess.run(
+                    ["git", "init", "-q", "--bare", str(git_dir)],
+                    capture_output=True,
+                    check=True
+                )
+            if self.seed_git_mirror(git_dir, f"{relative_path}/{name}.git"):
+                return True
+            if created:
+                # Leave missing projects for repo to create as it normally would.
+                shutil.rmtree(git_dir, ignore_errors=True)
+            return False
+
+        logger.info(f"Fetching {len(projects)} projects from cache peers")
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            seeded = sum(pool.map(seed, projects))
+        logger.info(f"Fetched {seeded} of {len(projects)} projects from cache peers")
+
+    @staticmethod
+    def _fetch(git_dir: Path, url: str) -> bool:
+        result = subprocess.run(
+            ["git", "--git-dir", str(git_dir), "fetch", "--quiet", "--no-write-fetch-head",
+             url, "+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*"],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        if result.returncode != 0:
+            logger.debug(f"Fetching {url} failed: {result.stderr.strip()}")
+        return result.returncode == 0
+
+def serve_command(
+        cache_dir: Path,
+        port: int = DEFAULT_PORT,
+        listen: str | None = DEFAULT_LISTEN
+    ) -> list[str]:
+    """The git daemon command serving a cache directory read-only to peers.
+
+    Args:
+        cache_dir (Path): The cache directory to serve.
+        port (int): Port to listen on.
+        listen (str | None): Address to listen on, None for all addresses.
+    """
+    cmd = [
+        "git", "daemon",
+        "--export-all",
+        f"--base-path={cache_dir}",
+        f"--port={port}",
+        "--reuseaddr",
+        "--informative-errors",
+        # Only fetches, whatever the mirrors' own config says.
+        "--forbid-override=receive-pack",
+        "--forbid-override=upload-archive",
+    ]
+    if listen:
+        cmd.append(f"--listen={listen}")
+    cmd.append(str(cache_dir))
+    return cmd
@@ -0,0 +1,72 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+from pathlib import Path
+import re
+
+from .cache_config import CacheConfig
+
+logger = logging.getLogger(__name__)
+
+_SCP_LIKE_URI = re.compile(r"^(?:[^@/]+@)?(?P<host>[^:/]+):(?P<path>.+)$")
+
+def split_remote_uri(uri: str) -> tuple[str, str]:
+    """Split a git remote into its host and repository path.
+
+    Example:
+        split_remote_uri("git@github.com:rdkcentral/sc.git") -> ("github.com", "rdkcentral/sc")
+        split_remote_uri("https://github.com/rdkcentral/sc") -> ("github.com", "rdkcentral/sc")
+    """
+    if "://" in uri:
+        rest = uri.split("://", 1)[1]
+        netloc, _, path = rest.partition("/")
+        host = netloc.rsplit("@", 1)[-1].split(":", 1)[0]
+    elif match := _SCP_LIKE_URI.match(uri):
+        host, path = match.group("host"), match.group("path")
+    else:
+        host, path = "", uri
+    path = path.strip("/").removesuffix(".git")
+    return host or "localhost", path
+
+def shared_repo_mirror(host: str, cache_config: CacheConfig) -> Path | None:
+    """The first readable `repo init --mirror` root an admin shares for a host."""
+    for root in _shared_roots(host, cache_config):
+        if (root / '.repo').is_dir():
+            return root
+    return None
+
+def shared_git_mirror(uri: str, cache_config: CacheConfig) -> Path | None:
+    """The first readable mirror of a git repository an admin shares for its host.
+
+    Mirrors are looked for at <root>/<repository path>.git, the layout a repo mirror
+    of the same host has.
+    """
+    host, path = split_remote_uri(uri)
+    for root in _shared_roots(host, cache_config):
+        mirror = root / f"{path}.git"
+        if (mirror / 'objects').is_dir():
+            return mirror
+    return None
+
+def _shared_roots(host: str, cache_config: CacheConfig) -> list[Path]:
+    roots = []
+    for root in cache_config.shared_mirrors.get(host, []):
+        root = Path(root).expanduser()
+        if root.is_dir() and os.access(root, os.R_OK | os.X_OK):
+            roots.append(root)
+        else:
+            logger.debug(f"Shared mirror root {root} for {host} isn't readable, skipping.")
+    return roots
@@ -0,0 +1,179 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from .cache import CacheLock, CacheLockTimeout, REPO_CACHE_DIR, split_remote_uri
+from .clone import SCClone
+from .cloners.cloner_runner import ClonerRunner
+from .timing import TimingReport
+
+if TYPE_CHECKING:
+    from .clone import CliOverrides
+    from .project_list.project_list import Project
+
+logger = logging.getLogger(__name__)
+
+WARM_LOCK_DIR = REPO_CACHE_DIR / ".sc-warm"
+WARM_LOG_PATH = REPO_CACHE_DIR / ".sc_warm.log"
+
+class CacheWarmer:
+    """Refreshes the caches of configured projects ahead of the clones that use them.
+
+    Meant to run unattended from cron or a systemd timer, so it does nothing when
+    the machine is busy or another warm run is going, and records what it did as
+    json lines in a log rather than on the terminal.
+
+    Projects that share a cache are refreshed once. Repo projects on the same
+    manifest host share its mirror and lock, so they're refreshed one after another
+    while different hosts and git mirrors are refreshed concurrently.
+    """
+    def __init__(
+            self,
+            jobs: int | None = None,
+            max_load: float | None = None,
+            log_path: Path | None = None
+        ):
+        """
+        Args:
+            jobs (int | None): Budget of fetch jobs shared by the concurrent refreshes.
+                Defaults to the CPU count.
+            max_load (float | None): Don't run if the 1 minute load average is above
+                this. Defaults to the CPU count.
+            log_path (Path | None): The json lines log. Defaults to
+                ~/.caches/.sc_warm.log.
+        """
+        self.jobs = jobs or os.cpu_count() or 1
+        self.max_load = max_load if max_load is not None else float(os.cpu_count() or 1)
+        self.log_path = Path(log_path) if log_path else WARM_LOG_PATH
+        self._log_lock = threading.Lock()
+
+    def warm(self, project_names: list[str] | None = None):
+        """Refresh the caches of all configured projects, or of those named, unless
+        busy or already being warmed."""
+        load = os.getloadavg()[0]
+        if load > self.max_load:
+            self._log({"event": "skipped", "reason": f"load {load:.2f} > {self.max_load}"})
+            return
+
+        try:
+            with CacheLock(WARM_LOCK_DIR, timeout=0).exclusive():
+                self._warm(SCClone().get_projects(project_names))
+        except CacheLockTimeout:
+            self._log({"event": "skipped", "reason": "another warm run holds the lock"})
+
+    def _warm(self, projects: list["Project"]):
+        groups = self._group_by_cache(projects)
+        parallel = max(1, min(len(groups), self.jobs))
+        per_refresh = max(1, self.jobs // parallel)
+        self._log({"event": "start", "projects": len(projects), "caches": len(groups)})
+        start = time.monotonic()
+
+        def warm_group(group: list["Project"]) -> int:
+            return sum(self._warm_project(project, per_refresh) for project in group)
+
+        with ThreadPoolExecutor(max_workers=parallel) as pool:
+            failed = sum(pool.map(warm_group, groups.values()))
+
+        self._log({
+            "event": "finish",
+            "seconds": round(time.monotonic() - start, 1),
+            "failed": failed
+        })
+
+    def _warm_project(self, project: "Project", jobs: int) -> bool:
+        """Refresh a project's cache, returning whether it failed."""
+        report = TimingReport()
+        entry = {"event": "refresh", "project": project.name, "type": project.type}
+        try:
+            cloner = ClonerRunner().make_cloner(project, self._overrides(jobs), report)
+            cloner.prepare()
+            entry["status"], reason = self._status(cloner.cache_status)
+            if reason:
+                entry["reason"] = reason
+        except (Exception, SystemExit) as e:
+            entry.update(status="failed", error=str(e))
+        entry["seconds"] = round(report.total_seconds, 1)
+        entry["bytes_received"] = report.bytes_received
+        self._log(entry)
+        return entry["status"] == "failed"
+
+    @staticmethod
+    def _status(cache_status: str | None) -> tuple[str, str | None]:
+        """The logged status of a refresh, and why it didn't happen if it didn't."""
+        if cache_status in ("refreshed", "fresh"):
+            return "ok", None
+        if cache_status == "busy":
+            return "busy", "another clone held the cache past the lock timeout"
+        if cache_status == "failed":
+            return "failed", "the cache refresh failed"
+        if cache_status == "shared":
+            return "skipped", "uses an admin's shared mirror"
+        return "skipped", "the project doesn't use a cache"
+
+    def _group_by_cache(self, projects: list["Project"]) -> dict[tuple, list["Project"]]:
+        """Projects that share a cache, keeping one per manifest or repository."""
+        groups = {}
+        seen = set()
+        for project in projects:
+            if not project.effective_cache:
+                continue
+            if project.type == "repo":
+                key = (project.uri, project.branch, project.manifest)
+                group = ("repo", split_remote_uri(project.uri)[0])
+            else:
+                key = (project.uri,)
+                group = ("git", project.uri)
+            if key in seen:
+                continue
+            seen.add(key)
+            groups.setdefault(group, []).append(project)
+        return groups
+
+    @staticmethod
+    def _overrides(jobs: int) -> "CliOverrides":
+        return {
+            'rev': None,
+            'no_tags': False,
+            'manifest': None,
+            'verify': False,
+            # Warming exists to refresh, so the refresh window doesn't apply.
+            'refresh_cache': True,
+            'depth': None,
+            'clone_filter': None,
+            'single_branch': False,
+            'dissociate': False,
+            'current_branch': False,
+            'groups': None,
+            'jobs_network': jobs,
+            'jobs_checkout': None,
+            'seed': None,
+            'from_workspace': None,
+            'resume': False
+        }
+
+    def _log(self, entry: dict):
+        entry = {"time": time.strftime("%Y-%m-%dT%H:%M:%S%z"), "pid": os.getpid(), **entry}
+        with self._log_lock:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.log_path, "a") as log:
+                log.write(json.dumps(entry) + "\n")
+        logger.debug(json.dumps(entry))
@@ -0,0 +1,98 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .clone import CliOverrides
+    from .project_list.project_list import Project
+
+logger = logging.getLogger(__name__)
+
+class CloneCheckpoint:
+    """Progress of a clone, so an interrupted clone can be resumed.
+
+    Written once the workspace is initialised, inside its .repo or .git directory,
+    and removed when the clone completes. Records what the workspace was cloned
+    from and which steps (sync, gitflow, hooks) have finished.
+    """
+    FILE_NAME = "sc_clone_checkpoint.json"
+    SYNC = "sync"
+    GITFLOW = "gitflow"
+    HOOKS = "hooks"
+
+    def __init__(self, path: Path, key: dict | None = None):
+        self.path = Path(path)
+        self._data = {"key": key or {}, "done": []}
+
+    @classmethod
+    def find(cls, directory: Path) -> "CloneCheckpoint | None":
+        """Load the checkpoint of an interrupted clone in a directory, if there is one."""
+        for git_dir in (".repo", ".git"):
+            path = Path(directory) / git_dir / cls.FILE_NAME
+            if not path.is_file():
+                continue
+            checkpoint = cls(path)
+            try:
+                data = json.loads(path.read_text())
+                checkpoint._data.update(key=dict(data["key"]), done=list(data["done"]))
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable clone checkpoint {path}: {e}")
+                return None
+            return checkpoint
+        return None
+
+    @staticmethod
+    def make_key(project_config: "Project", cli_overrides: "CliOverrides") -> dict:
+        """What a workspace is cloned from, which a resumed clone must match."""
+        return {
+            "project": project_config.name,
+            "uri": project_config.uri,
+            "rev": cli_overrides.get("rev") or project_config.branch,
+            "manifest": cli_overrides.get("manifest") or project_config.manifest,
+        }
+
+    @property
+    def key(self) -> dict:
+        return self._data["key"]
+
+    def mismatches(self, key: dict) -> list[str]:
+        """Descriptions of how key differs from the one the workspace was cloned with."""
+        return [
+            f"{field}: {self.key.get(field)} != {value}"
+            for field, value in key.items()
+            if self.key.get(field) != value
+        ]
+
+    def is_done(self, step: str) -> bool:
+        return step in self._data["done"]
+
+    def mark_done(self, step: str):
+        if step not in self._data["done"]:
+            self._data["done"].append(step)
+        self.save()
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self._data, indent=2))
+        os.replace(tmp_path, self.path)
+
+    def complete(self):
+        """The clone finished, nothing is left to resume."""
+        self.path.unlink(missing_ok=True)
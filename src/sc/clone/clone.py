@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
 from pathlib import Path
@@ -21,9 +22,12 @@ import sys
 
 import click
 
+from .checkpoint import CloneCheckpoint
+from .cloners.cloner import Cloner
 from .cloners.cloner_runner import ClonerRunner
 from .project_list.project_list import ProjectList
 from .project_list.project_list_manager import ProjectListManager, ProjectListSource
+from .timing import TimingReport
 from sc.config_manager import ConfigManager
 
 from typing import TypedDict, TYPE_CHECKING
@@ -39,6 +43,18 @@ class CliOverrides(TypedDict):
     no_tags: bool
     manifest: str | None
     verify: bool
+    refresh_cache: bool
+    depth: int | None
+    clone_filter: str | None
+    single_branch: bool
+    dissociate: bool
+    current_branch: bool
+    groups: str | None
+    jobs_network: int | None
+    jobs_checkout: int | None
+    seed: Path | None
+    from_workspace: Path | None
+    resume: bool
 
 class SCClone:
     """An SC module to clone projects using git-repo by yaml configuration files."""
@@ -47,48 +63,296 @@ class SCClone:
         self._project_list_manager = ProjectListManager(
             Path(self._config_manager.config_dir) / 'project_lists'
         )
+        self._project_lists = None
 
     def clone(
             self,
-            project_name: str,
+            project_name: str | list[str],
             directory: str | None = None,
             rev: str | None = None,
             force_overwrite: bool = False,
             no_tags: bool = False,
             manifest: str | None = None,
             verify: bool = False,
+            refresh_cache: bool = False,
+            depth: int | None = None,
+            clone_filter: str | None = None,
+            single_branch: bool = False,
+            dissociate: bool = False,
+            current_branch: bool = False,
+            groups: str | None = None,
+            jobs_network: int | None = None,
+            jobs_checkout: int | None = None,
+            seed: Path | None = None,
+            from_workspace: Path | None = None,
+            timing_report: Path | None = None,
+            resume: bool = False,
+            jobs: int | None = None,
         ):
         """
         Clone all of a projects repositories to a directory.
 
+        Several projects can be cloned at once, each to a folder named after it. They
+        share the project lists, revision lookups and cache refreshes, and sync
+        concurrently.
+
         Args:
-            project_name (str): The name of the project to clone.
+            project_name (str | list[str]): The name of the project to clone, or of
+                the projects to clone.
             directory (str): The directory the project should clone to. Defaults to None which
                 clones to a folder with the name of the project in the current directory.
+                When cloning several projects, the directory their folders are made in.
             force_overwrite (bool): Don't ask to delete existing directories.
                 Defaults to False.
             no_tags (bool): Don't clone tags, also turns off caching. Defaults to False.
             manifest (str): Clone with a specific manifest name. Defaults to None.
             verify (bool): Run post-sync hooks without prompting user. RDK projects only.
                 Defaults to False.
+            refresh_cache (bool): Refresh the cache even if it is still fresh.
+                Defaults to False.
+            depth (int): Shallow clone to this many commits. Defaults to None.
+            clone_filter (str): Partial clone filter e.g. blob:none. Defaults to None.
+            single_branch (bool): Git projects only, fetch only the cloned branch.
+                Defaults to False.
+            dissociate (bool): Copy the objects borrowed from the cache, or for repo
+                projects from the from_workspace source, into the clone so it doesn't
+                depend on them. Defaults to False.
+            current_branch (bool): Repo projects only, fetch only the manifest revision
+                of each project. Defaults to False.
+            groups (str): Repo projects only, sync only the manifest projects in these
+                comma separated groups. Defaults to None.
+            jobs_network (int): Repo projects only, number of projects to fetch at
+                once. Defaults to None.
+            jobs_checkout (int): Repo projects only, number of projects to check out
+                at once. Defaults to None.
+            seed (Path): Directory or tarball of git bundles to seed the clone from,
+                as made by `sc bundle create`. Defaults to None.
+            from_workspace (Path): Existing workspace of the project to borrow objects
+                from. Defaults to None.
+            timing_report (Path): Write a json report of where the clone's time went
+                to this file. Defaults to None.
+            resume (bool): Continue an interrupted clone in the directory instead of
+                starting again. Defaults to False.
+            jobs (int): When cloning several projects, the total number of fetch and
+                checkout jobs shared between them. Defaults to None which uses the
+                CPU count.
         """
-        project_config = self._resolve_project(project_name)
+        cli_overrides: CliOverrides = {
+            'rev': rev,
+            'no_tags': no_tags,
+            'manifest': manifest,
+            'verify': verify,
+            'refresh_cache': refresh_cache,
+            'depth': depth,
+            'clone_filter': clone_filter,
+            'single_branch': single_branch,
+            'dissociate': dissociate,
+            'current_branch': current_branch,
+            'groups': groups,
+            'jobs_network': jobs_network,
+            'jobs_checkout': jobs_checkout,
+            'seed': seed,
+            'from_workspace': from_workspace,
+            'resume': resume
+        }
+
+        project_names = [project_name] if isinstance(project_name, str) else project_name
+        if len(project_names) > 1:
+            self._clone_many(
+                project_names, directory, force_overwrite, cli_overrides, jobs, timing_report)
+            return
+
+        report = TimingReport()
+        try:
+            self._clone(project_names[0], directory, force_overwrite, cli_overrides, report)
+            report.print_summary()
+        finally:
+            if timing_report:
+                report.write(timing_report)
+
+    def parse_targets(
+            self,
+            targets: list[str],
+            from_file: Path | None = None
+        ) -> tuple[list[str], str | None]:
+        """Split clone arguments into project names and an optional directory.
+
+        Projects are read from the arguments, then from_file, one per line with
+        blank lines and # comments ignored. A last argument that isn't a project in
+        any list is the directory, unless it's the only project given.
+
+        Returns:
+            tuple[list[str], str | None]: The project names and the directory.
+        """
+        names = list(targets)
+        file_names = []
+        if from_file:
+            for line in Path(from_file).read_text().splitlines():
+                line = line.split("#", 1)[0].strip()
+                if line:
+                    file_names.append(line)
+
+        directory = None
+        if names and (len(names) > 1 or file_names) and not self._is_project(names[-1]):
+            directory = names.pop()
+        return names + file_names, directory
+
+    def get_projects(self, project_names: list[str] | None = None) -> list["Project"]:
+        """Projects from the configured lists, either all of them or those named.
+
+        A project in several lists is taken from the first, without prompting, and
+        invalid project entries are skipped.
+        """
+        projects = {}
+        for plist in self._get_project_lists():
+            for name in project_names or plist.project_names():
+                if name in projects:
+                    continue
+                try:
+                    if project := plist.get_project(name):
+                        projects[name] = project
+                except SystemExit:
+                    # get_project has already logged the invalid configuration.
+                    continue
+
+        for name in project_names or []:
+            if name not in projects:
+                logger.warning(f"No project {name} found")
+        return list(projects.values())
+
+    def _is_project(self, name: str) -> bool:
+        return any(plist.get_project(name) for plist in self._get_project_lists())
+
+    def _clone(
+            self,
+            project_name: str,
+            directory: str | None,
+            force_overwrite: bool,
+            cli_overrides: CliOverrides,
+            report: TimingReport
+        ):
+        with report.phase("resolve project"):
+            project_config = self._resolve_project(project_name)
         target_directory = self._resolve_target_directory(project_name, directory)
-        self._prepare_directory(target_directory, force_overwrite)
+        self._check_target(target_directory, project_config, force_overwrite, cli_overrides, report)
 
         logger.info(
             f"Cloning project [{project_config.name}] in directory "
             f"[{target_directory.relative_to(Path.cwd())}]"
         )
 
-        cli_overrides: CliOverrides = {
-            'rev': rev,
-            'no_tags': no_tags,
-            'manifest': manifest,
-            'verify': verify
+        ClonerRunner().clone(target_directory, project_config, cli_overrides, report)
+
+    def _clone_many(
+            self,
+            project_names: list[str],
+            directory: str | None,
+            force_overwrite: bool,
+            cli_overrides: CliOverrides,
+            jobs: int | None,
+            timing_report: Path | None
+        ):
+        """Clone several projects at once, each to a folder named after it.
+
+        Projects are resolved and their directories prepared one at a time, as that
+        may prompt. Each cloner then does its shared work (revision lookups, cache
+        refreshes) in turn before the syncs run concurrently, splitting a budget of
+        jobs between them.
+        """
+        if cli_overrides['seed'] or cli_overrides['from_workspace']:
+            logger.error("--seed and --from-workspace clone a single project.")
+            sys.exit(1)
+
+        project_names = list(dict.fromkeys(project_names))
+        parent_directory = Path.cwd() / directory if directory else Path.cwd()
+        parent_directory.mkdir(parents=True, exist_ok=True)
+
+        budget = jobs or os.cpu_count() or 1
+        parallel = min(len(project_names), budget)
+        per_clone = max(1, budget // parallel)
+        logger.info(
+            f"Cloning {len(project_names)} projects, {parallel} at a time with "
+            f"{per_clone} jobs each"
+        )
+        clone_overrides: CliOverrides = {
+            **cli_overrides,
+            'jobs_network': cli_overrides['jobs_network'] or per_clone,
+            'jobs_checkout': cli_overrides['jobs_checkout'] or per_clone
         }
 
-        ClonerRunner().clone(target_directory, project_config, cli_overrides)
+        runner = ClonerRunner()
+        clones = []
+        for name in project_names:
+            report = TimingReport()
+            with report.phase("resolve project"):
+                project_config = self._resolve_project(name)
+            target_directory = parent_directory / name
+            self._check_target(
+                target_directory, project_config, force_overwrite, cli_overrides, report)
+            cloner = runner.make_cloner(project_config, clone_overrides, report)
+            clones.append((name, target_directory, cloner, report))
+
+        for name, _, cloner, report in clones:
+            with report.phase("prepare"):
+                cloner.prepare()
+
+        def clone_project(target_directory: Path, cloner: Cloner) -> bool:
+            try:
+                cloner.clone(target_directory)
+                return True
+            except SystemExit:
+                # The cloner has already logged why.
+                return False
+            except Exception as e:
+                logger.error(f"Cloning into {target_directory} failed: {e}")
+                return False
+
+        with ThreadPoolExecutor(max_workers=parallel) as pool:
+            futures = {
+                name: pool.submit(clone_project, target_directory, cloner)
+                for name, target_directory, cloner, _ in clones
+            }
+            succeeded = {name: future.result() for name, future in futures.items()}
+
+        for name, _, _, report in clones:
+            click.secho(f"{name}:", bold=True)
+            report.print_summary()
+            if timing_report:
+                report.write(timing_report.with_name(
+                    f"{timing_report.stem}-{name}{timing_report.suffix}"))
+
+        failed = [name for name, ok in succeeded.items() if not ok]
+        if failed:
+            logger.error(f"Failed to clone: {', '.join(failed)}")
+            sys.exit(1)
+        click.secho(f"Cloned {len(project_names)} projects.", fg="green")
+
+    def _check_target(
+            self,
+            target_directory: Path,
+            project_config: "Project",
+            force_overwrite: bool,
+            cli_overrides: CliOverrides,
+            report: TimingReport
+        ):
+        """Check a project can be cloned into its directory and prepare it."""
+        from_workspace = cli_overrides['from_workspace']
+        if cli_overrides['seed'] and from_workspace:
+            logger.error("--seed and --from-workspace can't be used together.")
+            sys.exit(1)
+
+        if from_workspace:
+            source = Path(from_workspace).resolve()
+            if source == target_directory.resolve() or \
+                    source.is_relative_to(target_directory.resolve()):
+                logger.error("The target directory can't contain the source workspace.")
+                sys.exit(1)
+
+        if cli_overrides['resume']:
+            self._check_resumable(target_directory, project_config, cli_overrides)
+        else:
+            with report.phase("prepare directory"):
+                self._prepare_directory(target_directory, force_overwrite)
 
     def add_project_list(self):
         """Cli method to add new project index to the config."""
@@ -134,7 +398,8 @@ class SCClone:
         cache_path = self._project_list_manager.default_dir / f"{name}.yaml"
         source = ProjectListSource(url=url, platform=platform, token=token, path=str(cache_path))
 
-        project_list = self._project_list_manager.load_project_list_from_source(name, source)
+        project_list = self._project_list_manager.load_project_list_from_source(
+            name, source, force=True)
         if not project_list:
             sys.exit(1)
 
@@ -169,10 +434,15 @@ class SCClone:
         ]
 
         if not matches:
-            for plist in project_lists:
-                print(self._format_project_tree(plist))
-                print()
+            suggestions = list(dict.fromkeys(
+                name for plist in project_lists for name in plist.suggest(project_name)))
+            if not suggestions:
+                for plist in project_lists:
+                    print(self._format_project_tree(plist))
+                    print()
             click.secho(f"ERROR: No project {project_name} found", fg="red")
+            if suggestions:
+                click.secho(f"Did you mean: {', '.join(suggestions)}?", fg="yellow")
             sys.exit(1)
 
         if len(matches) == 1:
@@ -183,12 +453,16 @@ class SCClone:
         return self._select_project_config(matches)
 
     def _get_project_lists(self) -> list[ProjectList]:
-        override_path = os.getenv("SC_DEBUG_PATH")
-        if override_path:
-            return self._get_overridden_project_list(override_path)
-        else:
-            config = self._config_manager.get_config()
-            return self._project_list_manager.load_project_lists_from_config(config)
+        # Loaded once per run, however many projects are resolved.
+        if self._project_lists is None:
+            override_path = os.getenv("SC_DEBUG_PATH")
+            if override_path:
+                self._project_lists = self._get_overridden_project_list(override_path)
+            else:
+                config = self._config_manager.get_config()
+                self._project_lists = \
+                    self._project_list_manager.load_project_lists_from_config(config)
+        return self._project_lists
 
     def _get_overridden_project_list(self, override_path: Path | str):
         logger.warning(f"SC_DEBUG_PATH set using {override_path} for project list!")
@@ -219,6 +493,26 @@ class SCClone:
     def _resolve_target_directory(self, project_name: str, directory: str):
         return Path.cwd() / directory if directory else Path.cwd() / project_name
 
+    def _check_resumable(
+            self,
+            directory: Path,
+            project_config: "Project",
+            cli_overrides: CliOverrides
+        ):
+        """Exit unless the directory holds an interrupted clone of the same project."""
+        checkpoint = CloneCheckpoint.find(directory)
+        if checkpoint is None:
+            logger.error(f"No interrupted clone to resume in {directory}.")
+            sys.exit(1)
+
+        mismatches = checkpoint.mismatches(
+            CloneCheckpoint.make_key(project_config, cli_overrides))
+        if mismatches:
+            logger.error(
+                f"Can't resume, {directory} was cloned differently: {'; '.join(mismatches)}")
+            sys.exit(1)
+        logger.info(f"Option [--resume]: resuming the clone in {directory}")
+
     def _prepare_directory(self, directory: Path, force_overwrite: bool):
         def _remove_target(target: Path):
             if target.is_dir():
@@ -240,6 +534,12 @@ class SCClone:
             directory.mkdir()
             return
 
+        if CloneCheckpoint.find(directory):
+            click.secho(
+                "This directory holds an interrupted clone, use --resume to continue it.",
+                fg="yellow"
+            )
+
         if force_overwrite:
             click.echo(f"Option [-f] removing dir: [{directory.relative_to(Path.cwd())}]")
             _remove_target(directory)
@@ -16,27 +16,67 @@ from abc import ABC, abstractmethod
 from enum import Enum
 import logging
 from pathlib import Path
+import re
 import subprocess
 
 logger = logging.getLogger(__name__)
 
+FULL_SHA_PATTERN = re.compile(r"[0-9a-fA-F]{40}|[0-9a-fA-F]{64}")
+
 class RefType(Enum):
     BRANCH = "BRANCH"
     TAG = "TAG"
     SHA = "SHA"
 
+# Ref types found on remotes, by remote and ref.
+_ref_types: dict[tuple[str, str], RefType] = {}
+
 class Cloner(ABC):
+    # How prepare() left the cache: "refreshed", "fresh", "busy", "failed", or
+    # "shared" for an admin's mirror. None if the clone doesn't use a cache.
+    cache_status: str | None = None
+
+    def prepare(self):
+        """Work shared with other clones, run before clones that run concurrently."""
+
     @abstractmethod
     def clone(self, directory: Path):
         pass
 
-    def _is_branch_tag_or_sha(self, repo_uri: str, ref: str):
-        refs = subprocess.run(
-            ["git", "ls-remote", repo_uri], capture_output=True, text=True).stdout
+    def _is_branch_tag_or_sha(self, repo_uri: str, ref: str | None) -> RefType:
+        return resolve_ref_type(repo_uri, ref)
+
+def resolve_ref_type(repo_uri: str, ref: str | None) -> RefType:
+    """Work out whether a ref is a branch, tag or SHA on a remote.
+
+    Only the matching branch and tag refs are requested from the remote, and
+    successful lookups are memoized for the rest of the process. A failed lookup
+    is treated as a SHA but isn't memoized, so a later clone asks again. Full SHAs
+    and no ref (the default branch) are resolved without touching the network.
+    """
+    if ref is None:
+        return RefType.BRANCH
+    if FULL_SHA_PATTERN.fullmatch(ref):
+        return RefType.SHA
+    if (repo_uri, ref) in _ref_types:
+        return _ref_types[repo_uri, ref]
+
+    result = subprocess.run(
+        ["git", "ls-remote", repo_uri, f"refs/heads/{ref}", f"refs/tags/{ref}"],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        logger.warning(f"git ls-remote {repo_uri} failed: {result.stderr.strip()}")
+        return RefType.SHA
 
-        if f"refs/heads/{ref}" in refs:
-            return RefType.BRANCH
-        elif f"refs/tags/{ref}" in refs:
-            return RefType.TAG
-        else:
-            return RefType.SHA
+    # ls-remote patterns match on trailing path components, so compare exactly.
+    refs = {line.split("\t", 1)[-1] for line in result.stdout.splitlines()}
+    if f"refs/heads/{ref}" in refs:
+        ref_type = RefType.BRANCH
+    elif f"refs/tags/{ref}" in refs:
+        ref_type = RefType.TAG
+    else:
+        ref_type = RefType.SHA
+    _ref_types[repo_uri, ref] = ref_type
+    return ref_type
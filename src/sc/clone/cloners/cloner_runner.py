@@ -21,6 +21,8 @@ from .cloner import Cloner
 from .git_cloner import GitClonerConfig
 from .git_flow_cloner import GitFlowCloner
 from .repo_cloner import RepoCloner, RepoClonerConfig
+from ..checkpoint import CloneCheckpoint
+from ..timing import TimingReport
 
 if TYPE_CHECKING:
     from ..clone import CliOverrides
@@ -33,19 +35,32 @@ class ClonerRunner:
             self,
             directory: Path,
             project_config: "Project",
-            cli_overrides: "CliOverrides"
+            cli_overrides: "CliOverrides",
+            report: TimingReport | None = None
+        ) -> Cloner:
+        cloner = self.make_cloner(project_config, cli_overrides, report)
+        cloner.clone(directory)
+        return cloner
+
+    def make_cloner(
+            self,
+            project_config: "Project",
+            cli_overrides: "CliOverrides",
+            report: TimingReport | None = None
         ) -> Cloner:
         cloner_type = project_config.type
         if cloner_type == "git":
             config = self._make_git_cloner_config(project_config, cli_overrides)
-            cloner = GitFlowCloner(config)
+            cloner = GitFlowCloner(config, report)
         elif cloner_type == "repo":
             config = self._make_repo_cloner_config(project_config, cli_overrides)
-            cloner = RepoCloner(config)
+            cloner = RepoCloner(config, report)
         else:
             raise ValueError(f"Invalid cloner type {cloner_type}")
 
-        cloner.clone(directory)
+        config.resume = bool(cli_overrides.get("resume"))
+        config.checkpoint_key = CloneCheckpoint.make_key(project_config, cli_overrides)
+        return cloner
 
     def _make_git_cloner_config(
             self,
@@ -55,7 +70,11 @@ class ClonerRunner:
         cloner_config = GitClonerConfig(
             uri = project_config.uri,
             branch = project_config.branch,
-            no_tags = bool(cli_overrides.get('no_tags'))
+            no_tags = bool(cli_overrides.get('no_tags')),
+            depth = project_config.depth,
+            clone_filter = project_config.clone_filter,
+            single_branch = project_config.single_branch,
+            cache = project_config.effective_cache
         )
 
         if rev := cli_overrides.get("rev"):
@@ -64,6 +83,22 @@ class ClonerRunner:
         if cli_overrides.get("no_tags"):
             logger.info("Option [--no-tags]")
 
+        self._apply_partial_clone_overrides(cloner_config, cli_overrides)
+
+        if cli_overrides.get("single_branch"):
+            logger.info("Option [--single-branch]")
+            cloner_config.single_branch = True
+
+        if cli_overrides.get("refresh_cache"):
+            cloner_config.refresh_cache = True
+
+        if cli_overrides.get("dissociate"):
+            logger.info("Option [--dissociate]: copying borrowed objects into the clone")
+            cloner_config.dissociate = True
+
+        cloner_config.seed = cli_overrides.get("seed")
+        cloner_config.from_workspace = cli_overrides.get("from_workspace")
+
         return cloner_config
 
     def _make_repo_cloner_config(
@@ -83,7 +118,12 @@ class ClonerRunner:
             cache = project_config.effective_cache,
             repo_url = project_config.repo_url,
             repo_rev = project_config.repo_rev,
-            no_repo_verify = project_config.no_repo_verify
+            no_repo_verify = project_config.no_repo_verify,
+            depth = project_config.depth,
+            clone_filter = project_config.clone_filter,
+            current_branch = project_config.current_branch,
+            jobs = project_config.proc or None,
+            groups = project_config.groups
         )
 
         if rev := cli_overrides.get("rev"):
@@ -102,4 +142,44 @@ class ClonerRunner:
             logger.info("Option [--verify]: Run repo hooks without prompts")
             cloner_config.verify = True
 
-        return cloner_config
\ No newline at end of file
+        if cli_overrides.get("refresh_cache"):
+            cloner_config.refresh_cache = True
+
+        self._apply_partial_clone_overrides(cloner_config, cli_overrides)
+
+        if cli_overrides.get("current_branch"):
+            logger.info("Option [-c]: fetch only the current branch")
+            cloner_config.current_branch = True
+
+        if groups := cli_overrides.get("groups"):
+            logger.info(f"Option [-g]: sync only groups {groups}")
+            cloner_config.groups = groups
+
+        if jobs_network := cli_overrides.get("jobs_network"):
+            logger.info(f"Option [--jobs-network]: {jobs_network}")
+            cloner_config.jobs_network = jobs_network
+
+        if jobs_checkout := cli_overrides.get("jobs_checkout"):
+            logger.info(f"Option [--jobs-checkout]: {jobs_checkout}")
+            cloner_config.jobs_checkout = jobs_checkout
+
+        cloner_config.seed = cli_overrides.get("seed")
+        cloner_config.from_workspace = cli_overrides.get("from_workspace")
+        if cloner_config.from_workspace and cli_overrides.get("dissociate"):
+            logger.info("Option [--dissociate]: copying borrowed objects into the clone")
+            cloner_config.dissociate = True
+
+        return cloner_config
+
+    def _apply_partial_clone_overrides(
+            self,
+            cloner_config: GitClonerConfig | RepoClonerConfig,
+            cli_overrides: "CliOverrides"
+        ):
+        if depth := cli_overrides.get("depth"):
+            logger.info(f"Option [--depth]: shallow clone to depth {depth}")
+            cloner_config.depth = depth
+
+        if clone_filter := cli_overrides.get("clone_filter"):
+            logger.info(f"Option [--filter]: partial clone with filter {clone_filter}")
+            cloner_config.clone_filter = clone_filter
\ No newline at end of file
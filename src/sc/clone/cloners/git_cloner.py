@@ -14,13 +14,20 @@
 
 import logging
 from pathlib import Path
+import subprocess
 import sys
+import time
 
 import click
-from git import GitCommandError, Repo
+from git import GitCommandError, InvalidGitRepositoryError, NoSuchPathError, RemoteProgress, Repo
 from pydantic import BaseModel
 
-from .cloner import Cloner, RefType
+from .cloner import Cloner, FULL_SHA_PATTERN, RefType
+from ..bundle import ScBundleException, SeedReference, bundle_name
+from ..cache import (CacheConfig, CacheIndex, CacheLock, CacheLockTimeout, GIT_MIRROR_DIR,
+                     PeerCache, REPO_CACHE_DIR, SCCache, alternates, shared_git_mirror,
+                     split_remote_uri)
+from ..timing import TimingReport, pack_bytes_since, parse_received_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +35,16 @@ class GitClonerConfig(BaseModel):
     uri: str
     branch: str | None = None
     no_tags: bool = False
-
+    depth: int | None = None
+    clone_filter: str | None = None
+    single_branch: bool = False
+    seed: Path | None = None
+    from_workspace: Path | None = None
+    cache: bool = True
+    refresh_cache: bool = False
+    dissociate: bool = False
+    resume: bool = False
+    checkpoint_key: dict = {}
 
 class GitCloner(Cloner):
     """Clones a git repository.
@@ -39,46 +55,337 @@ class GitCloner(Cloner):
             Defaults to None.
         branch (str, optional): The branch to clone. If None, the default branch is used.
         no_tags (bool, optional): Clone without tags.
+        depth (int, optional): Shallow clone to this many commits.
+        clone_filter (str, optional): Partial clone filter, e.g. "blob:none".
+        single_branch (bool, optional): Only fetch the branch being cloned.
+        seed (Path, optional): Bundle set to seed the clone from.
+        from_workspace (Path, optional): Existing clone to borrow objects from.
+        cache (bool, optional): Clone with a bare mirror of the repository, kept
+            under the cache root, as a reference.
+        refresh_cache (bool, optional): Refresh the mirror even if it is still fresh.
+        dissociate (bool, optional): Copy the borrowed objects in after cloning so
+            the clone doesn't depend on the mirror.
+        resume (bool, optional): Continue an interrupted clone from its checkpoint.
+        checkpoint_key (dict, optional): What the clone is of, recorded in its checkpoint.
     """
 
     def __init__(
             self,
-            config: GitClonerConfig
+            config: GitClonerConfig,
+            report: TimingReport | None = None
         ):
         self.config = config
+        self.report = report or TimingReport()
+        self._bytes_received = 0
+        self._prepared = False
+        self._reference = None
+        self._reference_is_shared = False
 
     def clone(self, directory: Path):
-        cmd = ["git", "clone"]
+        with self.report.phase("git clone") as phase:
+            start = time.time()
+            if self.config.from_workspace:
+                self._clone_from_workspace(directory)
+            elif self.config.seed:
+                self._clone_from_seed(directory)
+            else:
+                self._clone_with_cache(directory)
+            # Fetches don't report progress, count the packs they wrote instead.
+            phase.bytes_received = \
+                self._bytes_received or pack_bytes_since(directory / '.git' / 'objects', start)
+        self.report.add_project(bundle_name(self.config.uri), phase.seconds)
 
-        if self.config.no_tags:
-            cmd.append("--no-tags")
+    def prepare(self):
+        """Find or refresh the mirror of the repository ahead of the clone.
 
-        if self.config.branch:
-            cmd.extend(["--branch", self.config.branch])
+        An admin's shared mirror is used if there is one, otherwise the user's own
+        mirror is created or refreshed.
+        """
+        if self._prepared:
+            return
+        self._prepared = True
 
-        cmd.append(self.config.uri)
-        cmd.append(str(directory))
+        if not self.config.cache or self.config.seed or self.config.from_workspace:
+            return
+        cache_config = CacheConfig.load()
+        if shared_mirror := shared_git_mirror(self.config.uri, cache_config):
+            logger.info(f"Using shared mirror {shared_mirror}")
+            self._reference = shared_mirror
+            self._reference_is_shared = True
+            self.cache_status = "shared"
+        else:
+            self._reference = self._cache(cache_config)
 
-        click.secho(" ".join(cmd), fg="green")
+    def _clone_with_cache(self, directory: Path):
+        """Clone with a mirror of the repository as the reference.
 
-        ref_type = self._is_branch_tag_or_sha(self.config.uri, self.config.branch)
+        The user's own mirror is held shared while the clone borrows from it, and the
+        clone is registered as borrowing from the host's mirrors so cache eviction
+        dissociates it first.
+        """
+        self.prepare()
+        mirror = self._reference
+        if not mirror:
+            self._clone(directory)
+            return
+        if self._reference_is_shared:
+            self._clone(directory, reference=mirror, dissociate=self.config.dissociate)
+            return
 
         try:
-            if ref_type == RefType.SHA:
-                repo = Repo.clone_from(
-                    self.config.uri,
-                    directory,
-                    multi_options=["--no-tags"] if self.config.no_tags else None
-                )
-                repo.git.fetch("origin", self.config.branch)
-                repo.git.checkout(self.config.branch)
+            with CacheLock(mirror, CacheConfig.load().lock_timeout).shared():
+                self._clone(directory, reference=mirror, dissociate=self.config.dissociate)
+                CacheIndex(mirror).record_use(mirror)
+                if not self.config.dissociate:
+                    CacheIndex(self._mirror_host_dir()).register_workspace(directory / ".git")
+        except CacheLockTimeout as e:
+            logger.warning(f"{e}. Cloning without the cache.")
+            self._clone(directory)
+
+    def _cache(self, cache_config: CacheConfig) -> Path | None:
+        """Create or refresh the bare mirror of the repository.
+
+        Like the repo cache, the mirror is updated in place under an exclusive lock
+        and isn't refreshed again within the configured TTL.
+
+        Returns:
+            Path | None: The mirror, or None if it is busy or couldn't be updated and
+                the clone should go ahead without it.
+        """
+        _, path = split_remote_uri(self.config.uri)
+        mirror = self._mirror_host_dir() / f"{path}.git"
+        mirror.mkdir(parents=True, exist_ok=True)
+
+        try:
+            with CacheLock(mirror, cache_config.lock_timeout).exclusive(), \
+                    self.report.phase("cache refresh") as phase:
+                start = time.time()
+                self._refresh_mirror(mirror, cache_config)
+                phase.bytes_received = pack_bytes_since(mirror, start)
+        except CacheLockTimeout as e:
+            logger.warning(f"{e}. Cloning without the cache.")
+            self.cache_status = "busy"
+            return None
+        except subprocess.CalledProcessError as e:
+            logger.warning(f"Failed to refresh cache {mirror}, cloning without it: {e}")
+            self.cache_status = "failed"
+            return None
+        return mirror
+
+    def _refresh_mirror(self, mirror: Path, cache_config: CacheConfig):
+        """Fetch into the mirror. Must be called holding its exclusive lock."""
+        index = CacheIndex(mirror)
+        if index.refresh_interrupted:
+            logger.warning(f"Previous refresh of {mirror} was interrupted.")
+        elif self.config.refresh_cache:
+            logger.info("Option [--refresh-cache]: refreshing cache")
+        elif (mirror / 'objects').is_dir() and \
+                index.is_fresh(self.config.uri, cache_config.refresh_ttl):
+            logger.info(f"Cache {mirror} is fresh, skipping refresh.")
+            self.cache_status = "fresh"
+            return
+
+        index.begin_refresh()
+        git = ["git", "--git-dir", str(mirror)]
+        subprocess.run([*git, "init", "-q", "--bare"], check=True)
+        subprocess.run([*git, "config", "remote.origin.url", self.config.uri], check=True)
+        subprocess.run(
+            [*git, "config", "remote.origin.fetch", "+refs/*:refs/*"], check=True)
+        subprocess.run([*git, "config", "remote.origin.mirror", "true"], check=True)
+        if cache_config.peers:
+            PeerCache(cache_config.peers).seed_git_mirror(
+                mirror, mirror.relative_to(REPO_CACHE_DIR).as_posix())
+        click.secho(f"git --git-dir {mirror} fetch --prune origin", fg="green")
+        subprocess.run([*git, "fetch", "--prune", "origin"], check=True)
+
+        index.record_refresh(self.config.uri)
+        index.end_refresh()
+        index.save()
+        self.cache_status = "refreshed"
+
+        SCCache.schedule_maintenance(self._mirror_host_dir())
+
+    def _mirror_host_dir(self) -> Path:
+        """The directory of the user's git mirrors from the repository's host."""
+        host, _ = split_remote_uri(self.config.uri)
+        return GIT_MIRROR_DIR / host
+
+    def _clone_from_workspace(self, directory: Path):
+        """Clone by borrowing the objects of an existing clone of the same project.
+
+        The new repository gets alternates to the source's objects and a copy of its
+        remote-tracking refs, so only a revision the source doesn't have is fetched.
+        """
+        source = self.config.from_workspace.resolve()
+        logger.info(f"Option [--from-workspace]: borrowing objects from {source}")
+        try:
+            source_git_dir = Path(Repo(source).common_dir).resolve()
+        except (InvalidGitRepositoryError, NoSuchPathError):
+            logger.error(f"{source} is not a git repository.")
+            sys.exit(1)
+
+        try:
+            repo = Repo.init(directory)
+            (Path(repo.git_dir) / "objects" / "info" / "alternates").write_text(
+                f"{source_git_dir / 'objects'}\n")
+            repo.create_remote("origin", self.config.uri)
+            refspecs = ["+refs/remotes/origin/*:refs/remotes/origin/*"]
+            if not self.config.no_tags:
+                refspecs.append("+refs/tags/*:refs/tags/*")
+            repo.git.fetch("--no-tags", str(source_git_dir), *refspecs)
+
+            branch = self.config.branch or self._get_default_branch(source)
+            if not self._checkout(repo, branch):
+                logger.info(f"{branch} not found in {source}, fetching it from origin.")
+                repo.git.fetch("origin")
+                if not self._checkout(repo, branch):
+                    logger.error(f"Revision {branch} not found.")
+                    sys.exit(1)
+        except GitCommandError as e:
+            logger.error(f"Git error {e}")
+            sys.exit(1)
+
+    def _get_default_branch(self, source: Path) -> str:
+        """The remote's default branch as recorded by the source, else its current branch."""
+        source_repo = Repo(source)
+        try:
+            head = source_repo.git.symbolic_ref("--short", "refs/remotes/origin/HEAD")
+            return head.removeprefix("origin/")
+        except GitCommandError:
+            return source_repo.active_branch.name
+
+    def _checkout(self, repo: Repo, ref: str) -> bool:
+        """Check out a branch, tag or commit if the repository has it."""
+        def exists(name: str) -> bool:
+            try:
+                repo.git.rev_parse("--verify", "--quiet", f"{name}^{{commit}}")
+                return True
+            except GitCommandError:
+                return False
+
+        if exists(f"refs/remotes/origin/{ref}"):
+            repo.git.checkout("-b", ref, "--track", f"origin/{ref}")
+        elif exists(f"refs/tags/{ref}"):
+            repo.git.checkout("--detach", f"refs/tags/{ref}")
+        elif FULL_SHA_PATTERN.fullmatch(ref) and exists(ref):
+            repo.git.checkout("--detach", ref)
+        else:
+            return False
+        return True
+
+    def _clone_from_seed(self, directory: Path):
+        """Clone with the project's bundle as the reference, then adopt its packs as
+        the seed's unpacked reference is temporary."""
+        logger.info(f"Option [--seed]: seeding from {self.config.seed}")
+        try:
+            with SeedReference(self.config.seed, directory.parent) as reference:
+                project_reference = reference / f"{bundle_name(self.config.uri)}.git"
+                if not project_reference.is_dir():
+                    logger.warning(f"No bundle for {self.config.uri} in the seed.")
+                    project_reference = None
+                try:
+                    self._clone(directory, reference=project_reference)
+                finally:
+                    if project_reference and (directory / '.git').is_dir():
+                        alternates.adopt_objects(directory / '.git', project_reference)
+        except ScBundleException as e:
+            logger.error(e)
+            sys.exit(1)
+
+    def _clone(self, directory: Path, reference: Path | None = None, dissociate: bool = False):
+        with self.report.phase("ls-remote"):
+            ref_type = self._is_branch_tag_or_sha(self.config.uri, self.config.branch)
+
+        try:
+            is_sha = ref_type == RefType.SHA
+            if is_sha and (self.config.depth or self.config.clone_filter):
+                self._fetch_sha(directory, reference, dissociate)
             else:
+                options = self._get_clone_options()
+                if reference:
+                    options.extend([f"--reference-if-able={reference}"])
+                    if dissociate:
+                        options.append("--dissociate")
+                # A SHA is checked out after a full clone, so the branches git-flow
+                # init needs are there.
+                branch = None if is_sha else self.config.branch
+                cmd = ["git", "clone", *options]
+                if branch:
+                    cmd.extend(["--branch", branch])
+                cmd.extend([self.config.uri, str(directory)])
+                click.secho(" ".join(cmd), fg="green")
+
+                progress = _ReceivedProgress()
                 repo = Repo.clone_from(
                     self.config.uri,
                     directory,
-                    branch=self.config.branch,
-                    multi_options=["--no-tags"] if self.config.no_tags else None
+                    branch=branch,
+                    multi_options=options or None,
+                    progress=progress
                 )
-        except GitCommandError as e:
+                self._bytes_received = progress.bytes_received
+                if is_sha:
+                    repo.git.fetch("origin", self.config.branch)
+                    repo.git.checkout(self.config.branch)
+        except (GitCommandError, subprocess.CalledProcessError) as e:
             logger.error(f"Git error {e}")
-            sys.exit(1)
\ No newline at end of file
+            sys.exit(1)
+
+    def _fetch_sha(
+            self,
+            directory: Path,
+            reference: Path | None = None,
+            dissociate: bool = False
+        ) -> Repo:
+        """Check out a single commit by fetching just that commit into a new repo.
+
+        Only used for shallow or partial clones, the repo has no branches.
+        """
+        fetch_options = []
+        if self.config.depth:
+            fetch_options.append(f"--depth={self.config.depth}")
+        if self.config.clone_filter:
+            fetch_options.append(f"--filter={self.config.clone_filter}")
+        if self.config.no_tags:
+            fetch_options.append("--no-tags")
+
+        click.secho(
+            f"git init {directory} && git fetch {' '.join(fetch_options)} "
+            f"{self.config.uri} {self.config.branch}",
+            fg="green"
+        )
+        repo = Repo.init(directory)
+        git_dir = Path(repo.git_dir)
+        if reference:
+            (git_dir / "objects" / "info" / "alternates").write_text(
+                f"{reference.resolve() / 'objects'}\n")
+        repo.create_remote("origin", self.config.uri)
+        repo.git.fetch(*fetch_options, "origin", self.config.branch)
+        repo.git.checkout("--detach", "FETCH_HEAD")
+        if reference and dissociate:
+            alternates.dissociate(git_dir, reference)
+        return repo
+
+    def _get_clone_options(self) -> list[str]:
+        options = []
+        if self.config.no_tags:
+            options.append("--no-tags")
+        if self.config.depth:
+            options.append(f"--depth={self.config.depth}")
+        if self.config.clone_filter:
+            options.append(f"--filter={self.config.clone_filter}")
+        if self.config.single_branch:
+            options.append("--single-branch")
+        return options
+
+class _ReceivedProgress(RemoteProgress):
+    """Keeps the bytes received from git's clone progress."""
+    def __init__(self):
+        super().__init__()
+        self.bytes_received = 0
+
+    def update(self, op_code, cur_count, max_count=None, message=""):
+        if op_code & RemoteProgress.RECEIVING and message:
+            received = parse_received_bytes(f"Receiving objects: {message}")
+            if received is not None:
+                self.bytes_received = received
@@ -12,17 +12,38 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 from pathlib import Path
 
 from git_flow_library import GitFlowLibrary
 from .git_cloner import GitCloner, GitClonerConfig
+from ..checkpoint import CloneCheckpoint
+from ..timing import TimingReport
+
+logger = logging.getLogger(__name__)
 
 class GitFlowCloner(GitCloner):
     """Clone a git project and initialise it for git-flow."""
-    def __init__(self, config: GitClonerConfig):
-        super().__init__(config)
+    def __init__(self, config: GitClonerConfig, report: TimingReport | None = None):
+        super().__init__(config, report)
 
     def clone(self, directory: Path):
-        """Clones the Git repository and initializes GitFlow in the cloned directory."""
-        super().clone(directory)
-        GitFlowLibrary.init(directory)
\ No newline at end of file
+        """Clones the Git repository and initializes GitFlow in the cloned directory.
+
+        When resuming, a clone that finished is kept and only GitFlow is initialised.
+        """
+        checkpoint = CloneCheckpoint.find(directory) if self.config.resume else None
+        if checkpoint is None:
+            super().clone(directory)
+            checkpoint = CloneCheckpoint(
+                directory / '.git' / CloneCheckpoint.FILE_NAME, self.config.checkpoint_key)
+            checkpoint.save()
+        else:
+            logger.info("Option [--resume]: repository already cloned")
+
+        if not checkpoint.is_done(CloneCheckpoint.GITFLOW):
+            with self.report.phase("gitflow init"):
+                GitFlowLibrary.init(directory)
+            checkpoint.mark_done(CloneCheckpoint.GITFLOW)
+
+        checkpoint.complete()
\ No newline at end of file
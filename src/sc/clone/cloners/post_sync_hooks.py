@@ -0,0 +1,296 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+import logging
+import os
+from pathlib import Path
+import signal
+import subprocess
+import sys
+import time
+from urllib.parse import quote
+import xml.etree.ElementTree as ET
+
+import click
+
+logger = logging.getLogger(__name__)
+
+LOG_DIR_NAME = "sc-post-sync-logs"
+
+@dataclass
+class PostSyncHook:
+    """A post-sync script and how it may be scheduled.
+
+    Hooks not declared `parallel` in the manifest run alone, after every hook listed
+    before them, as they always have. `depends` names hooks that must succeed first,
+    so hook names must be unique.
+    """
+    name: str
+    path: Path | None
+    parallel: bool = False
+    depends: list[str] = field(default_factory=list)
+    timeout: float | None = None
+    status: str = "pending"
+    duration: float = 0
+    log_path: Path | None = None
+
+    @classmethod
+    def from_manifest(cls, repo_dir: Path) -> list["PostSyncHook"]:
+        """Read the post-sync hooks of a workspace's manifest, in manifest order.
+
+        The scheduling attributes are sc's own, so they're read from the manifest
+        files rather than from `repo manifest`, which drops elements it doesn't know.
+
+        Args:
+            repo_dir (Path): The workspace's .repo directory.
+        """
+        manifests_dir = repo_dir / "manifests"
+        manifest_files = [repo_dir / "manifest.xml"]
+        local_manifests_dir = repo_dir / "local_manifests"
+        if local_manifests_dir.is_dir():
+            manifest_files.extend(sorted(local_manifests_dir.glob("*.xml")))
+
+        elements = []
+        seen = set()
+        for manifest_file in manifest_files:
+            elements.extend(_read_post_sync_elements(manifest_file, manifests_dir, seen))
+        return [cls.from_element(element, manifests_dir) for element in elements]
+
+    @classmethod
+    def from_element(cls, element: ET.Element, manifests_dir: Path) -> "PostSyncHook":
+        """Read the scheduling attributes of a manifest post-sync element."""
+        path = element.get("path")
+        depends = element.get("depends", "").replace(",", " ").split()
+
+        timeout = element.get("timeout")
+        try:
+            timeout = float(timeout) if timeout else None
+        except ValueError:
+            logger.warning(f"Ignoring invalid post-sync timeout {timeout!r}")
+            timeout = None
+
+        return cls(
+            name=element.get("name") or path or "<no path>",
+            path=manifests_dir / path if path else None,
+            parallel=_is_true(element.get("parallel", "")),
+            depends=depends,
+            timeout=timeout
+        )
+
+class PostSyncRunner:
+    """Runs post-sync hooks as a dependency graph on a worker pool.
+
+    Parallel hooks' output is captured to a log file per hook, and a timing summary
+    is printed once all hooks have run. A hook is skipped if a hook it depends on
+    fails, failures of hooks it only follows in order don't stop it.
+    """
+    def __init__(self, hooks: list[PostSyncHook], log_dir: Path, jobs: int | None = None):
+        self.hooks = hooks
+        self.log_dir = log_dir
+        self.jobs = jobs or os.cpu_count() or 1
+
+    def run(self):
+        if not self.hooks:
+            return
+
+        try:
+            after, explicit = self._build_graph()
+        except ValueError as e:
+            logger.warning(f"{e}. Running post-sync hooks one at a time in manifest order.")
+            for hook in self.hooks:
+                hook.parallel = False
+            after = {i: set(range(i)) for i in range(len(self.hooks))}
+            explicit = {i: set() for i in range(len(self.hooks))}
+
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        running: dict[Future, int] = {}
+        pending = set(range(len(self.hooks)))
+        done: set[int] = set()
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            while pending or running:
+                for i in sorted(pending):
+                    if not after[i] <= done:
+                        continue
+                    hook = self.hooks[i]
+                    # Undeclared hooks may prompt, so they run on their own.
+                    if not hook.parallel and running:
+                        continue
+                    if any(not self.hooks[r].parallel for r in running.values()):
+                        break
+
+                    pending.discard(i)
+                    failed = [self.hooks[d].name for d in explicit[i]
+                              if self.hooks[d].status != "ok"]
+                    if failed:
+                        logger.warning(f"Skipping post-sync hook {hook.name}, "
+                                       f"dependency {', '.join(failed)} failed.")
+                        hook.status = "skipped"
+                        done.add(i)
+                        continue
+                    running[pool.submit(self._run_hook, hook)] = i
+
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    done.add(running.pop(future))
+
+        self._print_summary()
+
+    def _build_graph(self) -> tuple[dict[int, set[int]], dict[int, set[int]]]:
+        """Work out which hooks each hook must run after.
+
+        Returns:
+            tuple: For each hook index, all the hooks it runs after, and the subset
+                it explicitly depends on.
+
+        Raises:
+            ValueError: If hook names aren't unique, a hook depends on an unknown hook
+                or the graph has a cycle.
+        """
+        indices = {}
+        for i, hook in enumerate(self.hooks):
+            if hook.name in indices:
+                raise ValueError(f"Post-sync hook name {hook.name} is used more than once")
+            indices[hook.name] = i
+        after: dict[int, set[int]] = {}
+        explicit: dict[int, set[int]] = {}
+        last_serial = None
+        for i, hook in enumerate(self.hooks):
+            explicit[i] = set()
+            for name in hook.depends:
+                if name not in indices:
+                    raise ValueError(f"Post-sync hook {hook.name} depends on unknown hook {name}")
+                explicit[i].add(indices[name])
+
+            if hook.parallel:
+                after[i] = set(explicit[i])
+                if last_serial is not None:
+                    after[i].add(last_serial)
+            else:
+                after[i] = set(range(i)) | explicit[i]
+                last_serial = i
+
+        self._check_acyclic(after)
+        return after, explicit
+
+    def _check_acyclic(self, after: dict[int, set[int]]):
+        visiting, visited = set(), set()
+
+        def visit(i: int):
+            if i in visited:
+                return
+            if i in visiting:
+                raise ValueError(f"Post-sync hook dependencies form a cycle at {self.hooks[i].name}")
+            visiting.add(i)
+            for dep in after[i]:
+                visit(dep)
+            visiting.discard(i)
+            visited.add(i)
+
+        for i in after:
+            visit(i)
+
+    def _run_hook(self, hook: PostSyncHook):
+        if not hook.path:
+            logger.warning(
+                "post-sync element has no path attribute and is being skipped!")
+            hook.status = "skipped"
+            return
+
+        if not os.access(hook.path, os.X_OK):
+            logger.warning(
+                f"post-sync path {hook.path} is not executable and is being skipped!")
+            hook.status = "skipped"
+            return
+
+        # Parallel hooks would interleave their output, so it goes to a log instead.
+        # Serial hooks keep the terminal as they may prompt.
+        if hook.parallel:
+            hook.log_path = self.log_dir / f"{quote(hook.name, safe='')}.log"
+        click.secho(f"Running post-sync hook {hook.name}", fg="green")
+        start = time.monotonic()
+        with open(hook.log_path, "w") if hook.log_path else nullcontext() as log:
+            process = subprocess.Popen(
+                str(hook.path),
+                shell=True,
+                stdin=subprocess.DEVNULL if hook.parallel else None,
+                stdout=log,
+                stderr=subprocess.STDOUT if log else None,
+                # Own process group so a timeout kills the whole script.
+                start_new_session=hook.timeout is not None
+            )
+            try:
+                returncode = process.wait(timeout=hook.timeout)
+            except subprocess.TimeoutExpired:
+                os.killpg(process.pid, signal.SIGKILL)
+                process.wait()
+                returncode = None
+        hook.duration = time.monotonic() - start
+
+        if returncode is None:
+            hook.status = "timeout"
+            logger.error(f"post-sync hook {hook.name} timed out after {hook.timeout}s")
+        elif returncode != 0:
+            hook.status = "failed"
+            logger.error(f"post-sync hook {hook.name} exited with {returncode}")
+        else:
+            hook.status = "ok"
+
+    def _print_summary(self):
+        click.secho("Post-sync hooks:", bold=True)
+        width = max(len(hook.name) for hook in self.hooks)
+        for hook in self.hooks:
+            colour = "green" if hook.status == "ok" else "red"
+            click.echo(
+                f"   {hook.name:<{width}}  "
+                + click.style(f"{hook.status:<8}", fg=colour)
+                + f"  {hook.duration:6.1f}s"
+                + (f"  {hook.log_path}" if hook.log_path else "")
+            )
+
+def _is_true(value) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes")
+    return bool(value)
+
+def _read_post_sync_elements(
+        manifest_file: Path,
+        manifests_dir: Path,
+        seen: set[Path]
+    ) -> list[ET.Element]:
+    """The post-sync elements of a manifest file and the files it includes, in order."""
+    manifest_file = manifest_file.resolve()
+    if manifest_file in seen:
+        return []
+    seen.add(manifest_file)
+
+    try:
+        root = ET.parse(manifest_file).getroot()
+    except (OSError, ET.ParseError) as e:
+        logger.error(f"Failed to read post-sync hooks from {manifest_file}: {e}")
+        sys.exit(1)
+
+    elements = []
+    for element in root:
+        if element.tag == "include" and element.get("name"):
+            elements.extend(_read_post_sync_elements(
+                manifests_dir / element.get("name"), manifests_dir, seen))
+        elif element.tag == "post-sync":
+            elements.append(element)
+    return elements
@@ -12,24 +12,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
 from pathlib import Path
 import shutil
 import subprocess
 import sys
+import tempfile
+import time
 
 from pydantic import BaseModel
 
 from .cloner import Cloner, RefType
-from repo_library import RepoLibrary
+from .post_sync_hooks import LOG_DIR_NAME, PostSyncHook, PostSyncRunner
+from .repo_tool import RepoTool
+from .sync_jobs import SyncJobs, auto_sync_jobs
+from ..bundle import ScBundleException, SeedReference
+from ..cache import (CacheConfig, CacheIndex, CacheLock, CacheLockTimeout, REPO_CACHE_DIR,
+                     PeerCache, SCCache, shared_repo_mirror)
+from ..cache.alternates import adopt_objects, borrows_from, iter_alternates, stop_borrowing
+from ..checkpoint import CloneCheckpoint
+from ..timing import TimingReport, pack_bytes_since
 from sc.branching import SCBranching
-from sc_manifest_parser import ScManifest
+from sc.sparse_checkout import SparseProfiles
 
 logger = logging.getLogger(__name__)
 
-REPO_CACHE_DIR = Path.home() / ".caches"
-
 class RepoClonerConfig(BaseModel):
     """
     Attributes:
@@ -45,6 +54,30 @@ class RepoClonerConfig(BaseModel):
         repo_rev (str | None): The rev from the repo_url to be used. Defaults to None
             which uses the default revision.
         verify (bool): If True stops repo asking the user to run hooks. Defaults to False.
+        refresh_cache (bool): If True refresh the cache even if it is still fresh.
+            Defaults to False.
+        depth (int | None): Shallow clone projects to this many commits. Defaults to
+            None which fetches full history.
+        clone_filter (str | None): Partial clone projects with this filter, e.g.
+            "blob:none". Defaults to None.
+        current_branch (bool): Only fetch the manifest revision of each project.
+            Defaults to False.
+        jobs (int | None): Number of projects to sync at once. Defaults to None.
+        jobs_network (int | None): Number of projects to fetch at once, overrides jobs.
+        jobs_checkout (int | None): Number of projects to check out at once, overrides
+            jobs. If none of the jobs are set they're picked from the CPU count and
+            the latency to the manifest host.
+        seed (Path | None): Bundle set to seed the clone from instead of the cache.
+        from_workspace (Path | None): Existing workspace to borrow objects from instead
+            of the cache.
+        dissociate (bool): Copy the objects borrowed from the from_workspace source
+            into the clone so it doesn't depend on the source. Defaults to False.
+        groups (str | None): Only sync the manifest projects in these comma separated
+            groups, e.g. "middleware,-test". Defaults to None which syncs the default
+            group.
+        resume (bool): Continue an interrupted clone from its checkpoint, syncing only
+            the projects that are missing or partial. Defaults to False.
+        checkpoint_key (dict): What the clone is of, recorded in its checkpoint.
     """
     uri: str
     branch: str | None = None
@@ -55,89 +88,664 @@ class RepoClonerConfig(BaseModel):
     repo_rev: str | None = None
     no_repo_verify: bool = False
     verify: bool = False
+    refresh_cache: bool = False
+    depth: int | None = None
+    clone_filter: str | None = None
+    current_branch: bool = False
+    jobs: int | None = None
+    jobs_network: int | None = None
+    jobs_checkout: int | None = None
+    groups: str | None = None
+    seed: Path | None = None
+    from_workspace: Path | None = None
+    dissociate: bool = False
+    resume: bool = False
+    checkpoint_key: dict = {}
 
 class RepoCloner(Cloner):
     """For cloning Git repositories using a manifest file and initializing GitFlow."""
     def __init__(
             self,
             config: RepoClonerConfig,
+            report: TimingReport | None = None
         ):
         self.config = config
+        self.report = report or TimingReport()
+        self._sync_jobs = None
+        self._ref_type = None
+        self._checkpoint = None
+        self._prepared = False
+        self._reference = None
+        self._reference_is_shared = False
 
     def clone(self, directory: Path):
         """
         Clones the Git repository using the provided manifest, synchronizes it, and initializes GitFlow.
         This method:
-        - Creates a cache if requested.
+        - Seeds the clone from a bundle set, or creates a cache if requested.
         - Resolves the target directory for cloning.
         - Initializes and syncs the repository using `git_repo_utils`.
         - Parses the manifest to retrieve projects.
         - Initializes GitFlow for all unlocked projects.
+
+        Progress is checkpointed in the workspace so an interrupted clone can be
+        resumed, skipping the steps that already finished.
+        """
+        checkpoint = CloneCheckpoint.find(directory) if self.config.resume else None
+        self._checkpoint = checkpoint or CloneCheckpoint(
+            directory / '.repo' / CloneCheckpoint.FILE_NAME, self.config.checkpoint_key)
+
+        if self._checkpoint.is_done(CloneCheckpoint.SYNC):
+            logger.info("Option [--resume]: workspace already synced")
+        elif self.config.from_workspace:
+            self._clone_from_workspace(directory)
+        elif self.config.seed:
+            self._clone_from_seed(directory)
+        else:
+            self._clone_with_cache(directory)
+
+        if not self._checkpoint.is_done(CloneCheckpoint.GITFLOW):
+            with self.report.phase("gitflow init"):
+                SCBranching.init(directory)
+            self._checkpoint.mark_done(CloneCheckpoint.GITFLOW)
+
+        if not self._checkpoint.is_done(CloneCheckpoint.HOOKS):
+            with self.report.phase("post-sync hooks"):
+                hooks = PostSyncHook.from_manifest(directory / '.repo')
+                PostSyncRunner(hooks, log_dir=directory / '.repo' / LOG_DIR_NAME).run()
+            self._checkpoint.mark_done(CloneCheckpoint.HOOKS)
+
+        self._checkpoint.complete()
+
+    def prepare(self):
+        """Resolve the revision and refresh the cache ahead of the clone.
+
+        A shared mirror of the manifest host, if an admin configured one, is used in
+        place of the user's cache and is never refreshed by sc.
+
+        When several projects are cloned at once this runs for each of them before
+        any syncs start, so projects on the same manifest host take turns refreshing
+        its mirror rather than queueing for its lock behind each other's syncs.
+        """
+        if self._prepared:
+            return
+        self._prepared = True
+
+        if self._ref_type is None:
+            with self.report.phase("ls-remote"):
+                self._ref_type = self._is_branch_tag_or_sha(self.config.uri, self.config.branch)
+
+        if self.config.cache and not (self.config.seed or self.config.from_workspace):
+            cache_config = CacheConfig.load()
+            hostname = self._get_manifest_hostname(self.config.uri)
+            if shared_mirror := shared_repo_mirror(hostname, cache_config):
+                logger.info(f"Using shared mirror {shared_mirror}")
+                self._reference = shared_mirror
+                self._reference_is_shared = True
+                self.cache_status = "shared"
+            else:
+                self._reference = self._cache(cache_config)
+
+    def _clone_with_cache(self, directory: Path):
+        """Clone with the cache as the reference.
+
+        The user's cache is held shared while it's used as a reference so it can't be
+        refreshed under us, and the clone goes ahead without it if it stays busy.
+        Shared mirrors are read-only and kept up to date by their owner.
+        """
+        self.prepare()
+        reference = self._reference
+        if not reference or self._reference_is_shared:
+            self._init_and_sync(directory, reference=reference)
+            return
+
+        try:
+            with CacheLock(reference, CacheConfig.load().lock_timeout).shared():
+                self._init_and_sync(directory, reference=reference)
+                self._record_cache_use(reference, directory)
+        except CacheLockTimeout as e:
+            logger.warning(f"{e}. Cloning without the cache.")
+            self._init_and_sync(directory)
+
+    def _clone_from_seed(self, directory: Path):
+        """Clone using a bundle set as the reference, fetching only the delta.
+
+        The seed's unpacked reference is temporary, so the workspace adopts the packs
+        it borrows from it afterwards, even if the sync failed and is to be resumed.
+        """
+        logger.info(f"Option [--seed]: seeding from {self.config.seed}")
+        try:
+            with SeedReference(self.config.seed, directory.parent) as reference:
+                try:
+                    self._init_and_sync(directory, reference=reference)
+                finally:
+                    for git_dir, alts in iter_alternates(directory / '.repo'):
+                        if borrows_from(alts, reference):
+                            adopt_objects(git_dir, reference)
+        except ScBundleException as e:
+            logger.error(e)
+            sys.exit(1)
+
+    def _clone_from_workspace(self, directory: Path):
+        """Clone by borrowing an existing workspace's projects, without the network.
+
+        The manifest is initialised from the source's manifest repository when the
+        source is on the requested revision, and each project's git directory is
+        seeded from the source's with alternates to its objects, so a local-only
+        sync checks everything out. Only projects the source doesn't have, or whose
+        revision it doesn't have, are fetched. The repo tool is taken from the
+        source too.
+
+        The clone depends on the source's objects unless dissociate copies them
+        in and stops borrowing.
+        """
+        source = self.config.from_workspace.resolve()
+        if not (source / '.repo').is_dir():
+            logger.error(f"{source} is not a repo workspace.")
+            sys.exit(1)
+        logger.info(f"Option [--from-workspace]: borrowing objects from {source}")
+
+        repo_tool = source / '.repo' / 'repo'
+        if (repo_tool / '.git').exists():
+            self.config.repo_url = str(repo_tool)
+            self.config.no_repo_verify = True
+
+        if not self._init_from_source_manifests(directory, source):
+            self._init_repo(directory, reference=source)
+        self._checkpoint.save()
+
+        sparse = SparseProfiles.load(directory)
+        try:
+            borrowed, missing = self._borrow_projects(directory, source)
+            if missing:
+                logger.info(f"{len(missing)} projects aren't in {source}, fetching them.")
+                self._sync(directory, projects=missing, sparse=sparse)
+            if borrowed:
+                try:
+                    self._sync(directory, projects=borrowed, sparse=sparse, local_only=True)
+                except subprocess.CalledProcessError:
+                    logger.info(f"Some revisions aren't in {source}, fetching them.")
+                    self._sync(directory, projects=borrowed, sparse=sparse)
+            if self.config.dissociate:
+                self._dissociate_projects(directory, source)
+            else:
+                logger.warning(f"{directory} borrows objects from {source} and stops "
+                               "working if it's deleted. Clone with --dissociate to "
+                               "copy them in.")
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Failed to clone from {source}: {e}")
+            sys.exit(1)
+        self._checkpoint.mark_done(CloneCheckpoint.SYNC)
+
+    def _init_from_source_manifests(self, directory: Path, source: Path) -> bool:
+        """Initialise the workspace from the source's manifest repository.
+
+        A workspace's manifest checkout only has the revision it was initialised
+        with as a branch (named default), so this is only possible when that's the
+        requested revision. The manifest remote is then pointed back at the real
+        one, with the source's remote branches, so later syncs update as usual.
+
+        Returns:
+            bool: Whether the workspace was initialised, False if the source is on
+                another revision and the manifest must be fetched.
+        """
+        manifests = source / '.repo' / 'manifests'
+        result = subprocess.run(
+            ["git", "-C", str(manifests), "config", "branch.default.merge"],
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        source_ref = result.stdout.strip()
+        branch = self.config.branch
+        if not source_ref or not branch or \
+                source_ref not in (branch, f"refs/heads/{branch}", f"refs/tags/{branch}"):
+            logger.info(f"{source} isn't on manifest revision {branch or 'default'}, "
+                        "fetching the manifest.")
+            return False
+
+        git = ["git", "-C", str(directory / '.repo' / 'manifests')]
+        try:
+            with self.report.phase("repo init"):
+                RepoTool.init(
+                    str(manifests),
+                    directory,
+                    branch="default",
+                    manifest=self.config.manifest,
+                    groups=self.config.groups,
+                    repo_url=self.config.repo_url,
+                    repo_rev=self.config.repo_rev,
+                    no_repo_verify=self.config.no_repo_verify,
+                    current_branch=self.config.current_branch
+                )
+                subprocess.run([*git, "remote", "set-url", "origin", self.config.uri], check=True)
+                subprocess.run(
+                    [*git, "fetch", "-q", str(manifests),
+                     "+refs/remotes/origin/*:refs/remotes/origin/*"],
+                    check=True
+                )
+                subprocess.run([*git, "config", "branch.default.merge", source_ref], check=True)
+        except subprocess.CalledProcessError as e:
+            logger.error(f"repo init error: {e}")
+            sys.exit(1)
+        return True
+
+    def _borrow_projects(self, directory: Path, source: Path) -> tuple[list[str], list[str]]:
+        """Seed the workspace's project git directories from the source's.
+
+        Each project gets its own object directory borrowing the source's objects
+        through alternates, and a copy of the source's git directory (config and
+        refs) using it, which is what repo needs to check the project out offline.
+
+        Returns:
+            tuple[list[str], list[str]]: Paths of the projects seeded, and of those
+                the source doesn't have.
+        """
+        borrowed, missing = [], []
+        for path, name in RepoTool.list_projects(directory).items():
+            source_gitdir = source / '.repo' / 'projects' / f"{path}.git"
+            source_objdir = source / '.repo' / 'project-objects' / f"{name}.git"
+            if not (source_gitdir.is_dir() and source_objdir.is_dir()):
+                missing.append(path)
+                continue
+
+            objdir = directory / '.repo' / 'project-objects' / f"{name}.git"
+            if not objdir.is_dir():
+                subprocess.run(["git", "init", "-q", "--bare", str(objdir)], check=True)
+                (objdir / 'objects' / 'info' / 'alternates').write_text(
+                    f"{(source_objdir / 'objects').resolve()}\n")
+
+            gitdir = directory / '.repo' / 'projects' / f"{path}.git"
+            if not gitdir.is_dir():
+                shutil.copytree(
+                    source_gitdir,
+                    gitdir,
+                    symlinks=True,
+                    ignore=lambda d, names: ["objects"] if Path(d) == source_gitdir else []
+                )
+                (gitdir / 'objects').symlink_to(
+                    os.path.relpath(objdir / 'objects', gitdir))
+            borrowed.append(path)
+        return borrowed, missing
+
+    def _dissociate_projects(self, directory: Path, source: Path):
+        """Copy the objects borrowed from the source into the workspace.
+
+        Refs live in the project git directories and objects in the object
+        directories, which projects of the same name share, so every project is
+        repacked, keeping the other projects' packs, before any stops borrowing.
+        """
+        logger.info(f"Option [--dissociate]: copying the objects borrowed from {source}")
+        git_dirs = [
+            directory / '.repo' / 'projects' / f"{path}.git"
+            for path in RepoTool.list_projects(directory)
+        ]
+
+        def repack(git_dir: Path):
+            subprocess.run(
+                ["git", "--git-dir", str(git_dir), "repack", "-a", "-q"], check=True)
+
+        with ThreadPoolExecutor(max_workers=self._get_sync_jobs().network or os.cpu_count()) \
+                as pool:
+            list(pool.map(repack, [git_dir for git_dir in git_dirs if git_dir.is_dir()]))
+
+        for objdir, alts in iter_alternates(directory / '.repo' / 'project-objects'):
+            if borrows_from(alts, source):
+                stop_borrowing(objdir, source)
+
+    def _init_and_sync(
+            self,
+            directory: Path,
+            reference: Path | None = None,
+            dissociate: bool = False
+        ):
+        """Initialise and sync the workspace, or finish syncing an interrupted one.
+
+        repo init is re-run when resuming as it's cheap in an existing workspace and
+        points it at this run's reference. Only the projects that are missing or
+        partial are synced again.
+
+        Projects with sparse checkout profiles are partially cloned, unless every
+        project already is, so they only fetch the blobs their profile checks out.
         """
-        reference = self._cache() if self.config.cache else None
+        self._init_repo(directory=directory, reference=reference, dissociate=dissociate)
+        sparse = SparseProfiles.load(directory)
+        if sparse and not self.config.clone_filter:
+            logger.info(
+                f"Sparse checkout profiles for {len(sparse.profiles)} projects, "
+                "partially cloning them")
+            self._init_repo(
+                directory=directory,
+                reference=reference,
+                dissociate=dissociate,
+                clone_filter="blob:none",
+                partial_clone_exclude=[
+                    name for path, name in sparse.names.items() if not sparse.get(path)
+                ]
+            )
+        self._checkpoint.save()
+
+        projects = None
+        if self.config.resume:
+            projects = self._get_incomplete_projects(directory)
+            if not projects:
+                logger.info("All projects are synced, nothing to resume.")
+                self._checkpoint.mark_done(CloneCheckpoint.SYNC)
+                return
+            logger.info(f"Option [--resume]: syncing {len(projects)} incomplete projects")
+
+        try:
+            self._sync(directory, projects=projects, sparse=sparse)
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Failed to sync {directory}, run the clone again with "
+                         f"--resume to continue: {e}")
+            sys.exit(1)
+        self._checkpoint.mark_done(CloneCheckpoint.SYNC)
+
+    def _get_incomplete_projects(self, directory: Path) -> list[str]:
+        """Paths of the workspace's projects that are missing or were left partial.
+
+        A project is complete once its work tree has a valid HEAD and no git
+        operation was left holding its index. Stale locks of incomplete projects
+        are removed so their sync can be retried.
+        """
+        try:
+            projects = RepoTool.list_projects(directory)
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Failed to list the workspace's projects: {e}")
+            sys.exit(1)
+
+        def is_complete(path: str) -> bool:
+            worktree = directory / path
+            if not (worktree / '.git').exists() or (worktree / '.git' / 'index.lock').exists():
+                return False
+            result = subprocess.run(
+                ["git", "-C", str(worktree), "rev-parse", "-q", "--verify", "HEAD^{commit}"],
+                capture_output=True,
+                check=False
+            )
+            return result.returncode == 0
 
-        self._init_repo(directory=directory, reference=reference)
-        RepoLibrary.sync(
-            directory,
-            verify=self.config.verify
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            complete = dict(zip(projects, pool.map(is_complete, projects)))
+
+        incomplete = [path for path, done in complete.items() if not done]
+        for path in incomplete:
+            self._remove_stale_locks(directory, path, projects[path])
+        return incomplete
+
+    def _remove_stale_locks(self, directory: Path, path: str, name: str):
+        git_dirs = (
+            directory / '.repo' / 'projects' / f"{path}.git",
+            directory / '.repo' / 'project-objects' / f"{name}.git",
+            directory / path / '.git'
+        )
+        for git_dir in git_dirs:
+            if not git_dir.is_dir():
+                continue
+            for lock in git_dir.rglob("*.lock"):
+                logger.debug(f"Removing stale lock {lock}")
+                lock.unlink(missing_ok=True)
+
+    def _sync(
+            self,
+            directory: Path,
+            mirror: bool = False,
+            projects: list[str] | None = None,
+            sparse: SparseProfiles | None = None,
+            local_only: bool = False
+        ):
+        """Sync a workspace, or a mirror which only fetches, recording its timing.
+
+        With sparse checkout profiles the projects are fetched first, then set up
+        for sparse checkout before anything is checked out. With local_only nothing
+        is fetched, projects are checked out from the objects they already have.
+        """
+        sync_jobs = self._get_sync_jobs()
+        sync_args = dict(
+            verify=self.config.verify,
+            current_branch=not mirror and self.config.current_branch,
+            jobs=sync_jobs.jobs,
+            jobs_network=sync_jobs.network,
+            jobs_checkout=None if mirror else sync_jobs.checkout,
+            projects=projects
         )
+        with self.report.phase("repo sync") as phase, \
+                tempfile.TemporaryDirectory() as tmp_dir:
+            event_logs = [Path(tmp_dir) / "events.json"]
+            start = time.time()
+            if sparse:
+                if not local_only:
+                    RepoTool.sync(
+                        directory, network_only=True, event_log=event_logs[0], **sync_args)
+                sparse.prepare(directory)
+                event_logs.append(Path(tmp_dir) / "checkout-events.json")
+                RepoTool.sync(
+                    directory, local_only=True, event_log=event_logs[-1], **sync_args)
+            else:
+                RepoTool.sync(
+                    directory, local_only=local_only, event_log=event_logs[0], **sync_args)
+            phase.bytes_received = pack_bytes_since(self._object_dirs(directory, mirror), start)
+            if not mirror:
+                for event_log in event_logs:
+                    self.report.add_repo_event_log(event_log)
 
-        SCBranching.init(directory)
+    @staticmethod
+    def _object_dirs(directory: Path, mirror: bool = False) -> list[Path]:
+        """Where a sync writes packs, so they can be found without walking the
+        checked out files."""
+        if mirror:
+            return [directory]
+        return [directory / '.repo' / 'project-objects', directory / '.repo' / 'projects']
 
-        manifest = ScManifest.from_repo_root(directory / '.repo')
-        manifests_dir = Path(directory, '.repo', 'manifests')
-        for hook in manifest.post_sync_scripts:
-            self._run_post_sync_script(manifests_dir / hook.path)
+    def _cache(self, cache_config: CacheConfig) -> Path | None:
+        """Creates or refreshes the cache of a project.
 
-    def _cache(self) -> Path:
-        """Creates a cache of a project.
+        The mirror is updated in place under an exclusive lock and the refresh is
+        skipped entirely if this manifest refreshed it within the configured TTL.
 
         Returns:
-            Path: The directory of the mirrored cache.
+            Path | None: The directory of the mirrored cache, or None if the cache
+                is busy or couldn't be refreshed and the clone should go ahead
+                without it.
         """
         REPO_CACHE_DIR.mkdir(exist_ok=True)
         manifest_hostname = self._get_manifest_hostname(self.config.uri)
         host_cache_dir = Path(REPO_CACHE_DIR / manifest_hostname)
         host_cache_dir.mkdir(exist_ok=True)
 
-        # .repo file must be removed to run repo init --mirror
+        try:
+            with CacheLock(host_cache_dir, cache_config.lock_timeout).exclusive(), \
+                    self.report.phase("cache refresh"):
+                self._refresh_cache(host_cache_dir, cache_config)
+        except CacheLockTimeout as e:
+            logger.warning(f"{e}. Cloning without the cache.")
+            self.cache_status = "busy"
+            return None
+        except subprocess.CalledProcessError as e:
+            # The index keeps the refresh marked as in progress, so the next
+            # refresh syncs the whole mirror again.
+            logger.warning(f"Failed to refresh cache {host_cache_dir}, cloning without it: {e}")
+            self.cache_status = "failed"
+            return None
+        return host_cache_dir
+
+    def _refresh_cache(self, host_cache_dir: Path, cache_config: CacheConfig):
+        """Refresh the mirror. Must be called holding the cache's exclusive lock."""
+        index = CacheIndex(host_cache_dir)
+        cache_key = self._get_cache_key()
+        if index.refresh_interrupted:
+            logger.warning(f"Previous refresh of {host_cache_dir} was interrupted.")
+        elif self.config.refresh_cache:
+            logger.info("Option [--refresh-cache]: refreshing cache")
+        elif (host_cache_dir / '.repo').exists() and \
+                index.is_fresh(cache_key, cache_config.refresh_ttl):
+            logger.info(f"Cache {host_cache_dir} is fresh, skipping refresh.")
+            self.cache_status = "fresh"
+            return
+
+        sync_all = index.refresh_interrupted or self.config.refresh_cache
+        index.begin_refresh()
+        self._init_mirror(host_cache_dir)
+        projects = self._get_mirror_projects(host_cache_dir)
+        # None syncs every project of the manifest.
+        to_sync = None
+        if projects is not None:
+            index.record_manifest(cache_key, projects)
+            if not sync_all:
+                to_sync = self._get_stale_projects(
+                    host_cache_dir, index, projects, cache_config.refresh_ttl)
+                if len(to_sync) == len(projects):
+                    to_sync = None
+                elif to_sync:
+                    logger.info(f"Syncing {len(to_sync)} of {len(projects)} projects, the "
+                                "rest were synced recently for other manifests.")
+                else:
+                    logger.info("All projects were synced recently for other manifests.")
+
+        if to_sync != []:
+            if cache_config.peers and projects:
+                PeerCache(cache_config.peers, self._get_sync_jobs().network).seed_repo_mirror(
+                    host_cache_dir, host_cache_dir.name, to_sync or projects)
+            self._sync(host_cache_dir, mirror=True, projects=to_sync)
+            index.record_sync(to_sync or projects or [])
+
+        index.record_refresh(cache_key)
+        index.end_refresh()
+        index.save()
+        self.cache_status = "refreshed"
+
+        SCCache.schedule_maintenance(host_cache_dir)
+
+    def _get_mirror_projects(self, host_cache_dir: Path) -> list[str] | None:
+        """Names of the projects the mirror's current manifest needs, or None if they
+        couldn't be listed."""
+        try:
+            return sorted(set(RepoTool.list_projects(host_cache_dir).values()))
+        except subprocess.CalledProcessError as e:
+            logger.warning(f"Couldn't list the projects of {host_cache_dir}, syncing all: {e}")
+            return None
+
+    @staticmethod
+    def _get_stale_projects(
+            host_cache_dir: Path,
+            index: CacheIndex,
+            projects: list[str],
+            ttl: int
+        ) -> list[str]:
+        """Projects not synced within ttl, or not in the mirror e.g. after eviction."""
+        stale = set(index.stale_projects(projects, ttl))
+        return [
+            name for name in projects
+            if name in stale or not (host_cache_dir / f"{name}.git").is_dir()
+        ]
+
+    def _record_cache_use(self, host_cache_dir: Path, directory: Path):
+        """Record the workspace and the mirrors it borrows from for cache eviction."""
+        index = CacheIndex(host_cache_dir)
+        index.register_workspace(directory)
+        for _, alternates in iter_alternates(directory / '.repo'):
+            for alternate in alternates:
+                # Alternates point at <mirror>.git/objects
+                mirror = alternate.parent
+                if mirror.suffix == ".git" and host_cache_dir.resolve() in mirror.parents:
+                    index.record_use(mirror)
+
+    def _init_mirror(self, host_cache_dir: Path):
+        """Initialise the mirror, reusing an existing one where possible.
+
+        Re-running repo init in place only updates the manifest, so the mirrored
+        projects are fetched incrementally rather than re-created.
+        """
         if Path(host_cache_dir / '.repo').exists():
-            shutil.rmtree(host_cache_dir / '.repo')
+            try:
+                self._run_repo_init(host_cache_dir, mirror=True)
+                return
+            except subprocess.CalledProcessError as e:
+                logger.warning(f"Failed to update cache in place, re-initialising: {e}")
+                shutil.rmtree(host_cache_dir / '.repo')
 
         self._init_repo(host_cache_dir, mirror=True)
-        RepoLibrary.sync(
-            directory=host_cache_dir,
-            verify=self.config.verify
-        )
-        return host_cache_dir
 
-    def _init_repo(self, directory: Path, mirror: bool = False, reference: Path | None = None):
+    def _init_repo(
+            self,
+            directory: Path,
+            mirror: bool = False,
+            reference: Path | None = None,
+            dissociate: bool = False,
+            clone_filter: str | None = None,
+            partial_clone_exclude: list[str] | None = None
+        ):
+        try:
+            with self.report.phase("repo init"):
+                self._run_repo_init(
+                    directory,
+                    mirror=mirror,
+                    reference=reference,
+                    dissociate=dissociate,
+                    clone_filter=clone_filter,
+                    partial_clone_exclude=partial_clone_exclude
+                )
+        except subprocess.CalledProcessError as e:
+            logger.error(f"repo init error: {e}")
+            sys.exit(1)
+
+    def _run_repo_init(
+            self,
+            directory: Path,
+            mirror: bool = False,
+            reference: Path | None = None,
+            dissociate: bool = False,
+            clone_filter: str | None = None,
+            partial_clone_exclude: list[str] | None = None
+        ):
         # If mirror is true we're creating a cache
-        groups = "default,-notcached" if mirror else None
+        groups = "default,-notcached" if mirror else self.config.groups
 
-        ref_type = self._is_branch_tag_or_sha(self.config.uri, self.config.branch)
+        if self._ref_type is None:
+            with self.report.phase("ls-remote"):
+                self._ref_type = self._is_branch_tag_or_sha(self.config.uri, self.config.branch)
 
-        if ref_type == RefType.TAG:
+        if self._ref_type == RefType.TAG:
             ref = f"refs/tags/{self.config.branch}"
         else:
             ref = self.config.branch
 
-        try:
-            RepoLibrary.init(
-                self.config.uri,
-                branch = ref,
-                directory = directory,
-                manifest = self.config.manifest,
-                mirror = mirror,
-                reference = reference,
-                groups = groups,
-                repo_url = self.config.repo_url,
-                no_repo_verify = self.config.no_repo_verify,
-                repo_rev = self.config.repo_rev,
+        # Mirrors stay complete so any clone can reference them.
+        RepoTool.init(
+            self.config.uri,
+            branch = ref,
+            directory = directory,
+            manifest = self.config.manifest,
+            mirror = mirror,
+            reference = reference,
+            dissociate = dissociate,
+            groups = groups,
+            repo_url = self.config.repo_url,
+            no_repo_verify = self.config.no_repo_verify,
+            repo_rev = self.config.repo_rev,
+            depth = None if mirror else self.config.depth,
+            clone_filter = None if mirror else clone_filter or self.config.clone_filter,
+            partial_clone_exclude = None if mirror else partial_clone_exclude,
+            current_branch = not mirror and self.config.current_branch,
+        )
+
+    def _get_sync_jobs(self) -> SyncJobs:
+        """The configured sync job counts, or automatic ones if none are configured."""
+        if self._sync_jobs is None:
+            self._sync_jobs = SyncJobs(
+                jobs=self.config.jobs,
+                network=self.config.jobs_network,
+                checkout=self.config.jobs_checkout
             )
-        except subprocess.CalledProcessError as e:
-            logger.error(f"repo init error: {e}")
-            sys.exit(1)
+            if not any((self._sync_jobs.jobs, self._sync_jobs.network, self._sync_jobs.checkout)):
+                self._sync_jobs = auto_sync_jobs(self.config.uri)
+                logger.info(f"Automatic sync jobs: {self._sync_jobs}")
+        return self._sync_jobs
+
+    def _get_cache_key(self) -> str:
+        """Identifies the manifest a cache refresh was made for."""
+        return f"{self.config.uri}|{self.config.branch or ''}|{self.config.manifest or ''}"
 
     def _get_manifest_hostname(self, url: str) -> str:
         """Extracts the hostname from a given URL.
@@ -150,16 +758,3 @@ class RepoCloner(Cloner):
         url = url.split(":", 1)[0]
         url = url.split("/", 1)[0]
         return url
-
-    def _run_post_sync_script(self, path: Path):
-        if not path:
-            logger.warning(
-                "post-sync element has no path attribute and is being skipped!")
-            return
-
-        if not os.access(path, os.X_OK):
-            logger.warning(
-                f"post-sync path {path} is not executable and is being skipped!")
-            return
-
-        subprocess.run(str(path), shell=True)
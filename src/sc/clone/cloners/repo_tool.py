@@ -0,0 +1,148 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+from pathlib import Path
+import subprocess
+
+import click
+
+logger = logging.getLogger(__name__)
+
+class RepoTool:
+    """Runs git-repo init, sync and list with the options sc clone needs.
+
+    RepoLibrary, from the separate sc-repo-library package, covers the repo
+    commands the branching tools use but doesn't expose depth, partial clone,
+    current branch, job counts, network/local only syncs, event logs or listing
+    projects. Until it does, cloning drives repo through this class alone and
+    everything else keeps using RepoLibrary.
+
+    Raises subprocess.CalledProcessError if repo fails.
+    """
+    @staticmethod
+    def init(
+            uri: str,
+            directory: Path,
+            branch: str | None = None,
+            manifest: str | None = None,
+            mirror: bool = False,
+            reference: Path | None = None,
+            dissociate: bool = False,
+            groups: str | None = None,
+            repo_url: str | None = None,
+            repo_rev: str | None = None,
+            no_repo_verify: bool = False,
+            depth: int | None = None,
+            clone_filter: str | None = None,
+            partial_clone_exclude: list[str] | None = None,
+            current_branch: bool = False,
+        ):
+        cmd = ["repo", "init", "-u", uri]
+        if branch:
+            cmd.extend(["-b", branch])
+        if manifest:
+            cmd.extend(["-m", manifest])
+        if mirror:
+            cmd.append("--mirror")
+        if reference:
+            cmd.extend(["--reference", str(reference)])
+        if dissociate:
+            cmd.append("--dissociate")
+        if groups:
+            cmd.extend(["-g", groups])
+        if repo_url:
+            cmd.extend(["--repo-url", repo_url])
+        if repo_rev:
+            cmd.extend(["--repo-rev", repo_rev])
+        if no_repo_verify:
+            cmd.append("--no-repo-verify")
+        if depth:
+            cmd.append(f"--depth={depth}")
+        if clone_filter:
+            cmd.extend(["--partial-clone", f"--clone-filter={clone_filter}"])
+            if partial_clone_exclude:
+                cmd.append(f"--partial-clone-exclude={','.join(partial_clone_exclude)}")
+        if current_branch:
+            cmd.append("--current-branch")
+
+        RepoTool._run(cmd, directory, interactive=False)
+
+    @staticmethod
+    def sync(
+            directory: Path,
+            verify: bool = False,
+            current_branch: bool = False,
+            projects: list[str] | None = None,
+            jobs: int | None = None,
+            jobs_network: int | None = None,
+            jobs_checkout: int | None = None,
+            event_log: Path | None = None,
+            network_only: bool = False,
+            local_only: bool = False,
+        ):
+        cmd = ["repo"]
+        if event_log:
+            # A global option of repo, not of sync.
+            cmd.append(f"--event-log={event_log}")
+        cmd.append("sync")
+        if verify:
+            cmd.append("--verify")
+        if current_branch:
+            cmd.append("--current-branch")
+        if jobs:
+            cmd.append(f"--jobs={jobs}")
+        if jobs_network:
+            cmd.append(f"--jobs-network={jobs_network}")
+        if jobs_checkout:
+            cmd.append(f"--jobs-checkout={jobs_checkout}")
+        if network_only:
+            cmd.append("--network-only")
+        if local_only:
+            cmd.append("--local-only")
+        if projects:
+            cmd.extend(projects)
+
+        RepoTool._run(cmd, directory)
+
+    @staticmethod
+    def list_projects(directory: Path) -> dict[str, str]:
+        """The projects of a workspace's manifest, as a map of path to name."""
+        result = subprocess.run(
+            # Including projects that haven't been fetched yet.
+            ["repo", "list", "--all"],
+            cwd=directory,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        projects = {}
+        for line in result.stdout.splitlines():
+            path, sep, name = line.partition(" : ")
+            if sep:
+                projects[path.strip()] = name.strip()
+        return projects
+
+    @staticmethod
+    def _run(cmd: list[str], directory: Path, interactive: bool = True):
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        click.secho(" ".join(cmd), fg="green")
+        subprocess.run(
+            cmd,
+            cwd=directory,
+            # Without a tty repo init skips its identity and colour prompts.
+            stdin=None if interactive else subprocess.DEVNULL,
+            check=True
+        )
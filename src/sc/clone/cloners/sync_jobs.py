@@ -0,0 +1,86 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+import logging
+import os
+import socket
+import time
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Round trip above which fetches spend most of their time waiting on the server.
+HIGH_LATENCY = 0.1
+PROBE_TIMEOUT = 2
+MAX_NETWORK_JOBS = 16
+
+@dataclass
+class SyncJobs:
+    """Parallelism for repo sync. None leaves the choice to repo."""
+    jobs: int | None = None
+    network: int | None = None
+    checkout: int | None = None
+
+    def __str__(self) -> str:
+        return f"jobs={self.jobs}, network={self.network}, checkout={self.checkout}"
+
+def auto_sync_jobs(uri: str) -> SyncJobs:
+    """Pick sync job counts from the CPU count and the latency to the remote.
+
+    Checkout is bound by local CPU and disk so uses every CPU. Fetches over a slow
+    link are mostly waiting, so more of them run at once the higher the latency.
+    """
+    cpus = os.cpu_count() or 1
+    network = min(cpus, 8)
+
+    latency = probe_latency(uri)
+    if latency is None:
+        logger.debug(f"Couldn't probe latency to {uri}, using {network} network jobs.")
+    elif latency > HIGH_LATENCY:
+        network = min(cpus * 2, MAX_NETWORK_JOBS)
+        logger.debug(f"High latency to {uri} ({latency * 1000:.0f}ms)")
+
+    return SyncJobs(network=network, checkout=cpus)
+
+def probe_latency(uri: str) -> float | None:
+    """Time a TCP connect to the host serving uri.
+
+    Returns:
+        float | None: The connect time in seconds, or None if it couldn't connect.
+    """
+    host, port = _get_host_and_port(uri)
+    if not host:
+        return None
+
+    start = time.monotonic()
+    try:
+        with socket.create_connection((host, port), timeout=PROBE_TIMEOUT):
+            return time.monotonic() - start
+    except OSError:
+        return None
+
+def _get_host_and_port(uri: str) -> tuple[str | None, int]:
+    default_ports = {"ssh": 22, "git": 9418, "http": 80, "https": 443}
+    if "://" not in uri:
+        # scp style, user@host:path
+        host = uri.split("@", 1)[-1].split(":", 1)[0]
+        return host or None, 22
+
+    parts = urlsplit(uri)
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    return parts.hostname, port or default_ports.get(parts.scheme, 443)
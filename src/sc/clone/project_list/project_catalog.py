@@ -0,0 +1,176 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from bisect import bisect_left
+import difflib
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+try:
+    YamlLoader = yaml.CSafeLoader
+except AttributeError:
+    YamlLoader = yaml.SafeLoader
+
+class ProjectCatalog:
+    """A project list yaml compiled for fast lookups.
+
+    Holds a flat index of project name to the groups it's nested in and its raw
+    configuration, the rows of the list's hierarchy, and a sorted name index for
+    prefix and fuzzy searches. Compiling walks the yaml once, after that the
+    catalog is loaded from a json file next to the yaml until the yaml changes.
+    """
+    VERSION = 1
+
+    def __init__(self, index: dict[str, dict], hierarchy: list[dict]):
+        self.index = index
+        self.hierarchy = hierarchy
+        self._names = sorted(index, key=str.lower)
+        self._lower_names = [name.lower() for name in self._names]
+
+    @classmethod
+    def load(cls, yaml_path: Path) -> "ProjectCatalog":
+        """Load the catalog of a project list, compiling it if the yaml changed.
+
+        Raises:
+            ValueError: If the yaml isn't a mapping.
+        """
+        yaml_path = Path(yaml_path)
+        text = yaml_path.read_bytes()
+        digest = hashlib.sha256(text).hexdigest()
+        catalog_path = cls._catalog_path(yaml_path)
+
+        try:
+            data = json.loads(catalog_path.read_text())
+            if data.get("version") == cls.VERSION and data.get("sha256") == digest:
+                return cls(data["index"], data["hierarchy"])
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+        catalog = cls.compile(yaml.load(text, Loader=YamlLoader))
+        catalog._save(catalog_path, digest)
+        return catalog
+
+    @classmethod
+    def compile(cls, projects: dict) -> "ProjectCatalog":
+        """Build the catalog from the raw yaml of a project list."""
+        if not isinstance(projects, dict):
+            raise ValueError("Project list is not a mapping!")
+        projects = dict(projects)
+        projects.pop("project_defaults", None)
+
+        index = {}
+        cls._index_projects(projects, [], index)
+        return cls(index, cls._get_hierarchy(projects))
+
+    def get(self, name: str) -> dict | None:
+        """The raw configuration of a project, if the list has it."""
+        entry = self.index.get(name)
+        return entry["config"] if entry else None
+
+    def search(self, prefix: str) -> list[str]:
+        """Project names starting with prefix, ignoring case."""
+        prefix = prefix.lower()
+        start = bisect_left(self._lower_names, prefix)
+        matches = []
+        for name, lower_name in zip(self._names[start:], self._lower_names[start:]):
+            if not lower_name.startswith(prefix):
+                break
+            matches.append(name)
+        return matches
+
+    def suggest(self, name: str, limit: int = 5) -> list[str]:
+        """Project names that look like name, for "did you mean" hints."""
+        matches = self.search(name)[:limit]
+        close = difflib.get_close_matches(name.lower(), self._lower_names, n=limit)
+        matches.extend(self._names[self._lower_names.index(m)] for m in close)
+        return list(dict.fromkeys(matches))[:limit]
+
+    @classmethod
+    def _index_projects(cls, projects: dict, groups: list[str], index: dict):
+        """Index projects with the precedence of a depth first search by name.
+
+        A group's own projects take precedence over those in its subgroups, and
+        earlier subgroups over later ones, so the first registration of a name wins.
+        """
+        for name, details in projects.items():
+            if isinstance(details, dict) and cls._is_project(details):
+                index.setdefault(str(name), {"groups": groups, "config": details})
+
+        for name, details in projects.items():
+            if isinstance(details, dict) and not cls._is_project(details):
+                cls._index_projects(details, [*groups, str(name)], index)
+
+    @classmethod
+    def _get_hierarchy(cls, projects: dict, indent: int = 0) -> list[dict]:
+        """Recursively builds a list representing the project hierarchy.
+
+        Args:
+            projects (dict): Dictionary representing nested projects.
+            indent (int): Current indentation level for nesting.
+
+        Returns:
+            list[dict]: Rows of the hierarchy with keys name, indent, is_project and
+                description.
+        """
+        result = []
+        for name, details in projects.items():
+            if not isinstance(details, dict):
+                continue
+
+            description = details.get('description')
+            result.append(
+                {
+                    "name": str(name),
+                    "indent": indent,
+                    "is_project": cls._is_project(details),
+                    "description": description
+                }
+            )
+
+            if not description:
+                result.extend(cls._get_hierarchy(details, indent + 1))
+
+        return result
+
+    @staticmethod
+    def _is_project(project_dict: dict) -> bool:
+        return bool(project_dict.get('project_repo') or project_dict.get('project_suffix'))
+
+    @staticmethod
+    def _catalog_path(yaml_path: Path) -> Path:
+        return yaml_path.with_name(f"{yaml_path.name}.catalog.json")
+
+    def _save(self, catalog_path: Path, digest: str):
+        data = {
+            "version": self.VERSION,
+            "sha256": digest,
+            "index": self.index,
+            "hierarchy": self.hierarchy
+        }
+        tmp_path = catalog_path.with_name(f"{catalog_path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(data))
+            os.replace(tmp_path, catalog_path)
+        except (OSError, TypeError, ValueError) as e:
+            # Lists with values json can't hold, or in read only locations, are
+            # compiled on every load instead.
+            logger.debug(f"Couldn't save project list catalog {catalog_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
@@ -21,7 +21,8 @@ import sys
 
 import click
 from pydantic import BaseModel, ConfigDict, model_validator, ValidationError
-import yaml
+
+from .project_catalog import ProjectCatalog
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +44,11 @@ class Project(BaseModel):
     repo_rev: str | None = None
     no_repo_verify: bool = False
     inherited: str | None = None
+    depth: int | None = None
+    clone_filter: str | None = None
+    single_branch: bool = False
+    current_branch: bool = False
+    groups: str | None = None
 
     @model_validator(mode='after')
     def check_repo_fields(self):
@@ -74,33 +80,28 @@ class ProjectList:
     def __init__(self, name: str, path: Path | str):
         self.name = name
         self.path = path
-        self.projects = {}
 
-        self._load()
+        self._catalog = self._load()
 
-    def _load(self):
-        """Populate the ProjectList from the given path."""
+    def _load(self) -> ProjectCatalog:
+        """Load the compiled catalog of the list at the given path."""
         if not Path(self.path).is_file():
             raise IOError(f"Failed to load project list {self.name} from file "
                            f"{self.path} as the path didn't exist!")
 
-        with open(self.path, 'r') as file:
-            self.projects = yaml.safe_load(file)
-
-        if not isinstance(self.projects, dict):
-            raise ValueError(f"Project list {self.name} is not a mapping!")
-
-        self.projects.pop("project_defaults", None)
+        try:
+            return ProjectCatalog.load(Path(self.path))
+        except ValueError as e:
+            raise ValueError(f"Project list {self.name}: {e}") from e
 
     def get_hierarchy(self) -> list[dict]:
         """Returns the hierarchy of the project list
 
         Returns:
-            list[tuple[int, str, bool, str | None]]: Hierarchical structure of projects.
-                Each entry in the result is a tuple of:
-                (indent_level, name, is_project, description).
+            list[dict]: Hierarchical structure of projects. Each entry in the result
+                has the keys indent, name, is_project and description.
         """
-        return self._get_projects_hierarchy(self.projects)
+        return self._catalog.hierarchy
 
     def get_project(self, project_name:str) -> Project | None:
         """Retrieve the information related to a project
@@ -111,7 +112,7 @@ class ProjectList:
         Returns:
             Project: A project configuration.
         """
-        project_dict = self._search_projects_by_name(self.projects, project_name)
+        project_dict = self._catalog.get(project_name)
         if not project_dict:
             return None
 
@@ -121,69 +122,14 @@ class ProjectList:
             logger.error(f"Invalid project configuration:\n{e}")
             sys.exit(1)
 
-    def _search_projects_by_name(
-            self, projects: dict, project_name: str) -> dict[str, str] | None:
-        """Recursively searches for a project's configuration in a dictionary.
-
-        Args:
-            projects (dict): A dictionary containing all projects.
-            project_name (str): The name of the project to find.
-
-        Returns:
-            dict | None: The project configuration if found, otherwise None.
-        """
-        project_dict = projects.get(project_name)
-
-        if project_dict and self._is_project(project_dict):
-            return project_dict
-
-        # Recursively search through projects that lack a description
-        for sub_project in projects.values():
-            if isinstance(sub_project, dict) and not self._is_project(sub_project):
-                found_project = self._search_projects_by_name(sub_project, project_name)
-                if found_project:
-                    return found_project
-
-        return None
-
-    def _get_projects_hierarchy(
-            self,
-            projects:dict,
-            indent:int = 0
-        ) -> list[dict]:
-        """Recursively builds a list representing the project hierarchy.
-
-        Args:
-            projects (dict): Dictionary representing nested projects.
-            indent_level (int): Current indentation level for nesting.
-
-        Returns:
-            list[tuple[int, str, bool, str | None]]: Hierarchical structure of projects.
-                Each entry in the result is a tuple of:
-                (indent_level, name, is_project, description).
-        """
-        result = []
-        for name, details in projects.items():
-            if not isinstance(details, dict):
-                continue
-
-            is_project = self._is_project(details)
-            description = details.get('description')
-            result.append(
-                {
-                    "name": name,
-                    "indent": indent,
-                    "is_project": is_project,
-                    "description": description
-                }
-            )
-
-            if not description:
-                result.extend(self._get_projects_hierarchy(details, indent + 1))
+    def project_names(self) -> list[str]:
+        """Names of all the projects in the list."""
+        return list(self._catalog.index)
 
-        return result
+    def search(self, prefix: str) -> list[str]:
+        """Names of the projects starting with prefix, ignoring case."""
+        return self._catalog.search(prefix)
 
-    def _is_project(self, project_dict: dict):
-        if project_dict.get('project_repo') or project_dict.get('project_suffix'):
-            return True
-        return False
\ No newline at end of file
+    def suggest(self, project_name: str) -> list[str]:
+        """Names of the projects that look like project_name."""
+        return self._catalog.suggest(project_name)
@@ -12,49 +12,109 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import logging
+import os
 from pathlib import Path
-import requests
+import time
 
+import requests
+from requests.adapters import HTTPAdapter
 import yaml
 
 logger = logging.getLogger(__name__)
 
+# Seconds to connect and to wait for data, so an unreachable host falls back to the
+# cached copy quickly.
+TIMEOUT = (5, 30)
+POOL_SIZE = 16
+
 class ProjectListDownloader:
+    """Downloads project lists, revalidating cached copies rather than refetching them.
+
+    The validators (ETag and Last-Modified) of each download are stored in a
+    <path>.meta.json sidecar and sent on the next download, so an unchanged list
+    costs a 304. All downloads share one pooled session so they can run
+    concurrently.
+    """
     def __init__(self):
         self.supported_platforms = {
             "github": lambda token: {"Authorization": f"token {token}"},
             "gitlab": lambda token: {"PRIVATE-TOKEN": token},
         }
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
     def download(
             self,
             url: str,
             path: Path | str,
             platform: str | None = None,
-            token: str | None = None
+            token: str | None = None,
+            ttl: int = 0,
+            force: bool = False
         ) -> Path:
         """Download a text file and write to a path.
 
         Can either use one of the classes supported platforms or no platform for
         publicly hosted files.
+
+        Args:
+            url (str): The url of the file.
+            path (Path | str): Where to write the file.
+            platform (str | None): Platform hosting a private file.
+            token (str | None): Token for the platform.
+            ttl (int): Seconds a downloaded copy is used without checking the url.
+            force (bool): Download even if the copy is fresh or unchanged.
+
+        Raises:
+            RuntimeError: If the file couldn't be downloaded and there's no copy to
+                fall back to.
         """
         if platform and platform not in self.supported_platforms:
             raise ValueError(f"Unsupported platform: {platform}. Supported platforms are "
                              f"{', '.join(self.supported_platforms)}")
 
-        header = self._get_auth_header(platform, token)
+        path = Path(path)
+        meta = self._load_meta(path, url)
+        has_copy = path.is_file() and meta is not None and not force
+        if has_copy and time.time() - meta.get("fetched", 0) < ttl:
+            logger.debug(f"Project list {path} is fresh, skipping download.")
+            return path
+
+        headers = self._get_auth_header(platform, token) or {}
+        if has_copy:
+            if etag := meta.get("etag"):
+                headers["If-None-Match"] = etag
+            if last_modified := meta.get("last_modified"):
+                headers["If-Modified-Since"] = last_modified
+
         try:
-            response = requests.get(url, headers=header)
-            response.raise_for_status()
-            if not self._is_yaml_dict(response.text):
-                raise RuntimeError("Downloaded text is not a valid yaml!")
-            Path(path).parent.mkdir(parents=True, exist_ok=True)
-            Path(path).write_text(response.text)
-            return Path(path)
-        except requests.RequestException as e:
+            response = self._session.get(url, headers=headers, timeout=TIMEOUT)
+            if response.status_code == 304 and has_copy:
+                logger.debug(f"Project list {path} is unchanged.")
+            else:
+                response.raise_for_status()
+                if not self._is_yaml_dict(response.text):
+                    raise RuntimeError("Downloaded text is not a valid yaml!")
+                self._write(path, response.text)
+                meta = {
+                    "url": url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+        except (requests.RequestException, RuntimeError) as e:
+            if path.is_file():
+                logger.warning(f"Failed to fetch project list {url}, using cached copy: {e}")
+                return path
             raise RuntimeError(f"Failed to fetch project list: {e}") from e
 
+        meta["fetched"] = time.time()
+        self._write(self._meta_path(path), json.dumps(meta))
+        return path
+
     def _get_auth_header(self, platform: str | None, token: str | None):
         if platform is not None:
             return self.supported_platforms[platform](token)
@@ -64,4 +124,24 @@ class ProjectListDownloader:
             data = yaml.safe_load(text)
             return isinstance(data, dict)
         except yaml.YAMLError:
-            return False
\ No newline at end of file
+            return False
+
+    def _load_meta(self, path: Path, url: str) -> dict | None:
+        """Validators of the last download, if it was from the same url."""
+        try:
+            meta = json.loads(self._meta_path(path).read_text())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(meta, dict) or meta.get("url") != url:
+            return None
+        return meta
+
+    def _meta_path(self, path: Path) -> Path:
+        return path.with_name(f"{path.name}.meta.json")
+
+    def _write(self, path: Path, text: str):
+        """Write atomically so concurrent sc runs never read a partial file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(text)
+        os.replace(tmp_path, path)
@@ -12,13 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from pathlib import Path
 
 from pydantic import BaseModel, ConfigDict, model_validator, ValidationError
 
 from .project_list import ProjectList
-from .project_list_downloader import ProjectListDownloader
+from .project_list_downloader import POOL_SIZE, ProjectListDownloader
+from ..cache import CacheConfig
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +47,7 @@ class ProjectListManager:
         self.default_dir = default_dir
 
         self._project_list_downloader = ProjectListDownloader()
+        self._ttl = CacheConfig.load().project_list_ttl
 
     @property
     def supported_platforms(self) -> list:
@@ -52,20 +55,30 @@ class ProjectListManager:
         return list(self._project_list_downloader.supported_platforms.keys())
 
     def load_project_lists_from_config(self, config: dict) -> list[ProjectList]:
-        """Download and load all project lists defined in the config."""
+        """Download and load all project lists defined in the config, concurrently."""
         sources = self._parse_project_list_sources(config)
+        if not sources:
+            return []
 
-        project_lists = []
-        for name, source in sources:
-            pl = self.load_project_list_from_source(name, source)
-            if pl is not None:
-                project_lists.append(pl)
-        return project_lists
+        with ThreadPoolExecutor(max_workers=min(len(sources), POOL_SIZE)) as pool:
+            project_lists = pool.map(
+                lambda item: self.load_project_list_from_source(*item), sources)
+            return [pl for pl in project_lists if pl is not None]
 
     def load_project_list_from_source(
-            self, name: str, source: ProjectListSource) -> ProjectList | None:
-        """Download and load a project list from a given source."""
-        path = self._download_project_list(name, source)
+            self,
+            name: str,
+            source: ProjectListSource,
+            force: bool = False
+        ) -> ProjectList | None:
+        """Download and load a project list from a given source.
+
+        Args:
+            name (str): Name of the project list.
+            source (ProjectListSource): Where to download it from.
+            force (bool): Download even if the local copy is fresh.
+        """
+        path = self._download_project_list(name, source, force)
         if path is None:
             return None
         return self.load_local_project_list(name, path)
@@ -90,7 +103,7 @@ class ProjectListManager:
         return sources
 
     def _download_project_list(
-            self, name: str, source: ProjectListSource) -> Path | None:
+            self, name: str, source: ProjectListSource, force: bool = False) -> Path | None:
         """Download the project list YAML from a remote URL."""
         if source.path is None:
             self.default_dir.mkdir(parents=True, exist_ok=True)
@@ -99,9 +112,15 @@ class ProjectListManager:
             path = Path(source.path)
 
         try:
-            logger.info(f"Downloading project list {name} to path {str(path)}")
+            logger.debug(f"Downloading project list {name} to path {str(path)}")
             return self._project_list_downloader.download(
-                source.url, path, source.platform, source.token)
+                source.url,
+                path,
+                source.platform,
+                source.token,
+                ttl=self._ttl,
+                force=force
+            )
         except (RuntimeError, IOError) as e:
             logger.warning(f"Failed to download project list {name}: {e}")
             return None
@@ -0,0 +1,159 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import time
+from typing import Iterator
+
+import click
+
+from .cache.cache_config import format_size
+
+logger = logging.getLogger(__name__)
+
+SLOWEST_PROJECTS_SHOWN = 10
+_SIZE_PATTERN = re.compile(r"([\d.]+)\s*(bytes|KiB|MiB|GiB)")
+_SIZE_UNITS = {"bytes": 1, "KiB": 1024, "MiB": 1024 ** 2, "GiB": 1024 ** 3}
+
+@dataclass
+class Phase:
+    """A timed step of a clone. Nested phases are named "parent > child"."""
+    name: str
+    seconds: float = 0
+    bytes_received: int = 0
+
+class TimingReport:
+    """Where the time of a clone went, by phase and by project.
+
+    Usage:
+        with report.phase("repo sync") as phase:
+            ...
+            phase.bytes_received += received
+    """
+    def __init__(self):
+        self.phases: list[Phase] = []
+        self.projects: dict[str, float] = {}
+        self._stack: list[str] = []
+        self._start = time.monotonic()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[Phase]:
+        phase = Phase(" > ".join([*self._stack, name]))
+        self.phases.append(phase)
+        self._stack.append(name)
+        start = time.monotonic()
+        try:
+            yield phase
+        finally:
+            phase.seconds = time.monotonic() - start
+            self._stack.pop()
+
+    def add_project(self, name: str, seconds: float):
+        self.projects[name] = self.projects.get(name, 0) + seconds
+
+    def add_repo_event_log(self, event_log: Path):
+        """Add per-project durations from a `repo sync --event-log` file."""
+        try:
+            lines = Path(event_log).read_text().splitlines()
+        except OSError as e:
+            logger.debug(f"No repo event log {event_log}: {e}")
+            return
+
+        for line in lines:
+            try:
+                event = json.loads(line)
+                start, finish = event["start_time"], event["finish_time"]
+            except (ValueError, KeyError, TypeError):
+                continue
+            # Sync events name the project by path, others are repo's own steps.
+            if "project" in event and start is not None and finish is not None:
+                self.add_project(event["name"], finish - start)
+
+    @property
+    def total_seconds(self) -> float:
+        return time.monotonic() - self._start
+
+    @property
+    def bytes_received(self) -> int:
+        # Bytes are only recorded on the phase that received them, never its parents.
+        return sum(p.bytes_received for p in self.phases)
+
+    def print_summary(self):
+        click.secho("Clone timing:", bold=True)
+        width = max((len(p.name) for p in self.phases), default=0)
+        for phase in self.phases:
+            received = f"  {format_size(phase.bytes_received)}" if phase.bytes_received else ""
+            click.echo(f"   {phase.name:<{width}}  {phase.seconds:8.1f}s{received}")
+        click.echo(f"   {'total':<{width}}  {self.total_seconds:8.1f}s  "
+                   f"{format_size(self.bytes_received)} received")
+
+        if self.projects:
+            slowest = sorted(self.projects.items(), key=lambda p: p[1], reverse=True)
+            click.secho(f"Slowest projects ({len(self.projects)} synced):", bold=True)
+            for name, seconds in slowest[:SLOWEST_PROJECTS_SHOWN]:
+                click.echo(f"   {seconds:8.1f}s  {name}")
+
+    def write(self, path: Path):
+        """Write the report as json."""
+        data = {
+            "total_seconds": self.total_seconds,
+            "bytes_received": self.bytes_received,
+            "phases": [asdict(phase) for phase in self.phases],
+            "projects": self.projects
+        }
+        Path(path).write_text(json.dumps(data, indent=2))
+        logger.info(f"Wrote timing report to {path}")
+
+def parse_received_bytes(progress: str) -> int | None:
+    """Bytes received in a line of git's fetch progress, e.g.
+    "Receiving objects: 100% (10/10), 1.20 MiB | 2.00 MiB/s, done."
+    """
+    if "Receiving objects" not in progress:
+        return None
+    match = _SIZE_PATTERN.search(progress)
+    if not match:
+        return None
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2)])
+
+def pack_bytes_since(roots: Path | list[Path], since: float) -> int:
+    """Size of the packs written under roots since an epoch time.
+
+    repo hides git's fetch progress behind its own, so the size of the packs a
+    sync fetched stands in for the bytes it received. Roots should be git or
+    object directories, only objects/pack directories are looked into.
+    """
+    total = 0
+    for root in [roots] if isinstance(roots, Path) else roots:
+        for dirpath, dirnames, filenames in os.walk(root):
+            if os.path.basename(dirpath) == "objects":
+                # Loose object fan-out directories hold no packs.
+                dirnames[:] = [d for d in dirnames if d == "pack"]
+            if not dirpath.endswith(os.path.join("objects", "pack")):
+                continue
+            for filename in filenames:
+                if not filename.endswith(".pack"):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(dirpath, filename))
+                except OSError:
+                    continue
+                if stat.st_mtime >= since:
+                    total += stat.st_size
+    return total
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from pathlib import Path
+
 import click
 
 from sc.clone import SCClone
@@ -21,39 +23,87 @@ def cli():
     pass
 
 @cli.command()
-@click.argument('project', required=False)
-@click.argument('directory', required=False)
+@click.argument('targets', nargs=-1)
 @click.option('-r', '--rev', help='Clone a revision. Accepts branch name, tag name, or full SHA.')
 @click.option('-n', '--no-tags', is_flag=True, help='Clone without tags.')
 @click.option('-m', '--manifest', help='Clone with specific manifest name.')
 @click.option('-f', '--force', is_flag=True, help="Automatically overwrite directory.")
 @click.option('-v', '--verify', is_flag=True, help='RDK projects only, run post-sync-hooks without prompts.')
+@click.option('--refresh-cache', is_flag=True, help='Refresh the cache even if it was updated recently.')
+@click.option('--depth', type=click.IntRange(min=1), help='Shallow clone to this many commits.')
+@click.option('--filter', 'clone_filter', help='Partial clone filter, e.g. blob:none or tree:0.')
+@click.option('--single-branch', is_flag=True, help='Git projects only, fetch only the cloned branch.')
+@click.option('--dissociate', is_flag=True, help="Copy the objects borrowed from the cache, or for repo projects from --from-workspace, into the clone.")
+@click.option('-c', '--current-branch', is_flag=True, help='Repo projects only, fetch only the manifest revision of each project.')
+@click.option('-g', '--groups', help='Repo projects only, sync only the manifest projects in these comma separated groups, e.g. middleware,-test.')
+@click.option('--jobs-network', type=click.IntRange(min=1), help='Repo projects only, number of projects to fetch at once.')
+@click.option('--jobs-checkout', type=click.IntRange(min=1), help='Repo projects only, number of projects to check out at once.')
+@click.option('--seed', type=click.Path(exists=True, path_type=Path), help='Seed the clone from a directory or tarball of git bundles made by sc bundle create.')
+@click.option('--from-workspace', type=click.Path(exists=True, file_okay=False, path_type=Path), help='Borrow objects from an existing workspace of the project instead of the network. The clone depends on it unless --dissociate is given.')
+@click.option('--timing-report', type=click.Path(dir_okay=False, path_type=Path), help='Write a json report of where the clone time went to this file.')
+@click.option('--from-file', type=click.Path(exists=True, dir_okay=False, path_type=Path), help='Also clone the projects listed in this file, one per line.')
+@click.option('-j', '--jobs', type=click.IntRange(min=1), help='When cloning several projects, the total number of fetch and checkout jobs shared between them.')
+@click.option('--resume', is_flag=True, help='Continue an interrupted clone in the directory, fetching only the projects that are missing or partial.')
 @click.pass_context
 def clone(
         ctx,
-        project: str | None,
-        directory: str | None,
+        targets: tuple[str, ...],
         rev: str | None,
         no_tags: bool,
         manifest: str | None,
         force: bool,
         verify: bool,
+        refresh_cache: bool,
+        depth: int | None,
+        clone_filter: str | None,
+        single_branch: bool,
+        dissociate: bool,
+        current_branch: bool,
+        groups: str | None,
+        jobs_network: int | None,
+        jobs_checkout: int | None,
+        seed: Path | None,
+        from_workspace: Path | None,
+        timing_report: Path | None,
+        from_file: Path | None,
+        jobs: int | None,
+        resume: bool,
     ):
-    """Clone groups of repositories from a config."""
-    if project:
-        SCClone().clone(
-            project_name=project,
+    """Clone groups of repositories from a config.
+
+    TARGETS are the projects to clone, optionally followed by a directory. One
+    project clones into the directory, several clone into folders inside it.
+    """
+    sc_clone = SCClone()
+    projects, directory = sc_clone.parse_targets(targets, from_file)
+    if projects:
+        sc_clone.clone(
+            project_name=projects,
             directory=directory,
             rev=rev,
             no_tags=no_tags,
             manifest=manifest,
             force_overwrite=force,
             verify=verify,
+            refresh_cache=refresh_cache,
+            depth=depth,
+            clone_filter=clone_filter,
+            single_branch=single_branch,
+            dissociate=dissociate,
+            current_branch=current_branch,
+            groups=groups,
+            jobs_network=jobs_network,
+            jobs_checkout=jobs_checkout,
+            seed=seed,
+            from_workspace=from_workspace,
+            timing_report=timing_report,
+            resume=resume,
+            jobs=jobs,
         )
     else:
         click.secho("Please specify a project or subcommand.", fg="red", bold=True)
         click.echo(ctx.get_help())
-        SCClone().print_projects_hierarchy()
+        sc_clone.print_projects_hierarchy()
 
 @cli.command()
 def add_project_list():
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
 import getpass
 import grp
 from netrc import netrc, NetrcParseError
@@ -28,6 +29,8 @@ import docker
 from docker.errors import APIError, TLSParameterError
 
 from .exceptions import ScDockerException
+from .image_index import ImageIndex
+from .registry_cache import RegistryCache
 from .registry_apis.registry_api_factory import RegistryAPIFactory
 from sc.config_manager import ConfigManager
 
@@ -41,8 +44,14 @@ BANNED_MOUNT_DIRS = [
 ]
 
 class SCDocker:
-    def __init__(self):
+    def __init__(self, refresh: bool = False):
+        """
+        Args:
+            refresh (bool): Fetch registry catalogs and tags instead of using the cache.
+        """
         self.docker_client = docker.from_env()
+        self.refresh = refresh
+        self.registry_cache = RegistryCache()
         self.supported_registry_types = RegistryAPIFactory.get_supported_registry_types()
 
 
@@ -70,6 +79,7 @@ class SCDocker:
             click.secho(e)
             sys.exit(1)
         self._validate_images(images, registry_url)
+        self.registry_cache.set_images(registry_url, images)
 
         self._update_user_config(registry_url, registry_type, credential_store, username, api_token)
 
@@ -91,27 +101,22 @@ class SCDocker:
         if self.docker_config:
             remote_images = self._fetch_image_names_all_registries_in_config()
 
-        # Get local image names and remove duplicates.
-        local_images = list({tag.split(":")[0] for image in self.docker_client.images.list() for tag in image.tags})
+        remote_set = set(remote_images)
+        local_set = set(self._get_local_images())
 
         # Combine the lists while preserving order
-        all_images = []
-        seen = set()
-        for image in remote_images + local_images:
-            if image not in seen:
-                all_images.append(image)
-                seen.add(image)
+        all_images = list(dict.fromkeys([*remote_images, *sorted(local_set)]))
 
         click.secho("Images are:- ", fg="green")
         remote_str = click.style(" (Remote)", fg="cyan")
         local_str = click.style(" (Local)", fg="magenta")
 
         for image in all_images:
-            if image in remote_images and image in local_images:
+            if image in remote_set and image in local_set:
                 click.echo(click.style(image, fg="yellow", bold=True) + remote_str + local_str)
-            elif image in remote_images:
+            elif image in remote_set:
                 click.echo(click.style(image, fg="yellow", bold=True) + remote_str)
-            elif image in local_images:
+            elif image in local_set:
                 click.echo(click.style(image, fg="yellow", bold=True) + local_str)
 
     def run(
@@ -136,9 +141,12 @@ class SCDocker:
         """
         image = self._resolve_image_from_ref(image_ref, local)
         registry_url, image_name = self._parse_image_reference(image)
-        tags = self._fetch_tags(image, local, registry_url)
-
-        if tag not in tags:
+        if not self._has_tag(image, tag, local, registry_url):
+            # Every tag is only listed when the tag is missing, to show the alternatives.
+            tags = self._fetch_tags(image, local, registry_url)
+            if tag in tags:
+                # The cached tags are out of date, the registry no longer has the tag.
+                tags = self._fetch_tags(image, local, registry_url, use_cache=False)
             self._handle_invalid_tag(image, tag, tags)
 
         if not local:
@@ -311,13 +319,29 @@ class SCDocker:
 
     # ──────────────────────── IMAGE & CONTAINER HANDLING HELPERS ────────────────────────
 
+    def refresh_cache(self, registry_url: str, image_name: str | None = None):
+        """Fetch a registry's catalog, or the tags of one of its images, into the
+        registry cache.
+        """
+        if registry_url not in self.docker_config:
+            click.secho(f"ERROR: {registry_url} is not in your registry config.", fg="red")
+            sys.exit(1)
+        if image_name:
+            username, api_token = self._get_registry_creds_by_url(registry_url)
+            self._fetch_remote_tags(f"{registry_url}/{image_name}", username, api_token)
+        else:
+            self._fetch_image_names_by_registry(registry_url, use_cache=False)
+
     def _resolve_image_from_ref(self, image_ref: str, local: bool) -> str:
         if local:
-            images = self._get_local_images()
-        else:
-            self._check_no_registries()
-            images = self._get_remote_images(image_ref)
-        return self._match_image_to_ref(images, image_ref)
+            return self._match_image_to_ref(ImageIndex(self._get_local_images()), image_ref)
+
+        self._check_no_registries()
+        index = ImageIndex(self._get_remote_images(image_ref))
+        if not index.match(image_ref) and not self.refresh:
+            # The image may have been pushed since the catalogs were cached.
+            index = ImageIndex(self._get_remote_images(image_ref, use_cache=False))
+        return self._match_image_to_ref(index, image_ref)
 
     def _get_local_images(self) -> list[str]:
         return list(
@@ -327,11 +351,11 @@ class SCDocker:
                 }
             )
 
-    def _get_remote_images(self, image_ref: str) -> list[str]:
+    def _get_remote_images(self, image_ref: str, use_cache: bool = True) -> list[str]:
         if registry_url := self._match_registry_from_image_ref(image_ref):
-            return self._fetch_image_names_by_registry(registry_url)
+            return self._fetch_image_names_by_registry(registry_url, use_cache)
 
-        return self._fetch_image_names_all_registries_in_config()
+        return self._fetch_image_names_all_registries_in_config(use_cache)
 
     def _match_registry_from_image_ref(self, image_ref: str) -> str | None:
         for registry_url in self.docker_config:
@@ -339,11 +363,8 @@ class SCDocker:
                 return registry_url
         return None
 
-    def _match_image_to_ref(self, images: list[str], image_ref: str) -> str:
-        valid_images = []
-        for image in images:
-            if image.endswith(image_ref):
-                valid_images.append(image)
+    def _match_image_to_ref(self, images: ImageIndex, image_ref: str) -> str:
+        valid_images = images.match(image_ref)
 
         if len(valid_images) == 1:
             image_to_run = valid_images[0]
@@ -408,13 +429,49 @@ class SCDocker:
             click.secho("ERROR: An unexpected error occurred.", fg='red', bold=True)
             sys.exit(1)
 
-    def _fetch_tags(self, image: str, local: bool, registry_url: str) -> tuple[str]:
+    def _fetch_tags(
+            self,
+            image: str,
+            local: bool,
+            registry_url: str,
+            use_cache: bool = True
+        ) -> tuple[str]:
         if local:
             return self._fetch_local_tags(image)
 
+        _, image_name = self._parse_image_reference(image)
+        if (cached := self._get_cached(registry_url, image_name, use_cache)) is not None:
+            return cached
         username, api_token = self._get_registry_creds_by_url(registry_url)
         return self._fetch_remote_tags(image, username, api_token)
 
+    def _has_tag(self, image: str, tag: str, local: bool, registry_url: str) -> bool:
+        """Whether an image has a tag, from the cached tags if they're within their
+        ttl and have it, or else by asking the registry for that tag alone.
+
+        Stale cached tags aren't trusted as the tag may have been deleted since,
+        and checking the one tag costs a single request anyway.
+        """
+        if local:
+            return tag in self._fetch_local_tags(image)
+
+        _, image_name = self._parse_image_reference(image)
+        entry = None if self.refresh else self.registry_cache.get_tags(registry_url, image_name)
+        if entry and not entry.stale and tag in entry.value:
+            return True
+
+        username, api_token = self._get_registry_creds_by_url(registry_url)
+        registry_type = self.docker_config[registry_url]['reg_type']
+        registry_api = RegistryAPIFactory.get_registry_api(registry_type)
+        try:
+            return registry_api.has_tag(registry_url, username, api_token, image_name, tag)
+        except Exception as e:
+            click.secho(
+                f"ERROR: An exception occured when checking tag {tag} of image {image_name} from {registry_url}",
+                fg='red')
+            click.secho(e)
+            sys.exit(1)
+
     def _fetch_local_tags(self, image: str):
         local_images = self.docker_client.images.list()
         tags = []
@@ -432,7 +489,9 @@ class SCDocker:
         registry_api = RegistryAPIFactory.get_registry_api(registry_type)
 
         try:
-            return registry_api.fetch_tags(registry_url, username, api_token, image_name)
+            tags = registry_api.fetch_tags(registry_url, username, api_token, image_name)
+            self.registry_cache.set_tags(registry_url, image_name, tags)
+            return tags
         except Exception as e:
             click.secho(
                 f"ERROR: An exception occured when fetching tags for image {image_name} from {registry_url}",
@@ -440,34 +499,77 @@ class SCDocker:
             click.secho(e)
             sys.exit(1)
 
-    def _fetch_image_names_all_registries_in_config(self) -> list[str]:
+    def _fetch_image_names_all_registries_in_config(self, use_cache: bool = True) -> list[str]:
         """Fetch full image names (registry_url/image_name) from all registries
-        in the config.
+        in the config at once. Registries that fail are left out with a warning.
         """
-        return [
-            name
-            for registry_url in self.docker_config
-            for name in self._fetch_image_names_by_registry(registry_url)
-        ]
+        def fetch(registry_url: str) -> tuple[str, ...]:
+            try:
+                return self._fetch_images_by_registry(registry_url, use_cache)
+            except Exception as e:
+                click.secho(
+                    f"WARNING: Skipping registry {registry_url}, fetching its images failed: {e}",
+                    fg="yellow")
+            except SystemExit:
+                # The reason has been printed, e.g. missing netrc credentials.
+                click.secho(f"WARNING: Skipping registry {registry_url}", fg="yellow")
+            return ()
+
+        registry_urls = tuple(self.docker_config)
+        if not registry_urls:
+            return []
+        with ThreadPoolExecutor(max_workers=len(registry_urls)) as pool:
+            return [
+                f"{registry_url}/{image}"
+                for registry_url, images in zip(registry_urls, pool.map(fetch, registry_urls))
+                for image in images
+            ]
 
-    def _fetch_image_names_by_registry(self, registry_url: str) -> list[str]:
+    def _fetch_image_names_by_registry(self, registry_url: str, use_cache: bool = True) -> list[str]:
         """Add the registry url to make full image name."""
-        return [
-            f"{registry_url}/{image}" for image in
-            self._fetch_images_by_registry(registry_url)
-        ]
-
-    def _fetch_images_by_registry(self, registry_url: str) -> tuple[str, ...]:
-        """Return just the project name of images in a registry."""
-        username, api_token = self._get_registry_creds_by_url(registry_url)
-        registry_type = self.docker_config[registry_url]['reg_type']
-        registry_api = RegistryAPIFactory.get_registry_api(registry_type)
         try:
-            return registry_api.fetch_images(registry_url, username, api_token)
+            images = self._fetch_images_by_registry(registry_url, use_cache)
         except Exception as e:
             click.secho(f"ERROR: An exception occured when fetching images from {registry_url}", fg='red')
             click.secho(e)
             sys.exit(1)
+        return [f"{registry_url}/{image}" for image in images]
+
+    def _fetch_images_by_registry(self, registry_url: str, use_cache: bool = True) -> tuple[str, ...]:
+        """Return just the project name of images in a registry.
+
+        Raises:
+            Exception: If the registry query fails or times out.
+        """
+        if (cached := self._get_cached(registry_url, use_cache=use_cache)) is not None:
+            return cached
+        username, api_token = self._get_registry_creds_by_url(registry_url)
+        registry_type = self.docker_config[registry_url]['reg_type']
+        registry_api = RegistryAPIFactory.get_registry_api(registry_type)
+        images = registry_api.fetch_images(registry_url, username, api_token)
+        self.registry_cache.set_images(registry_url, images)
+        return images
+
+    def _get_cached(
+            self,
+            registry_url: str,
+            image_name: str | None = None,
+            use_cache: bool = True
+        ) -> tuple[str, ...] | None:
+        """A registry's cached catalog, or an image's cached tags, refreshing them in
+        the background when stale. None if they must be fetched.
+        """
+        if not use_cache or self.refresh:
+            return None
+        if image_name:
+            entry = self.registry_cache.get_tags(registry_url, image_name)
+        else:
+            entry = self.registry_cache.get_images(registry_url)
+        if not entry:
+            return None
+        if entry.stale:
+            self.registry_cache.revalidate(registry_url, image_name)
+        return entry.value
 
     def _handle_invalid_tag(self, image:str, tag: str, tags: tuple[str, ...]):
         click.echo(
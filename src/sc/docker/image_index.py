@@ -0,0 +1,56 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from bisect import bisect_left
+
+class ImageIndex:
+    """Looks up full image names (registry_url/image_name) by what a user typed.
+
+    A reference matches, in order of preference:
+        - an image's full name exactly,
+        - the trailing path components of image names, e.g. rdk-core or
+          org/rdk-core for ghcr.io/org/rdk-core,
+        - the end of image names, e.g. core for ghcr.io/org/rdk-core,
+        - the start of image names without their registry, e.g. rdk-co.
+    """
+    def __init__(self, images: list[str]):
+        self.images = list(dict.fromkeys(images))
+        self._exact = set(self.images)
+        self._suffixes = {}
+        for image in self.images:
+            parts = image.split("/")
+            for i in range(1, len(parts)):
+                self._suffixes.setdefault("/".join(parts[i:]), []).append(image)
+        self._by_name = sorted((image.rsplit("/", 1)[-1], image) for image in self.images)
+
+    def __contains__(self, image: str) -> bool:
+        return image in self._exact
+
+    def match(self, image_ref: str) -> list[str]:
+        """Images matching the reference, best first."""
+        if image_ref in self._exact:
+            return [image_ref]
+        if image_ref in self._suffixes:
+            return self._suffixes[image_ref]
+
+        matches = [image for image in self.images if image.endswith(image_ref)]
+        if matches:
+            return matches
+
+        matches = []
+        for name, image in self._by_name[bisect_left(self._by_name, (image_ref, "")):]:
+            if not name.startswith(image_ref):
+                break
+            matches.append(image)
+        return matches
@@ -12,8 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import requests
-
 from .registry_api import RegistryAPI
 
 class ArtifactoryAPI(RegistryAPI):
@@ -25,7 +23,8 @@ class ArtifactoryAPI(RegistryAPI):
             raise ValueError("Username is required for Artifactory API")
 
         url = f"https://{artifactory_root}/artifactory/api/docker/{repo}/v2/_catalog"
-        response = requests.get(url, auth=(username, token))
+        response = self._session(url).get(
+            url, auth=(username, token), timeout=self.timeout)
 
         if response.status_code == 200:
             data = response.json()
@@ -39,10 +38,19 @@ class ArtifactoryAPI(RegistryAPI):
             raise ValueError("Username is required for Artifactory API")
 
         url = f"https://{artifactory_root}/artifactory/api/docker/{repo}/v2/{container_name}/tags/list"
-        response = requests.get(url, auth=(username, token))
+        response = self._session(url).get(
+            url, auth=(username, token), timeout=self.timeout)
 
         if response.status_code == 200:
             data = response.json()
             return tuple(data.get('tags', ()))
         else:
             raise self.RegistryAPIException(self.reg_type, registry, response = response)
+
+    def has_tag(self, registry, username, token, container_name, tag) -> bool:
+        artifactory_root, repo = registry.split('/', 1)
+        url = f"https://{artifactory_root}/artifactory/api/docker/{repo}/v2/{container_name}/manifests/{tag}"
+        found = self._head_manifest(url, auth=(username, token))
+        if found is None:
+            return super().has_tag(registry, username, token, container_name, tag)
+        return found
@@ -12,57 +12,112 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
+
 import requests
 
 from .registry_api import RegistryAPI
 
+MAX_PAGE_WORKERS = 8
+
 class GithubAPI(RegistryAPI):
     reg_type = "Github"
     _BASE_URL: str = "https://api.github.com"
 
     def fetch_images(self, registry, username, token) -> tuple[str, ...]:
         org = registry.split('/')[-1]
-        url = f"{self._BASE_URL}/orgs/{org}/packages?package_type=container"
+        url = f"{self._BASE_URL}/orgs/{org}/packages?package_type=container&per_page=100"
         headers = {
             "Authorization": f"Bearer {token}",
             "Accept": "application/vnd.github+json"
         }
 
-        containers = []
-        while url:
-            response = requests.get(url, headers=headers)
-            if response.status_code == 200:
-                page_containers = response.json()
-                containers.extend([container['name'] for container in page_containers])
-
-                link_header = response.headers.get('Link', '')
-                url = response.links.get('next', {}).get('url')
-            else:
-                raise self.RegistryAPIException(self.reg_type, registry, response = response)
-        
-        return tuple(containers)
+        return tuple(container['name'] for container in self._get_all_pages(registry, url, headers))
 
     def fetch_tags(self, registry, username, token, container_name) -> tuple[str, ...]:
         org = registry.split('/')[-1]
-        url = f"{self._BASE_URL}/orgs/{org}/packages/container/{container_name}/versions"
+        url = f"{self._BASE_URL}/orgs/{org}/packages/container/{container_name}/versions?per_page=100"
         headers = {
             "Authorization": f"Bearer {token}",
             "Accept": "application/vnd.github+json"
         }
 
-        tags = []
-        while url:
-            response = requests.get(url, headers=headers)
-            if response.status_code == 200:
-                page_versions = response.json()
-                for version in page_versions:
-                    tags.append(version['metadata']['container']['tags'])
-
-                # Check for pagination
-                link_header = response.headers.get('Link', '')
-                url = response.links.get('next', {}).get('url')
-            else:
-                raise self.RegistryAPIException(self.reg_type, registry, response = response)
-        
+        versions = self._get_all_pages(registry, url, headers)
         # Flatten the list of tags (since each version may have multiple tags)
-        return tuple(tag for sublist in tags for tag in sublist)
+        return tuple(tag for version in versions for tag in version['metadata']['container']['tags'])
+
+    def has_tag(self, registry, username, token, container_name, tag) -> bool:
+        host, org = registry.split('/')[0], registry.split('/')[-1]
+        found = None
+        if registry_token := self._get_registry_token(host, org, container_name, username, token):
+            url = f"https://{host}/v2/{org}/{container_name}/manifests/{tag}"
+            found = self._head_manifest(url, headers={"Authorization": f"Bearer {registry_token}"})
+        if found is None:
+            return super().has_tag(registry, username, token, container_name, tag)
+        return found
+
+    def iter_tags(self, registry, username, token, container_name) -> Iterator[str]:
+        org = registry.split('/')[-1]
+        url = f"{self._BASE_URL}/orgs/{org}/packages/container/{container_name}/versions?per_page=100"
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json"
+        }
+
+        while url:
+            response = self._get(registry, url, headers)
+            for version in response.json():
+                yield from version['metadata']['container']['tags']
+            url = response.links.get('next', {}).get('url')
+
+    def _get_registry_token(self, host, org, container_name, username, token) -> str | None:
+        """A pull token for an image from the container registry's token endpoint."""
+        url = f"https://{host}/token"
+        params = {"scope": f"repository:{org}/{container_name}:pull"}
+        try:
+            response = self._session(url).get(
+                url, params=params, auth=(username, token), timeout=self.timeout)
+        except requests.RequestException:
+            return None
+        if response.status_code != 200:
+            return None
+        try:
+            return response.json().get('token')
+        except ValueError:
+            return None
+
+    def _get_all_pages(self, registry: str, url: str, headers: dict) -> list:
+        """Get every page of a paginated listing.
+
+        The first page's Link header says which page is last, so the rest are
+        fetched in parallel. Without it, next links are followed one by one.
+        """
+        response = self._get(registry, url, headers)
+        items = list(response.json())
+
+        if last_url := response.links.get('last', {}).get('url'):
+            last_page = int(parse_qs(urlsplit(last_url).query).get('page', ['1'])[0])
+            page_urls = [_with_page(last_url, page) for page in range(2, last_page + 1)]
+            with ThreadPoolExecutor(max_workers=min(MAX_PAGE_WORKERS, len(page_urls) or 1)) as pool:
+                for page in pool.map(lambda page_url: self._get(registry, page_url, headers), page_urls):
+                    items.extend(page.json())
+            return items
+
+        while url := response.links.get('next', {}).get('url'):
+            response = self._get(registry, url, headers)
+            items.extend(response.json())
+        return items
+
+    def _get(self, registry: str, url: str, headers: dict) -> requests.Response:
+        response = self._session(url).get(url, headers=headers, timeout=self.timeout)
+        if response.status_code != 200:
+            raise self.RegistryAPIException(self.reg_type, registry, response = response)
+        return response
+
+def _with_page(url: str, page: int) -> str:
+    parts = urlsplit(url)
+    query = parse_qs(parts.query)
+    query['page'] = [str(page)]
+    return urlunsplit(parts._replace(query=urlencode(query, doseq=True)))
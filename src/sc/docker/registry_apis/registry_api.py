@@ -13,11 +13,36 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+import threading
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Seconds to wait for a registry to accept a connection, and between bytes of its reply.
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 30
+
+# Connections kept open to each registry host, enough for parallel page fetches.
+POOL_SIZE = 8
+MAX_RETRIES = 3
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+MANIFEST_MEDIA_TYPES = ", ".join((
+    "application/vnd.oci.image.index.v1+json",
+    "application/vnd.oci.image.manifest.v1+json",
+    "application/vnd.docker.distribution.manifest.list.v2+json",
+    "application/vnd.docker.distribution.manifest.v2+json",
+))
 
 class RegistryAPI(ABC):
     reg_type = "NotImplemented"
+    timeout = (CONNECT_TIMEOUT, READ_TIMEOUT)
+
+    _sessions: dict[str, requests.Session] = {}
+    _sessions_lock = threading.Lock()
 
     @abstractmethod
     def fetch_images(self, registry, username, token) -> tuple[str, ...]:
@@ -27,6 +52,74 @@ class RegistryAPI(ABC):
     def fetch_tags(self, registry, username, token, container_name) -> tuple[str, ...]:
         raise NotImplementedError
 
+    def has_tag(self, registry, username, token, container_name, tag) -> bool:
+        """Whether an image has a tag.
+
+        Registries that can check a tag's manifest directly override this. The
+        default looks through the image's tags, stopping once the tag is found.
+        """
+        return any(t == tag for t in self.iter_tags(registry, username, token, container_name))
+
+    def iter_tags(self, registry, username, token, container_name) -> Iterator[str]:
+        """The tags of an image, fetched a page at a time where the registry pages them."""
+        yield from self.fetch_tags(registry, username, token, container_name)
+
+    def _head_manifest(
+            self,
+            url: str,
+            auth: tuple[str, str] | None = None,
+            headers: dict[str, str] | None = None
+        ) -> bool | None:
+        """Check a manifest exists with a HEAD of the registry's distribution API.
+
+        Returns:
+            bool | None: Whether the manifest exists, or None if the registry
+                couldn't say, e.g. the request wasn't authorised.
+        """
+        headers = {"Accept": MANIFEST_MEDIA_TYPES, **(headers or {})}
+        try:
+            response = self._session(url).head(
+                url, auth=auth, headers=headers, timeout=self.timeout, allow_redirects=True)
+        except requests.RequestException:
+            return None
+        if response.status_code == 200:
+            return True
+        if response.status_code == 404:
+            return False
+        return None
+
+    @classmethod
+    def _session(cls, url: str) -> requests.Session:
+        """The session for a registry host, shared by every query to it so
+        connections are reused.
+
+        Credentials differ between users and images, e.g. ghcr pull tokens are
+        scoped to one image, so they're passed with each request rather than kept
+        on the session. Idempotent requests are retried with exponential backoff
+        on connection errors, rate limiting and server errors, waiting as long as
+        a Retry-After header asks.
+        """
+        host = urlsplit(url).netloc
+        with cls._sessions_lock:
+            if session := cls._sessions.get(host):
+                return session
+
+            retry = Retry(
+                total=MAX_RETRIES,
+                read=1,
+                backoff_factor=0.5,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=frozenset({"GET", "HEAD"}),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+            adapter = HTTPAdapter(pool_maxsize=POOL_SIZE, max_retries=retry)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            cls._sessions[host] = session
+            return session
+
     class RegistryAPIException(RuntimeError):
         def __init__(
                 self, 
@@ -0,0 +1,123 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+import time
+from urllib.parse import quote
+
+DOCKER_CACHE_DIR = Path.home() / ".sc_config" / "docker_cache"
+
+CATALOG_TTL = 3600
+TAGS_TTL = 600
+MAX_STALE = 7 * 24 * 3600
+REVALIDATE_INTERVAL = 300
+
+@dataclass
+class CacheEntry:
+    value: tuple[str, ...]
+    fetched: float
+    ttl: int
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched
+
+    @property
+    def stale(self) -> bool:
+        """Older than its ttl, usable while it is refreshed in the background."""
+        return self.age >= self.ttl
+
+    @property
+    def expired(self) -> bool:
+        """Too old to use at all, it must be fetched again first."""
+        return self.age >= MAX_STALE
+
+class RegistryCache:
+    """On-disk cache of registry catalogs and image tags.
+
+    Each registry has a directory holding its catalog and the tags of each image
+    as json. Entries past their ttl are stale: they're still returned, and the
+    caller starts a background refresh, so a run never waits on a registry that
+    answered recently. Entries older than a week are treated as missing.
+    """
+    CATALOG_FILE_NAME = "catalog.json"
+    TAGS_DIR_NAME = "tags"
+
+    def __init__(self, cache_dir: Path = DOCKER_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    def get_images(self, registry_url: str) -> CacheEntry | None:
+        return self._read(self._catalog_path(registry_url), CATALOG_TTL)
+
+    def set_images(self, registry_url: str, images: tuple[str, ...]):
+        self._write(self._catalog_path(registry_url), images)
+
+    def get_tags(self, registry_url: str, image_name: str) -> CacheEntry | None:
+        return self._read(self._tags_path(registry_url, image_name), TAGS_TTL)
+
+    def set_tags(self, registry_url: str, image_name: str, tags: tuple[str, ...]):
+        self._write(self._tags_path(registry_url, image_name), tags)
+
+    def revalidate(self, registry_url: str, image_name: str | None = None):
+        """Refresh a stale entry in a detached `sc docker refresh-cache`, unless one
+        was started for it within the last few minutes."""
+        path = self._tags_path(registry_url, image_name) if image_name else \
+            self._catalog_path(registry_url)
+        stamp = path.with_name(f"{path.name}.revalidating")
+        if stamp.exists() and time.time() - stamp.stat().st_mtime < REVALIDATE_INTERVAL:
+            return
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+        stamp.touch()
+
+        cmd = [sys.executable, "-m", "sc", "docker", "refresh-cache", registry_url]
+        if image_name:
+            cmd += ["--image", image_name]
+        subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+
+    def _registry_dir(self, registry_url: str) -> Path:
+        return self.cache_dir / quote(registry_url, safe="")
+
+    def _catalog_path(self, registry_url: str) -> Path:
+        return self._registry_dir(registry_url) / self.CATALOG_FILE_NAME
+
+    def _tags_path(self, registry_url: str, image_name: str) -> Path:
+        return (self._registry_dir(registry_url) / self.TAGS_DIR_NAME /
+                f"{quote(image_name, safe='')}.json")
+
+    @staticmethod
+    def _read(path: Path, ttl: int) -> CacheEntry | None:
+        try:
+            data = json.loads(path.read_text())
+            entry = CacheEntry(tuple(data["value"]), float(data["fetched"]), ttl)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return None if entry.expired else entry
+
+    @staticmethod
+    def _write(path: Path, value: tuple[str, ...]):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"fetched": time.time(), "value": list(value)}))
+        os.replace(tmp_path, path)
@@ -37,16 +37,18 @@ def docker():
 @click.option('-t', '--tag', default='latest', help='Image tag.')
 @click.option('--x11', is_flag=True, help='Forward X11 into the docker.')
 @click.option('-v', '--volume', multiple=True, help='Mount a volume.')
+@click.option('--refresh', is_flag=True, help='Fetch image names and tags from the registries instead of the cache.')
 def run(
         image: str, 
         command: tuple[str, ...], 
         local: bool, 
         tag: str, 
         x11: bool, 
-        volume: tuple[str, ...]
+        volume: tuple[str, ...],
+        refresh: bool
     ):
     """Run a docker using its name or its URL and name."""
-    SCDocker().run(
+    SCDocker(refresh=refresh).run(
         image_ref=image, 
         command=command, 
         local=local, 
@@ -56,9 +58,17 @@ def run(
     )
 
 @docker.command()
-def list():
+@click.option('--refresh', is_flag=True, help='Fetch image names from the registries instead of the cache.')
+def list(refresh: bool):
     """List local and remote containers."""
-    SCDocker().list_images()
+    SCDocker(refresh=refresh).list_images()
+
+@docker.command(name='refresh-cache', hidden=True)
+@click.argument('registry_url')
+@click.option('--image', help='Refresh the tags of this image instead of the catalog.')
+def refresh_cache(registry_url: str, image: str | None):
+    """Refresh the cached catalog or image tags of a registry."""
+    SCDocker(refresh=True).refresh_cache(registry_url, image)
 
 @docker.command()
 def login():
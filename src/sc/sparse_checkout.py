@@ -0,0 +1,179 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+from pathlib import Path
+import re
+import subprocess
+import xml.etree.ElementTree as ET
+
+from sc.config_manager import ConfigManager
+
+logger = logging.getLogger(__name__)
+
+SPARSE_ANNOTATION = "SC_SPARSE_CHECKOUT"
+
+class SparseProfiles:
+    """Sparse checkout profiles of a repo workspace's projects, keyed by project path.
+
+    A profile is the list of directories a project checks out, in git's cone mode.
+    Profiles come from a SC_SPARSE_CHECKOUT annotation on a manifest project, the
+    directories separated by spaces or commas, or from the sparse_checkout section
+    of the sc config, which takes precedence:
+
+        sparse_checkout:
+          prebuilts/toolchain: [bin, lib/gcc]
+
+    The sparse index is kept off as GitPython reads the index itself, so status and
+    clean tree checks work the same on sparse trees.
+    """
+    def __init__(self, profiles: dict[str, list[str]], names: dict[str, str] | None = None):
+        self.profiles = profiles
+        self.names = names or {}
+
+    @classmethod
+    def load(cls, top_dir: Path) -> "SparseProfiles":
+        """Load the profiles of the projects in a workspace's manifest."""
+        profiles = {}
+        names = {}
+        for project in cls._read_manifest_projects(top_dir):
+            path = project.get("path") or project.get("name")
+            names[path] = project.get("name")
+            for annotation in project.iter("annotation"):
+                if annotation.get("name") == SPARSE_ANNOTATION:
+                    profiles[path] = _split_dirs(annotation.get("value", ""))
+
+        for path, dirs in ConfigManager("sparse_checkout").get_config().items():
+            path = str(path).strip("/")
+            if path not in names:
+                logger.debug(f"Sparse checkout profile for unknown project {path}")
+                continue
+            profiles[path] = _split_dirs(dirs) if isinstance(dirs, str) else \
+                [str(d).strip("/") for d in dirs or []]
+
+        return cls({path: dirs for path, dirs in profiles.items() if dirs}, names)
+
+    def __bool__(self) -> bool:
+        return bool(self.profiles)
+
+    def get(self, path: str) -> list[str] | None:
+        return self.profiles.get(path)
+
+    def prepare(self, top_dir: Path):
+        """Set up sparse checkout in the git dirs of projects that are yet to be
+        checked out, so their first checkout only writes the profile's directories.
+        Projects that are already checked out have the profile applied instead.
+        """
+        for path, dirs in self.profiles.items():
+            if (Path(top_dir) / path / '.git').exists():
+                apply_sparse_checkout(Path(top_dir) / path, dirs)
+                continue
+
+            git_dir = Path(top_dir) / '.repo' / 'projects' / f"{path}.git"
+            if not git_dir.is_dir():
+                continue
+            for key in ("core.sparseCheckout", "core.sparseCheckoutCone"):
+                subprocess.run(
+                    ["git", "--git-dir", str(git_dir), "config", key, "true"], check=True)
+            info_dir = git_dir / 'info'
+            info_dir.mkdir(exist_ok=True)
+            (info_dir / 'sparse-checkout').write_text("\n".join(cone_patterns(dirs)) + "\n")
+
+    def apply(self, top_dir: Path, jobs: int | None = None):
+        """Apply the profiles to the checked out projects that don't match theirs."""
+        def apply_project(item: tuple[str, list[str]]):
+            path, dirs = item
+            repo_dir = Path(top_dir) / path
+            if not (repo_dir / '.git').exists():
+                return
+            if sparse_checkout_dirs(repo_dir) != sorted(dirs):
+                apply_sparse_checkout(repo_dir, dirs)
+
+        with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+            list(pool.map(apply_project, self.profiles.items()))
+
+    @staticmethod
+    def _read_manifest_projects(top_dir: Path) -> list[ET.Element]:
+        # repo manifest resolves includes and local manifests into one document.
+        result = subprocess.run(
+            ["repo", "manifest"],
+            cwd=top_dir,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        if result.returncode != 0:
+            logger.warning(f"Couldn't read the manifest for sparse profiles: {result.stderr}")
+            return []
+        try:
+            return ET.fromstring(result.stdout).findall("project")
+        except ET.ParseError as e:
+            logger.warning(f"Couldn't parse the manifest for sparse profiles: {e}")
+            return []
+
+def apply_sparse_checkout(repo_dir: Path, dirs: list[str]):
+    """Limit a checked out repository to dirs, in cone mode."""
+    logger.info(f"Sparse checkout of {repo_dir}: {' '.join(dirs)}")
+    subprocess.run(
+        ["git", "sparse-checkout", "set", "--cone", "--no-sparse-index", *dirs],
+        cwd=repo_dir,
+        check=True
+    )
+
+def sparse_checkout_dirs(repo_dir: Path) -> list[str] | None:
+    """The directories a repository's sparse checkout is limited to, or None if it
+    isn't sparse."""
+    result = subprocess.run(
+        ["git", "config", "--bool", "core.sparseCheckout"],
+        cwd=repo_dir,
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    if result.stdout.strip() != "true":
+        return None
+    result = subprocess.run(
+        ["git", "sparse-checkout", "list"],
+        cwd=repo_dir,
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    return sorted(line for line in result.stdout.splitlines() if line)
+
+def cone_patterns(dirs: list[str]) -> list[str]:
+    """The sparse-checkout file git writes in cone mode for dirs.
+
+    Files at the top level are kept, and for each directory, the files of its
+    parents but not their other subdirectories.
+    """
+    patterns = ["/*", "!/*/"]
+    parents = set()
+    for directory in sorted(dirs):
+        parts = directory.strip("/").split("/")
+        for depth in range(1, len(parts)):
+            parents.add("/".join(parts[:depth]))
+    recursive = sorted(d.strip("/") for d in dirs)
+
+    for directory in sorted(parents | set(recursive)):
+        patterns.append(f"/{directory}/")
+        if directory in parents and directory not in recursive:
+            patterns.append(f"!/{directory}/*/")
+    return patterns
+
+def _split_dirs(value: str) -> list[str]:
+    return [d.strip("/") for d in re.split(r"[\s,]+", value) if d.strip("/")]
@@ -50,5 +50,21 @@ class TestInit(unittest.TestCase):
         self.assertEqual(
             GitFlowLibrary.get_master_branch(top_dir / proj.name), "donut-master")
 
+    def test_init_skips_projects_outside_groups(self):
+        """Workspaces cloned with groups only have some of the manifest's projects."""
+        proj = self.repo_client.add_project()
+        other_proj = self.repo_client.add_project(groups="other")
+        top_dir = self.repo_client.create("develop", sc_init=False)
+        subprocess.run(
+            ["repo", "init", "-g", "default,-other"],
+            cwd=top_dir, capture_output=True, check=True)
+        subprocess.run(["repo", "sync"], cwd=top_dir, capture_output=True, check=True)
+
+        result = subprocess.run(["sc", "init"], cwd=top_dir)
+
+        self.assertEqual(result.returncode, 0)
+        self.assertTrue(GitFlowLibrary.is_gitflow_enabled(top_dir / proj.name))
+        self.assertFalse((top_dir / other_proj.name).exists())
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,160 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from contextlib import redirect_stdout
+import io
+import os
+from pathlib import Path
+import shutil
+import subprocess
+import tempfile
+import time
+import unittest
+
+from sc.clone.cache.cache import SCCache
+from sc.clone.cache.cache_config import CacheConfig
+from sc.clone.cache.cache_index import CacheIndex
+
+class TestPrune(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self.tmp.name)
+        self.cache_dir = self.tmp_path / "caches"
+        self.cache = SCCache(self.cache_dir)
+        self.cache.config = CacheConfig(lock_timeout=5)
+
+        self.host_dir = self.cache_dir / ".git-mirrors" / "example.com"
+        now = time.time()
+        self.old_mirror = self._make_mirror("org/old", now - 3600)
+        self.new_mirror = self._make_mirror("org/new", now)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _git(self, *args: str) -> str:
+        return subprocess.run(
+            ["git", "-c", "user.name=sc", "-c", "user.email=sc@example.com", *args],
+            capture_output=True, check=True, text=True).stdout
+
+    def _make_mirror(self, name: str, last_used: float) -> Path:
+        work = self.tmp_path / "work" / name
+        self._git("init", "-q", str(work))
+        (work / "data").write_bytes(os.urandom(64 * 1024))
+        self._git("-C", str(work), "add", "data")
+        self._git("-C", str(work), "commit", "-q", "-m", name)
+
+        mirror = self.host_dir / f"{name}.git"
+        self._git("clone", "-q", "--mirror", str(work), str(mirror))
+        CacheIndex(self.host_dir).record_use(mirror)
+        stamp = mirror / CacheIndex.LAST_USED_FILE_NAME
+        os.utime(stamp, (last_used, last_used))
+        return mirror
+
+    def _total_size(self) -> int:
+        return sum(self.cache._get_dir_size(h) for h in self.cache._get_host_dirs())
+
+    def test_within_budget_evicts_nothing(self):
+        self.cache.prune(max_size=str(self._total_size()))
+
+        self.assertTrue(self.old_mirror.is_dir())
+        self.assertTrue(self.new_mirror.is_dir())
+
+    def test_least_recently_used_mirror_is_evicted_first(self):
+        self.cache.prune(max_size=str(self._total_size() - 1))
+
+        self.assertFalse(self.old_mirror.exists())
+        self.assertTrue(self.new_mirror.is_dir())
+
+    def test_mirrors_are_evicted_until_within_budget(self):
+        self.cache.prune(max_size="1")
+
+        self.assertFalse(self.old_mirror.exists())
+        self.assertFalse(self.new_mirror.exists())
+
+    def test_dry_run_evicts_nothing(self):
+        with redirect_stdout(io.StringIO()) as out:
+            self.cache.prune(max_size="1", dry_run=True)
+
+        self.assertIn("Would evict .git-mirrors/example.com/org/old", out.getvalue())
+        self.assertTrue(self.old_mirror.is_dir())
+        self.assertTrue(self.new_mirror.is_dir())
+
+    def test_no_budget_evicts_nothing(self):
+        self.cache.prune()
+
+        self.assertTrue(self.old_mirror.is_dir())
+
+    def test_borrowing_workspace_is_dissociated_before_eviction(self):
+        workspace = self.tmp_path / "workspace"
+        self._git("clone", "-q", "--reference", str(self.old_mirror),
+                  str(self.tmp_path / "work" / "org" / "old"), str(workspace))
+        alternates_file = workspace / ".git" / "objects" / "info" / "alternates"
+        self.assertTrue(alternates_file.is_file())
+        CacheIndex(self.host_dir).register_workspace(workspace / ".git")
+
+        self.cache.prune(max_size=str(self._total_size() - 1))
+
+        self.assertFalse(self.old_mirror.exists())
+        self.assertFalse(alternates_file.exists())
+        self._git("-C", str(workspace), "fsck", "--connectivity-only")
+        self.assertEqual(self._git("-C", str(workspace), "log", "--format=%s").strip(), "org/old")
+
+    def test_borrowing_repo_workspace_is_dissociated_before_eviction(self):
+        host_dir = self.cache_dir / "example.com"
+        mirror = host_dir / "org" / "project.git"
+        self._git("clone", "-q", "--mirror", str(self.tmp_path / "work" / "org" / "old"),
+                  str(mirror))
+        sha = self._git("--git-dir", str(mirror), "rev-parse", "HEAD").strip()
+
+        # Repo keeps the objects, borrowed from the mirror, apart from the refs.
+        workspace = self.tmp_path / "repo-workspace"
+        objects_git_dir = workspace / ".repo" / "project-objects" / "org" / "project.git"
+        self._git("init", "-q", "--bare", str(objects_git_dir))
+        alternates_file = objects_git_dir / "objects" / "info" / "alternates"
+        alternates_file.write_text(f"{mirror / 'objects'}\n")
+        project_git_dir = workspace / ".repo" / "projects" / "project.git"
+        self._git("init", "-q", "--bare", str(project_git_dir))
+        shutil.rmtree(project_git_dir / "objects")
+        (project_git_dir / "objects").symlink_to(objects_git_dir / "objects")
+        self._git("--git-dir", str(project_git_dir), "update-ref", "refs/remotes/origin/main", sha)
+        CacheIndex(host_dir).register_workspace(workspace)
+
+        self.cache.prune(max_size="1")
+
+        self.assertFalse(mirror.exists())
+        self.assertFalse(alternates_file.exists())
+        self._git("--git-dir", str(project_git_dir), "fsck", "--connectivity-only")
+        self.assertEqual(
+            self._git("--git-dir", str(project_git_dir), "log", "--format=%s",
+                      "refs/remotes/origin/main").strip(),
+            "org/old")
+
+    def test_eviction_clears_repo_host_refreshes(self):
+        host_dir = self.cache_dir / "example.com"
+        host_dir.mkdir(parents=True)
+        self._git("init", "-q", "--bare", str(host_dir / "project.git"))
+        index = CacheIndex(host_dir)
+        index.record_refresh("manifest")
+        index.record_sync(["project"])
+        index.save()
+
+        self.cache.prune(max_size="1")
+
+        index = CacheIndex(host_dir)
+        self.assertFalse((host_dir / "project.git").exists())
+        self.assertIsNone(index.last_refresh("manifest"))
+        self.assertEqual(index.stale_projects(["project"], 3600), ["project"])
+
+if __name__ == "__main__":
+    unittest.main()
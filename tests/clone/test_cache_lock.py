@@ -0,0 +1,127 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import fcntl
+import os
+from pathlib import Path
+import socket
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from sc.clone.cache.cache_lock import CacheLock
+from sc.clone.cache.exceptions import CacheLockTimeout
+
+class TestCacheLock(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.tmp.name) / "cache"
+        patcher = mock.patch.multiple(CacheLock, POLL_INTERVAL=0.01, STALE_GRACE=0.05)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _lock(self, timeout: float | None = 0) -> CacheLock:
+        return CacheLock(self.cache_dir, timeout=timeout)
+
+    def _hold_lock_file(self, operation: int = fcntl.LOCK_EX) -> int:
+        """Lock the lock file as another holder would, without recording an owner."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self._lock().path, os.O_RDWR | os.O_CREAT, 0o644)
+        self.addCleanup(os.close, fd)
+        fcntl.flock(fd, operation | fcntl.LOCK_NB)
+        return fd
+
+    def _record_owner(self, pid: int, hostname: str | None = None):
+        owners_dir = self._lock().owners_dir
+        owners_dir.mkdir(parents=True, exist_ok=True)
+        (owners_dir / f"{pid}.3@{hostname or socket.gethostname()}").write_text("exclusive 0\n")
+
+    @staticmethod
+    def _dead_pid() -> int:
+        process = subprocess.Popen([sys.executable, "-c", ""])
+        process.wait()
+        return process.pid
+
+    def test_shared_locks_are_held_together(self):
+        with self._lock().shared(), self._lock().shared():
+            self.assertEqual(len(self._lock()._owners()), 2)
+        self.assertEqual(self._lock()._owners(), [])
+
+    def test_exclusive_waits_for_shared(self):
+        with self._lock().shared():
+            with self.assertRaises(CacheLockTimeout):
+                with self._lock(timeout=0.05).exclusive():
+                    pass
+            self.assertFalse(self._lock().try_exclusive())
+        self.assertTrue(self._lock().try_exclusive())
+
+    def test_shared_waits_for_exclusive(self):
+        with self._lock().exclusive():
+            with self.assertRaises(CacheLockTimeout) as cm:
+                with self._lock().shared():
+                    pass
+        self.assertIn(str(os.getpid()), str(cm.exception))
+
+    def test_try_exclusive_does_not_keep_lock(self):
+        self.assertTrue(self._lock().try_exclusive())
+        with self._lock().exclusive():
+            pass
+
+    def test_lock_of_dead_owner_is_removed(self):
+        self._hold_lock_file()
+        self._record_owner(self._dead_pid())
+
+        with self.assertLogs(level="WARNING"):
+            with self._lock(timeout=5).exclusive():
+                owners = self._lock()._owners()
+
+        self.assertEqual(len(owners), 1)
+        self.assertTrue(owners[0].startswith(f"{os.getpid()}."))
+
+    def test_lock_without_owners_is_not_stale(self):
+        self._hold_lock_file()
+
+        with self.assertRaises(CacheLockTimeout):
+            with self._lock(timeout=0.2).shared():
+                pass
+
+    def test_lock_of_live_owner_is_not_stale(self):
+        self._hold_lock_file()
+        self._record_owner(os.getpid())
+
+        with self.assertRaises(CacheLockTimeout):
+            with self._lock(timeout=0.2).shared():
+                pass
+
+    def test_lock_of_owner_on_another_host_is_not_stale(self):
+        self._hold_lock_file()
+        self._record_owner(self._dead_pid(), hostname="other-host")
+
+        with self.assertRaises(CacheLockTimeout):
+            with self._lock(timeout=0.2).shared():
+                pass
+
+    def test_dead_owners_are_pruned_when_lock_is_taken(self):
+        self._record_owner(self._dead_pid())
+
+        with self._lock().shared():
+            self.assertEqual(len(self._lock()._owners()), 1)
+
+if __name__ == "__main__":
+    unittest.main()
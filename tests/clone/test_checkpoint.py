@@ -0,0 +1,119 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+import tempfile
+import unittest
+
+from sc.clone.checkpoint import CloneCheckpoint
+from sc.clone.project_list.project_list import Project
+
+class TestCloneCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmp.name)
+        self.project = Project(
+            name="rdk",
+            description="RDK",
+            type="repo",
+            branch="develop",
+            project_repo="https://example.com/manifest",
+            manifest="default.xml",
+        )
+        self.key = CloneCheckpoint.make_key(self.project, {"rev": None, "manifest": None})
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _save(self, git_dir: str = ".repo") -> CloneCheckpoint:
+        checkpoint = CloneCheckpoint(
+            self.directory / git_dir / CloneCheckpoint.FILE_NAME, self.key)
+        checkpoint.save()
+        return checkpoint
+
+    def test_make_key(self):
+        self.assertEqual(self.key, {
+            "project": "rdk",
+            "uri": "https://example.com/manifest",
+            "rev": "develop",
+            "manifest": "default.xml",
+        })
+
+    def test_make_key_prefers_cli_overrides(self):
+        key = CloneCheckpoint.make_key(
+            self.project, {"rev": "release/1.0", "manifest": "other.xml"})
+        self.assertEqual(key["rev"], "release/1.0")
+        self.assertEqual(key["manifest"], "other.xml")
+
+    def test_no_mismatches_for_same_key(self):
+        self._save()
+
+        checkpoint = CloneCheckpoint.find(self.directory)
+
+        self.assertEqual(checkpoint.mismatches(self.key), [])
+
+    def test_mismatches_name_each_differing_field(self):
+        self._save()
+        key = CloneCheckpoint.make_key(
+            self.project, {"rev": "release/1.0", "manifest": "other.xml"})
+
+        mismatches = CloneCheckpoint.find(self.directory).mismatches(key)
+
+        self.assertEqual(mismatches, [
+            "rev: develop != release/1.0",
+            "manifest: default.xml != other.xml",
+        ])
+
+    def test_mismatches_against_empty_key(self):
+        checkpoint = CloneCheckpoint(self.directory / CloneCheckpoint.FILE_NAME)
+
+        self.assertEqual(len(checkpoint.mismatches(self.key)), len(self.key))
+
+    def test_done_steps_are_saved(self):
+        checkpoint = self._save()
+        checkpoint.mark_done(CloneCheckpoint.SYNC)
+        checkpoint.mark_done(CloneCheckpoint.SYNC)
+
+        found = CloneCheckpoint.find(self.directory)
+
+        self.assertTrue(found.is_done(CloneCheckpoint.SYNC))
+        self.assertFalse(found.is_done(CloneCheckpoint.HOOKS))
+        self.assertEqual(found._data["done"], [CloneCheckpoint.SYNC])
+
+    def test_find_git_checkpoint(self):
+        self._save(".git")
+
+        self.assertEqual(CloneCheckpoint.find(self.directory).key, self.key)
+
+    def test_find_without_checkpoint(self):
+        self.assertIsNone(CloneCheckpoint.find(self.directory))
+
+    def test_find_ignores_unreadable_checkpoint(self):
+        path = self.directory / ".repo" / CloneCheckpoint.FILE_NAME
+        path.parent.mkdir()
+        path.write_text("{not json")
+
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(CloneCheckpoint.find(self.directory))
+
+    def test_complete_removes_checkpoint(self):
+        checkpoint = self._save()
+
+        checkpoint.complete()
+        checkpoint.complete()
+
+        self.assertIsNone(CloneCheckpoint.find(self.directory))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+import subprocess
+import tempfile
+import unittest
+
+from sc.clone.cloners import cloner
+from sc.clone.cloners.cloner import RefType, resolve_ref_type
+
+class TestResolveRefType(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self.tmp.name)
+        cloner._ref_types.clear()
+
+        work = self.tmp_path / "work"
+        self._git("init", "-q", "-b", "master", str(work))
+        self._git("-C", str(work), "commit", "-q", "--allow-empty", "-m", "initial")
+        self._git("-C", str(work), "branch", "develop")
+        self._git("-C", str(work), "branch", "release/1.0")
+        self._git("-C", str(work), "branch", "v2-fixes")
+        self._git("-C", str(work), "tag", "v2")
+        self.sha = self._git("-C", str(work), "rev-parse", "HEAD").strip()
+
+        self.remote = self.tmp_path / "remote.git"
+        self._git("clone", "-q", "--bare", str(work), str(self.remote))
+        self.uri = self.remote.as_uri()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        cloner._ref_types.clear()
+
+    def _git(self, *args: str) -> str:
+        return subprocess.run(
+            ["git", "-c", "user.name=sc", "-c", "user.email=sc@example.com", *args],
+            capture_output=True, check=True, text=True).stdout
+
+    def test_branch(self):
+        self.assertEqual(resolve_ref_type(self.uri, "develop"), RefType.BRANCH)
+
+    def test_branch_with_slash(self):
+        self.assertEqual(resolve_ref_type(self.uri, "release/1.0"), RefType.BRANCH)
+
+    def test_tag(self):
+        self.assertEqual(resolve_ref_type(self.uri, "v2"), RefType.TAG)
+
+    def test_full_sha(self):
+        self.assertEqual(resolve_ref_type(self.uri, self.sha), RefType.SHA)
+
+    def test_short_sha(self):
+        self.assertEqual(resolve_ref_type(self.uri, self.sha[:10]), RefType.SHA)
+
+    def test_no_ref_is_default_branch(self):
+        self.assertEqual(resolve_ref_type(self.uri, None), RefType.BRANCH)
+
+    def test_trailing_component_of_other_ref_is_not_a_branch(self):
+        # ls-remote's pattern "1.0" would also match refs/heads/release/1.0.
+        self.assertEqual(resolve_ref_type(self.uri, "1.0"), RefType.SHA)
+
+    def test_prefix_of_other_ref_is_not_a_branch(self):
+        self.assertEqual(resolve_ref_type(self.uri, "v2-fix"), RefType.SHA)
+        self.assertEqual(resolve_ref_type(self.uri, "release"), RefType.SHA)
+
+    def test_successful_lookup_is_memoized(self):
+        self.assertEqual(resolve_ref_type(self.uri, "develop"), RefType.BRANCH)
+        self._git("--git-dir", str(self.remote), "branch", "-D", "develop")
+
+        self.assertEqual(resolve_ref_type(self.uri, "develop"), RefType.BRANCH)
+
+    def test_failed_lookup_is_not_memoized(self):
+        missing = self.tmp_path / "missing.git"
+        self.assertEqual(resolve_ref_type(missing.as_uri(), "develop"), RefType.SHA)
+
+        self._git("clone", "-q", "--bare", str(self.remote), str(missing))
+
+        self.assertEqual(resolve_ref_type(missing.as_uri(), "develop"), RefType.BRANCH)
+
+if __name__ == "__main__":
+    unittest.main()
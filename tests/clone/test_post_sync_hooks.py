@@ -0,0 +1,222 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from contextlib import redirect_stdout
+import io
+from pathlib import Path
+import tempfile
+import unittest
+
+from sc.clone.cloners.post_sync_hooks import PostSyncHook, PostSyncRunner
+
+class TestPostSyncRunner(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self.tmp.name)
+        self.events = self.tmp_path / "events"
+        self.events.touch()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _hook(self, name: str, body: str = "", **kwargs) -> PostSyncHook:
+        """A hook that records when it starts and ends in the events file."""
+        path = self.tmp_path / f"{name}.sh"
+        path.write_text(
+            "#!/bin/sh\n"
+            f"echo start {name} >> {self.events}\n"
+            f"{body}\n"
+            "status=$?\n"
+            f"echo end {name} >> {self.events}\n"
+            "exit $status\n"
+        )
+        path.chmod(0o755)
+        return PostSyncHook(name=name, path=path, **kwargs)
+
+    def _wait_for(self, name: str) -> str:
+        """Shell that waits for another hook to start, failing if it never does."""
+        return (f"for i in $(seq 50); do grep -q 'start {name}' {self.events} && exit 0; "
+                "sleep 0.1; done; exit 1")
+
+    def _run(self, hooks: list[PostSyncHook], jobs: int = 4) -> list[str]:
+        with redirect_stdout(io.StringIO()):
+            PostSyncRunner(hooks, self.tmp_path / "logs", jobs).run()
+        return self.events.read_text().splitlines()
+
+    def test_serial_hooks_run_one_at_a_time_in_order(self):
+        hooks = [self._hook(name, "sleep 0.1") for name in ("a", "b", "c")]
+
+        events = self._run(hooks)
+
+        self.assertEqual(events, ["start a", "end a", "start b", "end b", "start c", "end c"])
+        self.assertEqual([hook.status for hook in hooks], ["ok"] * 3)
+
+    def test_parallel_hooks_run_together(self):
+        hooks = [
+            self._hook("a", self._wait_for("b"), parallel=True),
+            self._hook("b", self._wait_for("a"), parallel=True),
+        ]
+
+        self._run(hooks)
+
+        self.assertEqual([hook.status for hook in hooks], ["ok", "ok"])
+        self.assertTrue(all(hook.log_path.is_file() for hook in hooks))
+
+    def test_parallel_hooks_wait_for_earlier_serial_hook(self):
+        hooks = [
+            self._hook("serial", "sleep 0.2"),
+            self._hook("a", parallel=True),
+            self._hook("b", parallel=True),
+        ]
+
+        events = self._run(hooks)
+
+        self.assertEqual(events[:2], ["start serial", "end serial"])
+
+    def test_serial_hook_waits_for_earlier_parallel_hooks(self):
+        hooks = [
+            self._hook("a", "sleep 0.2", parallel=True),
+            self._hook("b", "sleep 0.1", parallel=True),
+            self._hook("serial"),
+        ]
+
+        events = self._run(hooks)
+
+        self.assertEqual(events[-2:], ["start serial", "end serial"])
+
+    def test_hook_waits_for_its_dependencies(self):
+        hooks = [
+            self._hook("toolchain", "sleep 0.2", parallel=True),
+            self._hook("sdk", parallel=True, depends=["toolchain"]),
+        ]
+
+        events = self._run(hooks)
+
+        self.assertLess(events.index("end toolchain"), events.index("start sdk"))
+
+    def test_hook_is_skipped_when_dependency_fails(self):
+        hooks = [
+            self._hook("toolchain", "false", parallel=True),
+            self._hook("sdk", parallel=True, depends=["toolchain"]),
+            self._hook("docs", parallel=True),
+        ]
+
+        with self.assertLogs(level="WARNING"):
+            events = self._run(hooks)
+
+        self.assertEqual([hook.status for hook in hooks], ["failed", "skipped", "ok"])
+        self.assertNotIn("start sdk", events)
+
+    def test_failure_of_earlier_serial_hook_does_not_stop_later_hooks(self):
+        hooks = [self._hook("a", "false"), self._hook("b")]
+
+        with self.assertLogs(level="ERROR"):
+            self._run(hooks)
+
+        self.assertEqual([hook.status for hook in hooks], ["failed", "ok"])
+
+    def test_duplicate_names_fall_back_to_serial(self):
+        first = self._hook("a", "sleep 0.1", parallel=True)
+        hooks = [first, PostSyncHook(name="a", path=first.path, parallel=True)]
+
+        with self.assertLogs(level="WARNING"):
+            events = self._run(hooks)
+
+        self.assertEqual(events, ["start a", "end a", "start a", "end a"])
+        self.assertFalse(any(hook.parallel for hook in hooks))
+
+    def test_unknown_dependency_falls_back_to_serial(self):
+        hooks = [
+            self._hook("a", "sleep 0.1", parallel=True),
+            self._hook("b", parallel=True, depends=["missing"]),
+        ]
+
+        with self.assertLogs(level="WARNING"):
+            events = self._run(hooks)
+
+        self.assertEqual(events, ["start a", "end a", "start b", "end b"])
+
+    def test_dependency_cycle_falls_back_to_serial(self):
+        hooks = [
+            self._hook("a", parallel=True, depends=["b"]),
+            self._hook("b", parallel=True, depends=["a"]),
+        ]
+
+        with self.assertLogs(level="WARNING"):
+            self._run(hooks)
+
+        self.assertEqual([hook.status for hook in hooks], ["ok", "ok"])
+
+    def test_hook_is_killed_after_timeout(self):
+        hooks = [self._hook("slow", "sleep 10", timeout=0.2), self._hook("next")]
+
+        with self.assertLogs(level="ERROR"):
+            events = self._run(hooks)
+
+        self.assertEqual([hook.status for hook in hooks], ["timeout", "ok"])
+        self.assertNotIn("end slow", events)
+
+    def test_hook_that_is_not_executable_is_skipped(self):
+        hook = self._hook("a")
+        hook.path.chmod(0o644)
+
+        with self.assertLogs(level="WARNING"):
+            self._run([hook])
+
+        self.assertEqual(hook.status, "skipped")
+
+class TestPostSyncHookFromManifest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo_dir = Path(self.tmp.name) / ".repo"
+        self.manifests_dir = self.repo_dir / "manifests"
+        self.manifests_dir.mkdir(parents=True)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_reads_hooks_from_includes_and_local_manifests(self):
+        (self.manifests_dir / "default.xml").write_text(
+            '<manifest>\n'
+            '  <post-sync name="toolchain" path="hooks/toolchain.sh" parallel="true" timeout="600"/>\n'
+            '  <include name="sdk.xml"/>\n'
+            '  <post-sync path="hooks/last.sh"/>\n'
+            '</manifest>\n'
+        )
+        (self.manifests_dir / "sdk.xml").write_text(
+            '<manifest>\n'
+            '  <post-sync name="sdk" path="hooks/sdk.sh" parallel="yes" depends="toolchain, other"/>\n'
+            '</manifest>\n'
+        )
+        (self.repo_dir / "manifest.xml").write_text(
+            '<manifest>\n  <include name="default.xml"/>\n</manifest>\n')
+        (self.repo_dir / "local_manifests").mkdir()
+        (self.repo_dir / "local_manifests" / "local.xml").write_text(
+            '<manifest>\n  <post-sync name="local" path="hooks/local.sh" timeout="soon"/>\n</manifest>\n')
+
+        with self.assertLogs(level="WARNING"):
+            hooks = PostSyncHook.from_manifest(self.repo_dir)
+
+        self.assertEqual([hook.name for hook in hooks], ["toolchain", "sdk", "hooks/last.sh", "local"])
+        toolchain, sdk, last, local = hooks
+        self.assertEqual(toolchain.path, self.manifests_dir / "hooks" / "toolchain.sh")
+        self.assertTrue(toolchain.parallel)
+        self.assertEqual(toolchain.timeout, 600)
+        self.assertTrue(sdk.parallel)
+        self.assertEqual(sdk.depends, ["toolchain", "other"])
+        self.assertFalse(last.parallel)
+        self.assertIsNone(local.timeout)
+
+if __name__ == "__main__":
+    unittest.main()
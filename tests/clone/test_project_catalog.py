@@ -0,0 +1,136 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+import tempfile
+import unittest
+
+import yaml
+
+from sc.clone.project_list.project_catalog import ProjectCatalog
+
+PROJECTS = {
+    "project_defaults": {"project_type": "repo"},
+    "rdk": {"project_repo": "top/rdk"},
+    "middleware": {
+        "rdk": {"project_repo": "middleware/rdk"},
+        "player": {"project_repo": "middleware/player"},
+        "apps": {
+            "player": {"project_repo": "middleware/apps/player"},
+            "browser": {"project_repo": "middleware/apps/browser"},
+        },
+        "tools": {"project_suffix": "tools"},
+    },
+    "vendor": {
+        "description": "Vendor layers",
+        "browser": {"project_repo": "vendor/browser"},
+        # A group sharing its name with a project found later.
+        "tools": {
+            "sdk": {"project_repo": "vendor/tools/sdk"},
+        },
+        "sdk": {"project_repo": "vendor/sdk"},
+    },
+    "apps": {
+        "browser": {"project_repo": "apps/browser"},
+        "player": {"project_repo": "apps/player"},
+    },
+    "not-a-project": "a string",
+}
+
+def old_dfs_lookup(projects: dict, name: str) -> dict | None:
+    """The recursive search project lists used before the catalog."""
+    project = projects.get(name)
+    if project and ProjectCatalog._is_project(project):
+        return project
+    for sub_project in projects.values():
+        if isinstance(sub_project, dict) and not ProjectCatalog._is_project(sub_project):
+            found = old_dfs_lookup(sub_project, name)
+            if found:
+                return found
+    return None
+
+class TestProjectCatalog(unittest.TestCase):
+    def setUp(self):
+        self.catalog = ProjectCatalog.compile(PROJECTS)
+
+    def test_precedence_matches_old_search(self):
+        projects = dict(PROJECTS)
+        projects.pop("project_defaults")
+        for name in ["rdk", "player", "browser", "tools", "sdk", "apps", "vendor", "missing"]:
+            with self.subTest(name=name):
+                self.assertEqual(self.catalog.get(name), old_dfs_lookup(projects, name))
+
+    def test_group_projects_win_over_subgroups(self):
+        self.assertEqual(self.catalog.get("player")["project_repo"], "middleware/player")
+
+    def test_earlier_subgroups_win_over_later(self):
+        self.assertEqual(
+            self.catalog.get("browser")["project_repo"], "middleware/apps/browser")
+
+    def test_groups_are_recorded(self):
+        self.assertEqual(self.catalog.index["sdk"]["groups"], ["vendor"])
+        self.assertEqual(self.catalog.index["browser"]["groups"], ["middleware", "apps"])
+
+    def test_project_defaults_and_groups_are_not_projects(self):
+        self.assertIsNone(self.catalog.get("project_defaults"))
+        self.assertIsNone(self.catalog.get("middleware"))
+
+    def test_hierarchy_stops_at_descriptions(self):
+        names = [row["name"] for row in self.catalog.hierarchy]
+        self.assertIn("vendor", names)
+        self.assertNotIn("sdk", names)
+        rdk = self.catalog.hierarchy[0]
+        self.assertEqual(rdk, {"name": "rdk", "indent": 0, "is_project": True, "description": None})
+
+    def test_search_is_a_case_insensitive_prefix_search(self):
+        self.assertEqual(self.catalog.search("PL"), ["player"])
+        self.assertEqual(self.catalog.search("b"), ["browser"])
+        self.assertEqual(self.catalog.search("x"), [])
+
+    def test_suggest(self):
+        self.assertIn("player", self.catalog.suggest("plaer"))
+
+    def test_compile_rejects_non_mapping(self):
+        with self.assertRaises(ValueError):
+            ProjectCatalog.compile(["rdk"])
+
+class TestProjectCatalogLoad(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.yaml_path = Path(self.tmp.name) / "projects.yaml"
+        self.yaml_path.write_text(yaml.safe_dump(PROJECTS))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_load_saves_and_reuses_catalog(self):
+        ProjectCatalog.load(self.yaml_path)
+        catalog_path = self.yaml_path.with_name("projects.yaml.catalog.json")
+        self.assertTrue(catalog_path.is_file())
+
+        catalog = ProjectCatalog.load(self.yaml_path)
+
+        self.assertEqual(catalog.get("rdk")["project_repo"], "top/rdk")
+
+    def test_load_recompiles_when_yaml_changes(self):
+        ProjectCatalog.load(self.yaml_path)
+        self.yaml_path.write_text(yaml.safe_dump({"new": {"project_repo": "new"}}))
+
+        catalog = ProjectCatalog.load(self.yaml_path)
+
+        self.assertIsNone(catalog.get("rdk"))
+        self.assertEqual(catalog.get("new")["project_repo"], "new")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import tempfile
+import threading
+import unittest
+
+from sc.clone.project_list.project_list_downloader import ProjectListDownloader
+
+class ProjectListHandler(BaseHTTPRequestHandler):
+    """Serves the server's project list with an ETag, answering 304 when it matches."""
+    def do_GET(self):
+        server = self.server
+        server.requests.append(dict(self.headers))
+        if server.status != 200:
+            self.send_response(server.status)
+            self.end_headers()
+            return
+        etag = f'"{len(server.body)}-{hash(server.body)}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = server.body.encode()
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class TestProjectListDownloader(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "projects.yaml"
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), ProjectListHandler)
+        self.server.body = "rdk:\n  project_repo: rdk\n"
+        self.server.status = 200
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/projects.yaml"
+
+        self.downloader = ProjectListDownloader()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def test_download_writes_list_and_validators(self):
+        self.downloader.download(self.url, self.path)
+
+        self.assertEqual(self.path.read_text(), self.server.body)
+        self.assertTrue(self.path.with_name("projects.yaml.meta.json").is_file())
+
+    def test_unchanged_list_is_revalidated(self):
+        self.downloader.download(self.url, self.path)
+        self.path.write_text("rdk:\n  project_repo: local\n")
+
+        self.downloader.download(self.url, self.path)
+
+        self.assertIn("If-None-Match", self.server.requests[-1])
+        # A 304 keeps the copy on disk rather than downloading it again.
+        self.assertEqual(self.path.read_text(), "rdk:\n  project_repo: local\n")
+
+    def test_changed_list_is_downloaded(self):
+        self.downloader.download(self.url, self.path)
+        self.server.body = "new:\n  project_repo: new\n"
+
+        self.downloader.download(self.url, self.path)
+
+        self.assertEqual(self.path.read_text(), self.server.body)
+
+    def test_fresh_copy_is_not_checked(self):
+        self.downloader.download(self.url, self.path)
+
+        self.downloader.download(self.url, self.path, ttl=300)
+
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_force_skips_ttl_and_validators(self):
+        self.downloader.download(self.url, self.path)
+
+        self.downloader.download(self.url, self.path, ttl=300, force=True)
+
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertNotIn("If-None-Match", self.server.requests[-1])
+
+    def test_validators_of_another_url_are_not_sent(self):
+        self.downloader.download(self.url, self.path)
+
+        self.downloader.download(f"{self.url}?other", self.path)
+
+        self.assertNotIn("If-None-Match", self.server.requests[-1])
+
+    def test_falls_back_to_copy_when_server_fails(self):
+        self.downloader.download(self.url, self.path)
+        self.server.status = 500
+
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(self.downloader.download(self.url, self.path), self.path)
+        self.assertEqual(self.path.read_text(), "rdk:\n  project_repo: rdk\n")
+
+    def test_falls_back_to_copy_when_server_is_down(self):
+        self.downloader.download(self.url, self.path)
+        self.server.shutdown()
+        self.server.server_close()
+
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(self.downloader.download(self.url, self.path), self.path)
+
+    def test_fails_without_copy(self):
+        self.server.status = 404
+
+        with self.assertRaises(RuntimeError):
+            self.downloader.download(self.url, self.path)
+        self.assertFalse(self.path.exists())
+
+    def test_rejects_list_that_is_not_yaml_dict(self):
+        self.server.body = "- rdk\n"
+
+        with self.assertRaises(RuntimeError):
+            self.downloader.download(self.url, self.path)
+
+    def test_rejects_unsupported_platform(self):
+        with self.assertRaises(ValueError):
+            self.downloader.download(self.url, self.path, platform="bitbucket")
+
+if __name__ == "__main__":
+    unittest.main()
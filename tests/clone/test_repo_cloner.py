@@ -0,0 +1,206 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
+
+from sc.clone.cache import CacheConfig, CacheIndex
+from sc.clone.cloners import repo_cloner
+from sc.clone.cloners.cloner import RefType
+from sc.clone.cloners.repo_cloner import RepoCloner, RepoClonerConfig
+
+URI = "https://example.com/manifest"
+
+class FakeRepoTool:
+    """Stands in for the repo tool on a mirror, whose manifests (by branch) list
+    project names."""
+    def __init__(self, manifests: dict[str, list[str]]):
+        self.manifests = manifests
+        self.branch = None
+        self.inits = []
+        self.syncs = []
+        self.sync_error = None
+
+    def init(self, uri, directory, branch=None, mirror=False, **kwargs):
+        self.inits.append(branch)
+        self.branch = branch
+        (directory / ".repo").mkdir(exist_ok=True)
+
+    def list_projects(self, directory):
+        return {f"path/{name}": name for name in self.manifests[self.branch]}
+
+    def sync(self, directory, projects=None, **kwargs):
+        self.syncs.append(projects)
+        if self.sync_error:
+            raise self.sync_error
+        for name in projects or self.manifests[self.branch]:
+            (directory / f"{name}.git").mkdir(parents=True, exist_ok=True)
+
+class TestRefreshCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.tmp.name) / "caches"
+        self.host_dir = self.cache_dir / "example.com"
+        self.repo_tool = FakeRepoTool({"develop": ["a", "b"], "release": ["b", "c"]})
+        self.cache_config = CacheConfig(lock_timeout=5)
+        patchers = [
+            mock.patch.object(repo_cloner, "REPO_CACHE_DIR", self.cache_dir),
+            mock.patch.object(repo_cloner, "RepoTool", self.repo_tool),
+            mock.patch.object(repo_cloner.SCCache, "schedule_maintenance"),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _cache(self, branch: str = "develop", **config) -> RepoCloner:
+        cloner = RepoCloner(RepoClonerConfig(uri=URI, branch=branch, jobs=1, **config))
+        cloner._ref_type = RefType.BRANCH
+        self.assertEqual(cloner._cache(self.cache_config), self.host_dir)
+        return cloner
+
+    def test_first_refresh_syncs_whole_mirror(self):
+        cloner = self._cache()
+
+        self.assertEqual(cloner.cache_status, "refreshed")
+        self.assertEqual(self.repo_tool.syncs, [None])
+        self.assertTrue((self.host_dir / "a.git").is_dir())
+        index = CacheIndex(self.host_dir)
+        self.assertFalse(index.refresh_interrupted)
+        self.assertIsNotNone(index.last_refresh(cloner._get_cache_key()))
+
+    def test_fresh_mirror_is_not_refreshed(self):
+        self._cache()
+
+        cloner = self._cache()
+
+        self.assertEqual(cloner.cache_status, "fresh")
+        self.assertEqual(self.repo_tool.inits, ["develop"])
+        self.assertEqual(len(self.repo_tool.syncs), 1)
+
+    def test_mirror_past_ttl_is_refreshed_in_place(self):
+        self._cache()
+        self.cache_config.refresh_ttl = 0
+
+        cloner = self._cache()
+
+        self.assertEqual(cloner.cache_status, "refreshed")
+        self.assertEqual(self.repo_tool.syncs, [None, None])
+
+    def test_refresh_cache_option_resyncs_fresh_mirror(self):
+        self._cache()
+
+        cloner = self._cache(refresh_cache=True)
+
+        self.assertEqual(cloner.cache_status, "refreshed")
+        self.assertEqual(self.repo_tool.syncs, [None, None])
+
+    def test_interrupted_refresh_resyncs_whole_mirror(self):
+        self._cache()
+        index = CacheIndex(self.host_dir)
+        index.begin_refresh()
+
+        with self.assertLogs(level="WARNING"):
+            cloner = self._cache()
+
+        self.assertEqual(cloner.cache_status, "refreshed")
+        self.assertEqual(self.repo_tool.syncs, [None, None])
+        self.assertFalse(CacheIndex(self.host_dir).refresh_interrupted)
+
+    def test_failed_refresh_clones_without_cache(self):
+        self.repo_tool.sync_error = subprocess.CalledProcessError(1, ["repo", "sync"])
+        cloner = RepoCloner(RepoClonerConfig(uri=URI, branch="develop", jobs=1))
+        cloner._ref_type = RefType.BRANCH
+
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(cloner._cache(self.cache_config))
+
+        self.assertEqual(cloner.cache_status, "failed")
+        # The next refresh resyncs the whole mirror.
+        self.assertTrue(CacheIndex(self.host_dir).refresh_interrupted)
+
+    def test_second_manifest_syncs_only_its_stale_projects(self):
+        develop = self._cache("develop")
+
+        with self.assertLogs(level="INFO") as logs:
+            release = self._cache("release")
+
+        self.assertEqual(self.repo_tool.syncs, [None, ["c"]])
+        self.assertIn("Syncing 1 of 2 projects", "\n".join(logs.output))
+        self.assertEqual(release.cache_status, "refreshed")
+        index = CacheIndex(self.host_dir)
+        self.assertEqual(index.manifests, {
+            develop._get_cache_key(): ["a", "b"],
+            release._get_cache_key(): ["b", "c"],
+        })
+        self.assertEqual(index.stale_projects(["a", "b", "c"], 3600), [])
+
+    def test_manifest_with_only_recently_synced_projects_is_not_synced(self):
+        self.repo_tool.manifests["subset"] = ["a"]
+        self._cache("develop")
+
+        cloner = self._cache("subset")
+
+        self.assertEqual(self.repo_tool.syncs, [None])
+        self.assertEqual(cloner.cache_status, "refreshed")
+        self.assertIsNotNone(CacheIndex(self.host_dir).last_refresh(cloner._get_cache_key()))
+
+    def test_manifests_accumulate_in_the_mirror(self):
+        self._cache("develop")
+        self._cache("release")
+
+        cloner = self._cache("develop")
+
+        # Switching back doesn't resync what the other manifest left in the mirror.
+        self.assertEqual(cloner.cache_status, "fresh")
+        self.assertEqual(len(self.repo_tool.syncs), 2)
+        self.assertTrue(all((self.host_dir / f"{name}.git").is_dir() for name in "abc"))
+
+    def test_projects_past_ttl_are_synced_for_another_manifest(self):
+        self._cache("develop")
+        self.cache_config.refresh_ttl = 0
+
+        self._cache("release")
+
+        self.assertEqual(self.repo_tool.syncs, [None, None])
+
+    def test_stale_projects_include_evicted_mirrors(self):
+        self._cache("develop")
+        (self.host_dir / "a.git").rmdir()
+        index = CacheIndex(self.host_dir)
+
+        stale = RepoCloner._get_stale_projects(self.host_dir, index, ["a", "b"], 3600)
+
+        self.assertEqual(stale, ["a"])
+        self.assertEqual(
+            RepoCloner._get_stale_projects(self.host_dir, index, ["a", "b", "new"], 3600),
+            ["a", "new"])
+
+    def test_unlisted_projects_sync_whole_mirror(self):
+        self._cache("develop")
+        self.repo_tool.list_projects = mock.Mock(
+            side_effect=subprocess.CalledProcessError(1, ["repo", "list"]))
+
+        with self.assertLogs(level="WARNING"):
+            self._cache("release")
+
+        self.assertEqual(self.repo_tool.syncs, [None, None])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import socket
+import unittest
+from unittest import mock
+
+from sc.clone.cloners import sync_jobs
+from sc.clone.cloners.sync_jobs import SyncJobs, auto_sync_jobs, probe_latency
+
+class TestGetHostAndPort(unittest.TestCase):
+    def test_urls(self):
+        cases = {
+            "https://github.com/rdkcentral/manifest": ("github.com", 443),
+            "http://example.com/manifest": ("example.com", 80),
+            "ssh://git@example.com:29418/manifest": ("example.com", 29418),
+            "ssh://git@example.com/manifest": ("example.com", 22),
+            "git://lab-cache/manifest": ("lab-cache", 9418),
+            "https://example.com:8443/manifest": ("example.com", 8443),
+            "https://example.com:bad/manifest": ("example.com", 443),
+        }
+        for uri, expected in cases.items():
+            with self.subTest(uri=uri):
+                self.assertEqual(sync_jobs._get_host_and_port(uri), expected)
+
+    def test_scp_style(self):
+        self.assertEqual(
+            sync_jobs._get_host_and_port("git@github.com:rdkcentral/manifest.git"),
+            ("github.com", 22))
+        self.assertEqual(
+            sync_jobs._get_host_and_port("github.com:rdkcentral/manifest.git"),
+            ("github.com", 22))
+
+    def test_no_host(self):
+        self.assertIsNone(sync_jobs._get_host_and_port("file:///srv/manifest")[0])
+
+class TestAutoSyncJobs(unittest.TestCase):
+    def _auto_sync_jobs(self, cpus: int, latency: float | None) -> SyncJobs:
+        with mock.patch.object(sync_jobs.os, "cpu_count", return_value=cpus), \
+                mock.patch.object(sync_jobs, "probe_latency", return_value=latency):
+            return auto_sync_jobs("https://example.com/manifest")
+
+    def test_low_latency(self):
+        self.assertEqual(self._auto_sync_jobs(4, 0.01), SyncJobs(network=4, checkout=4))
+
+    def test_network_jobs_are_capped_by_default(self):
+        self.assertEqual(self._auto_sync_jobs(32, 0.01), SyncJobs(network=8, checkout=32))
+
+    def test_high_latency_runs_more_fetches(self):
+        self.assertEqual(self._auto_sync_jobs(4, 0.3), SyncJobs(network=8, checkout=4))
+        self.assertEqual(
+            self._auto_sync_jobs(32, 0.3),
+            SyncJobs(network=sync_jobs.MAX_NETWORK_JOBS, checkout=32))
+
+    def test_unreachable_host(self):
+        self.assertEqual(self._auto_sync_jobs(4, None), SyncJobs(network=4, checkout=4))
+
+    def test_unknown_cpu_count(self):
+        self.assertEqual(self._auto_sync_jobs(None, None), SyncJobs(network=1, checkout=1))
+
+class TestProbeLatency(unittest.TestCase):
+    def test_connects_to_listening_port(self):
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            port = server.getsockname()[1]
+            latency = probe_latency(f"https://127.0.0.1:{port}/manifest")
+        self.assertIsNotNone(latency)
+        self.assertGreaterEqual(latency, 0)
+
+    def test_closed_port(self):
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            port = server.getsockname()[1]
+        self.assertIsNone(probe_latency(f"https://127.0.0.1:{port}/manifest"))
+
+    def test_no_host(self):
+        self.assertIsNone(probe_latency("file:///srv/manifest"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest import mock
+
+import requests
+
+from sc.docker.registry_apis.artifactory import ArtifactoryAPI
+
+REGISTRY = "artifactory.example.com/docker"
+MANIFEST_URL = ("https://artifactory.example.com/artifactory/api/docker/docker/v2/"
+                "org/rdk/manifests/1.0")
+
+class TestHasTag(unittest.TestCase):
+    def setUp(self):
+        self.api = ArtifactoryAPI()
+        self.session = mock.Mock()
+        self.session.get.return_value = mock.Mock(
+            status_code=200, json=lambda: {"name": "org/rdk", "tags": ["0.9", "1.0"]})
+        patcher = mock.patch.object(ArtifactoryAPI, "_session", return_value=self.session)
+        self.get_session = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _has_tag(self, head_status: int | None, tag: str = "1.0") -> bool:
+        if head_status is None:
+            self.session.head.side_effect = requests.ConnectionError("refused")
+        else:
+            self.session.head.return_value = mock.Mock(status_code=head_status)
+        return self.api.has_tag(REGISTRY, "user", "token", "org/rdk", tag)
+
+    def test_existing_manifest(self):
+        self.assertTrue(self._has_tag(200))
+
+        self.assertEqual(self.session.head.call_args.args, (MANIFEST_URL,))
+        self.assertIn("manifest", self.session.head.call_args.kwargs["headers"]["Accept"])
+        self.assertEqual(self.session.head.call_args.kwargs["auth"], ("user", "token"))
+        self.get_session.assert_called_with(MANIFEST_URL)
+        self.session.get.assert_not_called()
+
+    def test_missing_manifest_is_not_listed(self):
+        self.assertFalse(self._has_tag(404))
+
+        self.session.get.assert_not_called()
+
+    def test_unauthorised_head_falls_back_to_tags(self):
+        self.assertTrue(self._has_tag(401))
+        self.session.get.assert_called_once()
+
+        self.assertFalse(self._has_tag(401, tag="2.0"))
+
+    def test_failed_head_falls_back_to_tags(self):
+        for status in (403, 405, 500, None):
+            with self.subTest(status=status):
+                self.assertTrue(self._has_tag(status))
+
+    def test_fallback_raises_when_tags_cannot_be_listed(self):
+        self.session.get.return_value = mock.Mock(
+            status_code=401, json=lambda: {"errors": ["unauthorized"]})
+
+        with self.assertRaises(ArtifactoryAPI.RegistryAPIException):
+            self._has_tag(401)
+
+if __name__ == "__main__":
+    unittest.main()
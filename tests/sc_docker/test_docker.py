@@ -0,0 +1,101 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from pathlib import Path
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from sc.docker import docker as sc_docker
+from sc.docker.registry_cache import TAGS_TTL, RegistryCache
+
+REGISTRY = "ghcr.io/org"
+IMAGE = f"{REGISTRY}/rdk"
+
+class TestTagCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        config = {REGISTRY: {
+            "reg_type": "github", "credential_store": "config",
+            "username": "user", "api_key": "token"}}
+        patchers = [
+            mock.patch.object(sc_docker.docker, "from_env"),
+            mock.patch.object(sc_docker, "ConfigManager", **{
+                "return_value.get_config.return_value": config}),
+            mock.patch.object(sc_docker, "REGISTRY_WHITELIST", Path(self.tmp.name) / "none"),
+            mock.patch.object(sc_docker.RegistryAPIFactory, "get_registry_api"),
+            mock.patch.object(RegistryCache, "revalidate"),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.registry_api = sc_docker.RegistryAPIFactory.get_registry_api.return_value
+        self.registry_api.fetch_tags.return_value = ("1.0", "2.0")
+
+        self.docker = sc_docker.SCDocker()
+        self.docker.registry_cache = RegistryCache(Path(self.tmp.name))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _cache_tags(self, tags: tuple[str, ...], age: float = 0):
+        self.docker.registry_cache.set_tags(REGISTRY, "rdk", tags)
+        path = self.docker.registry_cache._tags_path(REGISTRY, "rdk")
+        path.write_text(json.dumps({"fetched": time.time() - age, "value": list(tags)}))
+
+    def _fetch_tags(self, **kwargs) -> tuple[str, ...]:
+        return self.docker._fetch_tags(IMAGE, False, REGISTRY, **kwargs)
+
+    def test_tags_are_fetched_and_cached(self):
+        self.assertEqual(self._fetch_tags(), ("1.0", "2.0"))
+        self.assertEqual(self.docker.registry_cache.get_tags(REGISTRY, "rdk").value, ("1.0", "2.0"))
+
+    def test_cached_tags_are_used(self):
+        self._cache_tags(("0.9",))
+
+        self.assertEqual(self._fetch_tags(), ("0.9",))
+        self.registry_api.fetch_tags.assert_not_called()
+        self.docker.registry_cache.revalidate.assert_not_called()
+
+    def test_stale_tags_are_used_and_revalidated(self):
+        self._cache_tags(("0.9",), age=TAGS_TTL + 1)
+
+        self.assertEqual(self._fetch_tags(), ("0.9",))
+        self.docker.registry_cache.revalidate.assert_called_once_with(REGISTRY, "rdk")
+
+    def test_cache_is_bypassed(self):
+        self._cache_tags(("0.9",))
+
+        self.assertEqual(self._fetch_tags(use_cache=False), ("1.0", "2.0"))
+
+        self.docker.refresh = True
+        self.registry_api.fetch_tags.return_value = ("3.0",)
+        self.assertEqual(self._fetch_tags(), ("3.0",))
+
+    def test_cached_tags_listing_a_missing_tag_are_fetched_again(self):
+        self._cache_tags(("0.9", "3.0"), age=TAGS_TTL + 1)
+        self.registry_api.has_tag.return_value = False
+
+        with mock.patch.object(self.docker, "_resolve_image_from_ref", return_value=IMAGE), \
+                mock.patch.object(self.docker, "_handle_invalid_tag",
+                                  side_effect=SystemExit(1)) as handle_invalid_tag, \
+                self.assertRaises(SystemExit):
+            self.docker.run("rdk", (), False, "3.0", False, ())
+
+        handle_invalid_tag.assert_called_once_with(IMAGE, "3.0", ("1.0", "2.0"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+import unittest
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from sc.docker.registry_apis.github import GithubAPI
+
+REGISTRY = "ghcr.io/org"
+URL = "https://api.github.com/orgs/org/packages?package_type=container&per_page=100"
+
+def _response(status_code: int, body=None, links: dict[str, str] | None = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode()
+    if links:
+        response.headers["Link"] = ", ".join(
+            f'<{url}>; rel="{rel}"' for rel, url in links.items())
+    return response
+
+def _page_url(page: int) -> str:
+    return f"{URL}&page={page}"
+
+def _page_of(url: str) -> int:
+    return int(parse_qs(urlsplit(url).query).get("page", ["1"])[0])
+
+class TestGetAllPages(unittest.TestCase):
+    def setUp(self):
+        self.api = GithubAPI()
+        self.requested = []
+        self.session = mock.Mock()
+        self.session.get.side_effect = self._get
+        patcher = mock.patch.object(GithubAPI, "_session", return_value=self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.pages = 3
+        self.links = "last"
+        self.on_page = None
+
+    def _get(self, url, headers=None, timeout=None):
+        page = _page_of(url)
+        self.requested.append(page)
+        if self.on_page:
+            self.on_page(page)
+        links = {}
+        if page < self.pages:
+            links["next"] = _page_url(page + 1)
+            if self.links == "last":
+                links["last"] = _page_url(self.pages)
+        return _response(200, [{"name": f"image-{page}-{i}"} for i in range(2)], links)
+
+    def test_single_page(self):
+        self.pages = 1
+
+        self.assertEqual(self.api._get_all_pages(REGISTRY, URL, {}), [
+            {"name": "image-1-0"}, {"name": "image-1-1"}])
+        self.assertEqual(self.requested, [1])
+
+    def test_pages_are_fetched_in_parallel_and_kept_in_order(self):
+        # Pages 2 and 3 each wait for the other to be requested, so fetching them
+        # one at a time breaks the barrier.
+        barrier = threading.Barrier(2, timeout=5)
+        self.on_page = lambda page: barrier.wait() if page > 1 else None
+
+        items = self.api._get_all_pages(REGISTRY, URL, {})
+
+        self.assertEqual([item["name"] for item in items], [
+            f"image-{page}-{i}" for page in range(1, 4) for i in range(2)])
+        self.assertEqual(sorted(self.requested), [1, 2, 3])
+
+    def test_next_links_are_followed_without_last_link(self):
+        self.links = "next"
+
+        items = self.api._get_all_pages(REGISTRY, URL, {})
+
+        self.assertEqual(len(items), 6)
+        self.assertEqual(self.requested, [1, 2, 3])
+
+    def test_failed_page_raises(self):
+        self.session.get.side_effect = lambda url, **kwargs: (
+            self._get(url) if _page_of(url) != 2 else _response(502, {"message": "bad gateway"}))
+
+        with self.assertRaises(GithubAPI.RegistryAPIException):
+            self.api._get_all_pages(REGISTRY, URL, {})
+
+    def test_fetch_images(self):
+        self.assertEqual(len(self.api.fetch_images(REGISTRY, "user", "token")), 6)
+        self.assertEqual(self.session.get.call_args.kwargs["timeout"], GithubAPI.timeout)
+
+class TestHasTag(unittest.TestCase):
+    def setUp(self):
+        self.api = GithubAPI()
+        self.session = mock.Mock()
+        self.session.get.side_effect = self._get
+        self.session.head.side_effect = lambda url, **kwargs: _response(self.head_status)
+        patcher = mock.patch.object(GithubAPI, "_session", return_value=self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.token_status = 200
+        self.head_status = 200
+        self.listed = False
+
+    def _get(self, url, params=None, auth=None, headers=None, timeout=None):
+        if url == "https://ghcr.io/token":
+            return _response(self.token_status, {"token": "registry-token"})
+        self.listed = True
+        return _response(200, [{"metadata": {"container": {"tags": ["0.9", "1.0"]}}}])
+
+    def test_existing_manifest(self):
+        self.assertTrue(self.api.has_tag(REGISTRY, "user", "token", "rdk", "1.0"))
+
+        url = self.session.head.call_args.args[0]
+        self.assertEqual(url, "https://ghcr.io/v2/org/rdk/manifests/1.0")
+        self.assertEqual(
+            self.session.head.call_args.kwargs["headers"]["Authorization"], "Bearer registry-token")
+        self.assertFalse(self.listed)
+
+    def test_missing_manifest_is_not_listed(self):
+        self.head_status = 404
+
+        self.assertFalse(self.api.has_tag(REGISTRY, "user", "token", "rdk", "1.0"))
+        self.assertFalse(self.listed)
+
+    def test_unauthorised_head_falls_back_to_tags(self):
+        self.head_status = 401
+
+        self.assertTrue(self.api.has_tag(REGISTRY, "user", "token", "rdk", "1.0"))
+        self.assertTrue(self.listed)
+        self.assertFalse(self.api.has_tag(REGISTRY, "user", "token", "rdk", "2.0"))
+
+    def test_no_registry_token_falls_back_to_tags(self):
+        self.token_status = 401
+
+        self.assertTrue(self.api.has_tag(REGISTRY, "user", "token", "rdk", "1.0"))
+        self.session.head.assert_not_called()
+        self.assertTrue(self.listed)
+
+class TestHasTagSessions(unittest.TestCase):
+    def setUp(self):
+        patchers = [
+            mock.patch.object(GithubAPI, "_sessions", {}),
+            mock.patch.object(requests.Session, "get", autospec=True,
+                              side_effect=self._get),
+            mock.patch.object(requests.Session, "head", autospec=True,
+                              return_value=_response(200)),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _get(session, url, params=None, **kwargs):
+        return _response(200, {"token": f"token-for-{params['scope']}"})
+
+    def test_images_share_a_session_per_host(self):
+        api = GithubAPI()
+
+        self.assertTrue(api.has_tag(REGISTRY, "user", "token", "rdk", "1.0"))
+        self.assertTrue(api.has_tag(REGISTRY, "user", "token", "sdk", "1.0"))
+
+        self.assertEqual(list(GithubAPI._sessions), ["ghcr.io"])
+        tokens = [call.kwargs["headers"]["Authorization"] for call in requests.Session.head.call_args_list]
+        self.assertEqual(tokens, [
+            "Bearer token-for-repository:org/rdk:pull",
+            "Bearer token-for-repository:org/sdk:pull",
+        ])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from sc.docker.image_index import ImageIndex
+
+IMAGES = [
+    "ghcr.io/org/rdk-core",
+    "ghcr.io/other/rdk-core",
+    "ghcr.io/org/core",
+    "ghcr.io/org/rdk-core-tools",
+    "artifactory.example.com/docker/org/rdk-sdk",
+    "ghcr.io/org/rdk-core",
+]
+
+class TestImageIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = ImageIndex(IMAGES)
+
+    def test_duplicates_are_dropped_in_order(self):
+        self.assertEqual(self.index.images, IMAGES[:-1])
+
+    def test_contains_full_names_only(self):
+        self.assertIn("ghcr.io/org/rdk-core", self.index)
+        self.assertNotIn("org/rdk-core", self.index)
+
+    def test_exact_match_wins(self):
+        index = ImageIndex(["ghcr.io/org/rdk-core", "mirror/ghcr.io/org/rdk-core"])
+        self.assertEqual(index.match("ghcr.io/org/rdk-core"), ["ghcr.io/org/rdk-core"])
+
+    def test_trailing_path_components(self):
+        self.assertEqual(self.index.match("org/rdk-core"), ["ghcr.io/org/rdk-core"])
+        self.assertEqual(
+            self.index.match("rdk-core"), ["ghcr.io/org/rdk-core", "ghcr.io/other/rdk-core"])
+
+    def test_path_components_win_over_name_endings(self):
+        # rdk-core also ends with core, but only the image named core is matched.
+        self.assertEqual(self.index.match("core"), ["ghcr.io/org/core"])
+
+    def test_end_of_name(self):
+        self.assertEqual(self.index.match("-sdk"), ["artifactory.example.com/docker/org/rdk-sdk"])
+        self.assertEqual(self.index.match("re-tools"), ["ghcr.io/org/rdk-core-tools"])
+
+    def test_start_of_name_sorted_by_name(self):
+        self.assertEqual(self.index.match("rdk-co"), [
+            "ghcr.io/org/rdk-core",
+            "ghcr.io/other/rdk-core",
+            "ghcr.io/org/rdk-core-tools",
+        ])
+        self.assertEqual(self.index.match("rdk-s"), ["artifactory.example.com/docker/org/rdk-sdk"])
+
+    def test_no_match(self):
+        self.assertEqual(self.index.match("missing"), [])
+        self.assertEqual(ImageIndex([]).match("rdk"), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest import mock
+
+from sc.docker.registry_apis import registry_api
+from sc.docker.registry_apis.registry_api import RegistryAPI
+
+class TestSession(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(RegistryAPI, "_sessions", {})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_session_is_shared_per_host(self):
+        session = RegistryAPI._session("https://ghcr.io/v2/org/rdk/manifests/1.0")
+
+        self.assertIs(RegistryAPI._session("https://ghcr.io/v2/org/sdk/manifests/2.0"), session)
+        self.assertIs(RegistryAPI._session("https://ghcr.io/token"), session)
+        self.assertIsNot(RegistryAPI._session("https://other.io/token"), session)
+        self.assertEqual(len(RegistryAPI._sessions), 2)
+
+    def test_session_holds_no_credentials(self):
+        session = RegistryAPI._session("https://ghcr.io")
+
+        self.assertIsNone(session.auth)
+        self.assertNotIn("Authorization", session.headers)
+
+    def test_session_retries_idempotent_requests(self):
+        session = RegistryAPI._session("https://ghcr.io")
+
+        for scheme in ("https://", "http://"):
+            adapter = session.get_adapter(f"{scheme}ghcr.io")
+            self.assertEqual(adapter._pool_maxsize, registry_api.POOL_SIZE)
+            retry = adapter.max_retries
+            self.assertEqual(retry.total, registry_api.MAX_RETRIES)
+            self.assertEqual(retry.allowed_methods, {"GET", "HEAD"})
+            self.assertTrue(set(registry_api.RETRY_STATUSES) <= set(retry.status_forcelist))
+            self.assertTrue(retry.respect_retry_after_header)
+            self.assertFalse(retry.raise_on_status)
+
+if __name__ == "__main__":
+    unittest.main()
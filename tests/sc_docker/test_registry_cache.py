@@ -0,0 +1,112 @@
+# Copyright 2025 RDK Management
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+from pathlib import Path
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from sc.docker import registry_cache
+from sc.docker.registry_cache import CATALOG_TTL, MAX_STALE, TAGS_TTL, RegistryCache
+
+REGISTRY = "https://ghcr.io"
+
+class TestRegistryCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = RegistryCache(Path(self.tmp.name))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _age(self, path: Path, seconds: float):
+        data = json.loads(path.read_text())
+        data["fetched"] = time.time() - seconds
+        path.write_text(json.dumps(data))
+
+    def test_missing_entries(self):
+        self.assertIsNone(self.cache.get_images(REGISTRY))
+        self.assertIsNone(self.cache.get_tags(REGISTRY, "org/rdk"))
+
+    def test_fresh_entries(self):
+        self.cache.set_images(REGISTRY, ("org/rdk", "org/sdk"))
+        self.cache.set_tags(REGISTRY, "org/rdk", ("latest", "1.0"))
+
+        images = self.cache.get_images(REGISTRY)
+        tags = self.cache.get_tags(REGISTRY, "org/rdk")
+
+        self.assertEqual(images.value, ("org/rdk", "org/sdk"))
+        self.assertEqual(images.ttl, CATALOG_TTL)
+        self.assertFalse(images.stale)
+        self.assertEqual(tags.value, ("latest", "1.0"))
+        self.assertEqual(tags.ttl, TAGS_TTL)
+        self.assertIsNone(self.cache.get_tags(REGISTRY, "org/sdk"))
+
+    def test_entries_past_ttl_are_stale_but_returned(self):
+        self.cache.set_tags(REGISTRY, "org/rdk", ("latest",))
+        self._age(self.cache._tags_path(REGISTRY, "org/rdk"), TAGS_TTL + 1)
+
+        tags = self.cache.get_tags(REGISTRY, "org/rdk")
+
+        self.assertTrue(tags.stale)
+        self.assertFalse(tags.expired)
+        self.assertEqual(tags.value, ("latest",))
+
+    def test_expired_entries_are_missing(self):
+        self.cache.set_images(REGISTRY, ("org/rdk",))
+        self._age(self.cache._catalog_path(REGISTRY), MAX_STALE + 1)
+
+        self.assertIsNone(self.cache.get_images(REGISTRY))
+
+    def test_unreadable_entries_are_missing(self):
+        self.cache.set_images(REGISTRY, ("org/rdk",))
+        self.cache._catalog_path(REGISTRY).write_text("{not json")
+
+        self.assertIsNone(self.cache.get_images(REGISTRY))
+
+    def test_registries_and_images_are_kept_apart(self):
+        self.cache.set_tags(REGISTRY, "org/rdk", ("1.0",))
+        self.cache.set_tags("https://other.io", "org/rdk", ("2.0",))
+        self.cache.set_tags(REGISTRY, "org_rdk", ("3.0",))
+
+        self.assertEqual(self.cache.get_tags(REGISTRY, "org/rdk").value, ("1.0",))
+        self.assertEqual(self.cache.get_tags("https://other.io", "org/rdk").value, ("2.0",))
+        self.assertEqual(self.cache.get_tags(REGISTRY, "org_rdk").value, ("3.0",))
+
+    @mock.patch.object(registry_cache.subprocess, "Popen")
+    def test_revalidate_starts_one_refresh_per_interval(self, popen):
+        self.cache.revalidate(REGISTRY, "org/rdk")
+        self.cache.revalidate(REGISTRY, "org/rdk")
+
+        popen.assert_called_once()
+        self.assertEqual(
+            popen.call_args.args[0][-4:], ["refresh-cache", REGISTRY, "--image", "org/rdk"])
+
+    @mock.patch.object(registry_cache.subprocess, "Popen")
+    def test_revalidate_again_after_interval(self, popen):
+        self.cache.revalidate(REGISTRY)
+        stamp = self.cache._catalog_path(REGISTRY).with_name("catalog.json.revalidating")
+        old = time.time() - registry_cache.REVALIDATE_INTERVAL - 1
+        os.utime(stamp, (old, old))
+
+        self.cache.revalidate(REGISTRY)
+
+        self.assertEqual(popen.call_count, 2)
+        self.assertEqual(popen.call_args.args[0][-2:], ["refresh-cache", REGISTRY])
+
+if __name__ == "__main__":
+    unittest.main()